@@ -45,14 +45,18 @@ def main():
     print("=" * 70)
     print()
     
+    # --refresh-urls ignores cached AI URL suggestions (may appear anywhere)
+    refresh_urls = '--refresh-urls' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--refresh-urls']
+    
     # Check for API key from command line argument
     api_key = None
-    if len(sys.argv) > 1:
-        if sys.argv[1] == '--api-key' and len(sys.argv) > 2:
-            api_key = sys.argv[2]
-        elif sys.argv[1].startswith('sk-'):
+    if args:
+        if args[0] == '--api-key' and len(args) > 1:
+            api_key = args[1]
+        elif args[0].startswith('sk-'):
             # Assume first arg is the API key
-            api_key = sys.argv[1]
+            api_key = args[0]
     
     # Check environment variable
     if not api_key:
@@ -66,6 +70,7 @@ def main():
         print("  1. Set environment variable: export OPENAI_API_KEY='your-key'")
         print("  2. Pass as argument: python download_with_ai.py 'your-key'")
         print("  3. Pass with flag: python download_with_ai.py --api-key 'your-key'")
+        print("  Add --refresh-urls to ask the AI for new URLs instead of cached ones.")
         print()
         
         # Only prompt if stdin is a TTY (interactive)
@@ -94,7 +99,7 @@ def main():
         print()
         
         # Run download
-        agent.download_with_ai_help()
+        agent.download_with_ai_help(refresh_urls=refresh_urls)
         
         # Check results
         print()
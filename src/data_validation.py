@@ -2,13 +2,57 @@
 Data validation and quality checks.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import copy
+import hashlib
 import logging
+import threading
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Results of validate_comprehensive keyed by DataFrame identity plus a digest
+# of its full contents (bounded LRU, guarded by a lock).
+# Each entry holds a weak reference to the DataFrame so a recycled id() is
+# never mistaken for a hit once the original frame has been garbage collected.
+_VALIDATION_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_VALIDATION_CACHE_MAX_SIZE = 128
+_VALIDATION_CACHE_LOCK = threading.Lock()
+
+
+def _validation_cache_key(df: pd.DataFrame, expected_columns: Optional[List[str]]) -> Optional[tuple]:
+    """
+    Cache key for validate_comprehensive, or None when the frame can't be hashed.
+    
+    The digest covers every row and the index, so any in-place edit changes
+    the key. Columns holding unhashable values (e.g. lists) are not cached.
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    return (id(df), df.shape, tuple(df.columns), tuple(expected_columns or ()), digest)
+
+# Valid US state codes
+_US_STATES: frozenset = frozenset({
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
+    'DC', 'PR', 'VI', 'AS', 'GU', 'MP'
+})
+
+# Sorted array form of _US_STATES for vectorized np.isin lookups
+_US_STATES_ARRAY = np.array(sorted(_US_STATES))
+
 
 @dataclass
 class ValidationResult:
@@ -32,14 +76,10 @@ class DataValidator:
     """Validates data quality and structure."""
     
     # Valid US state codes
-    US_STATES = {
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-        'DC', 'PR', 'VI', 'AS', 'GU', 'MP'
-    }
+    US_STATES = _US_STATES
+    
+    # Cap on invalid values kept in stats (bounds memory on pathological inputs)
+    MAX_FAILURE_SAMPLES = 50
     
     def validate_dataframe(
         self, 
@@ -117,7 +157,9 @@ class DataValidator:
                 result.add_error(
                     f"Found {len(invalid)} years outside valid range ({min_year}-{max_year})"
                 )
-                result.stats['invalid_years'] = invalid.unique().tolist()
+                unique_invalid = invalid.unique()
+                result.stats['invalid_years'] = unique_invalid[:self.MAX_FAILURE_SAMPLES].tolist()
+                result.stats['invalid_years_truncated'] = len(unique_invalid) > self.MAX_FAILURE_SAMPLES
             
             result.stats['year_range'] = {
                 'min': int(valid_years.min()),
@@ -141,29 +183,31 @@ class DataValidator:
             result.add_error(f"Column '{penalty_column}' not found")
             return result
         
-        penalty_col = df[penalty_column]
+        # Work on one float array; counts come from boolean masks that are only
+        # summed, never used to materialize filtered Series
+        penalties = df[penalty_column].to_numpy(dtype=np.float64, na_value=np.nan)
         
         # Check for negative values
-        negative = penalty_col[penalty_col < 0]
-        if len(negative) > 0:
-            result.add_warning(f"Found {len(negative)} negative penalty amounts")
+        negative_count = np.count_nonzero(penalties < 0)
+        if negative_count > 0:
+            result.add_warning(f"Found {negative_count} negative penalty amounts")
         
         # Check for values outside reasonable range
-        valid_penalties = penalty_col.dropna()
-        if len(valid_penalties) > 0:
-            outliers = valid_penalties[
-                (valid_penalties > max_value) | (valid_penalties < min_value)
-            ]
-            if len(outliers) > 0:
+        values = penalties[~np.isnan(penalties)]
+        if len(values) > 0:
+            outlier_count = np.count_nonzero((values > max_value) | (values < min_value))
+            if outlier_count > 0:
                 result.add_warning(
-                    f"Found {len(outliers)} penalty amounts outside typical range"
+                    f"Found {outlier_count} penalty amounts outside typical range"
                 )
             
+            # One partition pass for min/median/max plus one for the mean
+            min_value_seen, median_value, max_value_seen = np.quantile(values, [0.0, 0.5, 1.0])
             result.stats['penalty_stats'] = {
-                'min': float(valid_penalties.min()),
-                'max': float(valid_penalties.max()),
-                'mean': float(valid_penalties.mean()),
-                'median': float(valid_penalties.median())
+                'min': float(min_value_seen),
+                'max': float(max_value_seen),
+                'mean': float(values.mean()),
+                'median': float(median_value)
             }
         
         return result
@@ -181,16 +225,26 @@ class DataValidator:
             return result
         
         state_col = df[state_column]
-        unique_states = state_col.dropna().unique()
-        
-        invalid = [s for s in unique_states if str(s).upper() not in self.US_STATES]
+        unique_states = pd.unique(state_col.dropna().to_numpy())
+        
+        # Fast path: OSHA data is almost always uppercase already, so hash
+        # lookups against the frozenset settle most values without .upper()
+        valid_mask = pd.Index(unique_states).isin(_US_STATES)
+        if not valid_mask.all():
+            # Uppercase only the leftovers and check membership in C
+            rest = ~valid_mask
+            upper_rest = np.char.upper(unique_states[rest].astype(str))
+            valid_mask[rest] = np.isin(upper_rest, _US_STATES_ARRAY)
+        
+        invalid = unique_states[~valid_mask].tolist()
         if invalid:
             result.add_warning(
                 f"Found {len(invalid)} invalid state codes: {', '.join(map(str, invalid[:10]))}"
             )
-            result.stats['invalid_states'] = invalid
+            result.stats['invalid_states'] = invalid[:self.MAX_FAILURE_SAMPLES]
+            result.stats['invalid_states_truncated'] = len(invalid) > self.MAX_FAILURE_SAMPLES
         
-        result.stats['valid_states'] = [s for s in unique_states if str(s).upper() in self.US_STATES]
+        result.stats['valid_states'] = unique_states[valid_mask].tolist()
         
         return result
     
@@ -209,18 +263,24 @@ class DataValidator:
         
         name_col = df[name_column]
         
+        # Compute string lengths once and derive the empty/long checks from it
+        # (non-string columns can't hold empty or over-long names)
+        if name_col.dtype == 'object' or pd.api.types.is_string_dtype(name_col):
+            lengths = name_col.str.len()
+            empty_count = int((lengths == 0).sum())
+            long_count = int((lengths > max_length).sum())
+        else:
+            empty_count = long_count = 0
+        
         # Check for empty strings
-        empty = name_col[name_col == '']
-        if len(empty) > 0:
-            result.add_warning(f"Found {len(empty)} empty company names")
+        if empty_count > 0:
+            result.add_warning(f"Found {empty_count} empty company names")
         
         # Check for very long names
-        if name_col.dtype == 'object':
-            long_names = name_col[name_col.str.len() > max_length]
-            if len(long_names) > 0:
-                result.add_warning(
-                    f"Found {len(long_names)} company names longer than {max_length} characters"
-                )
+        if long_count > 0:
+            result.add_warning(
+                f"Found {long_count} company names longer than {max_length} characters"
+            )
         
         # Check for None/null
         null_count = name_col.isnull().sum()
@@ -234,7 +294,23 @@ class DataValidator:
         df: pd.DataFrame,
         expected_columns: Optional[List[str]] = None
     ) -> ValidationResult:
-        """Run comprehensive validation suite."""
+        """
+        Run comprehensive validation suite.
+        
+        Results are cached per DataFrame object and a hash of its contents,
+        so re-validating an unchanged frame with the same columns returns a
+        copy of the earlier result.
+        """
+        cache_key = _validation_cache_key(df, expected_columns)
+        with _VALIDATION_CACHE_LOCK:
+            cached = _VALIDATION_CACHE.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                df_ref, cached_result = cached
+                if df_ref() is df:
+                    _VALIDATION_CACHE.move_to_end(cache_key)
+                    return copy.deepcopy(cached_result)
+                del _VALIDATION_CACHE[cache_key]
+        
         result = ValidationResult(is_valid=True)
         
         # Basic structure validation
@@ -243,32 +319,45 @@ class DataValidator:
         result.warnings.extend(structure_result.warnings)
         result.stats.update(structure_result.stats)
         
-        # Column-specific validations if columns exist
+        # Column-specific validations if columns exist.
+        # Each check scans a different column, so they run concurrently; pandas
+        # releases the GIL inside its numeric/string kernels.
+        # Tasks are (stats_key, callable); stats_key None means stats aren't kept.
+        tasks = []
         if 'year' in df.columns:
-            year_result = self.validate_year_range(df, 'year')
-            result.errors.extend(year_result.errors)
-            result.warnings.extend(year_result.warnings)
-            result.stats['year_validation'] = year_result.stats
+            tasks.append(('year_validation', partial(self.validate_year_range, df, 'year')))
         
         if 'current_penalty' in df.columns or 'penalty' in df.columns:
             penalty_col = 'current_penalty' if 'current_penalty' in df.columns else 'penalty'
-            penalty_result = self.validate_penalty_amounts(df, penalty_col)
-            result.warnings.extend(penalty_result.warnings)
-            result.stats['penalty_validation'] = penalty_result.stats
+            tasks.append(('penalty_validation', partial(self.validate_penalty_amounts, df, penalty_col)))
         
         if 'site_state' in df.columns or 'state' in df.columns:
             state_col = 'site_state' if 'site_state' in df.columns else 'state'
-            state_result = self.validate_state_codes(df, state_col)
-            result.warnings.extend(state_result.warnings)
-            result.stats['state_validation'] = state_result.stats
+            tasks.append(('state_validation', partial(self.validate_state_codes, df, state_col)))
         
         if 'company_name' in df.columns or 'estab_name' in df.columns:
             name_col = 'company_name' if 'company_name' in df.columns else 'estab_name'
-            name_result = self.validate_company_names(df, name_col)
-            result.warnings.extend(name_result.warnings)
+            tasks.append((None, partial(self.validate_company_names, df, name_col)))
+        
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [(stats_key, executor.submit(fn)) for stats_key, fn in tasks]
+                # Collect in submission order so messages stay deterministic
+                for stats_key, future in futures:
+                    column_result = future.result()
+                    result.errors.extend(column_result.errors)
+                    result.warnings.extend(column_result.warnings)
+                    if stats_key is not None:
+                        result.stats[stats_key] = column_result.stats
         
         if result.errors:
             result.is_valid = False
         
+        if cache_key is not None:
+            with _VALIDATION_CACHE_LOCK:
+                _VALIDATION_CACHE[cache_key] = (weakref.ref(df), copy.deepcopy(result))
+                if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAX_SIZE:
+                    _VALIDATION_CACHE.popitem(last=False)
+        
         return result
 
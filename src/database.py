@@ -5,16 +5,22 @@ SQLAlchemy models for storing multi-agency compliance data.
 
 import sqlalchemy as sa
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from sqlalchemy import Index, create_engine
-from sqlalchemy.pool import QueuePool
+from sqlalchemy import Index, create_engine, event
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy.types import TypeDecorator, Date
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+import logging
 import os
+import time
 
 Base = declarative_base()
 
+logger = logging.getLogger(__name__)
+
 
 class SQLiteDate(TypeDecorator):
     """
@@ -124,7 +130,7 @@ class Inspection(Base):
     naics_code = sa.Column(sa.String(10), index=True)
     open_date = sa.Column(SQLiteDate, index=True)
     close_case_date = sa.Column(SQLiteDate)
-    year = sa.Column(sa.Integer, index=True)
+    year = sa.Column(sa.SmallInteger, index=True)
     inspection_type = sa.Column(sa.String(100))
     
     # Relationships - removed to avoid foreign key issues (violations link via activity_nr string, not FK)
@@ -170,7 +176,7 @@ class Violation(Base):
     
     # Date information
     violation_date = sa.Column(SQLiteDate, index=True)
-    year = sa.Column(sa.Integer, index=True)
+    year = sa.Column(sa.SmallInteger, index=True)
     
     # Generic fields for other agencies
     facility_id = sa.Column(sa.String(100))  # EPA/MSHA facility/mine ID
@@ -191,6 +197,25 @@ class Violation(Base):
     )
 
 
+def _pg_trgm_installed(ddl, target, bind, **kw) -> bool:
+    """DDL condition: the database is PostgreSQL with the pg_trgm extension installed."""
+    if bind is None or bind.dialect.name != 'postgresql':
+        return False
+    return bind.exec_driver_sql("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'").first() is not None
+
+
+# Trigram GIN indexes for the unanchored company-name searches in
+# query_violations (LIKE '%name%' on both name columns); B-tree indexes
+# can't serve those, so without these every search is a sequential scan.
+# PostgreSQL only: skipped on other databases or when pg_trgm is missing.
+Index('idx_violation_company_normalized_trgm', Violation.company_name_normalized,
+      postgresql_using='gin',
+      postgresql_ops={'company_name_normalized': 'gin_trgm_ops'}).ddl_if(callable_=_pg_trgm_installed)
+Index('idx_violation_company_lower_trgm', sa.func.lower(Violation.company_name).label('company_name_lower'),
+      postgresql_using='gin',
+      postgresql_ops={'company_name_lower': 'gin_trgm_ops'}).ddl_if(callable_=_pg_trgm_installed)
+
+
 class Accident(Base):
     """Accident records (currently OSHA-specific)."""
     __tablename__ = 'accidents'
@@ -202,12 +227,31 @@ class Accident(Base):
     site_state = sa.Column(sa.String(2), index=True)
     naics_code = sa.Column(sa.String(10), index=True)
     accident_date = sa.Column(SQLiteDate, index=True)
-    year = sa.Column(sa.Integer, index=True)
+    year = sa.Column(sa.SmallInteger, index=True)
     description = sa.Column(sa.Text)
     fatality = sa.Column(sa.Boolean)
     injury_type = sa.Column(sa.String(100))
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Apply per-connection SQLite cache settings when a connection is opened.
+    
+    Journal and sync modes are left to _optimize_sqlite_for_bulk_load in
+    db_loader, which switches the shared connection to WAL for bulk loads.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache (default is 2 MB)
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+# Index rebuild tuning after bulk loads (see DatabaseManager._create_indexes)
+INDEX_BUILD_SQLITE_CACHE_SIZE = -1048576  # Negative = KiB, i.e. 1 GiB page cache
+INDEX_BUILD_MAINTENANCE_WORK_MEM = '512MB'  # Per PostgreSQL backend
+INDEX_BUILD_WORKERS = 4  # Concurrent PostgreSQL index builds
+
+
 class DatabaseManager:
     """Manager for database connections and operations."""
     
@@ -233,39 +277,64 @@ class DatabaseManager:
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         
-        # Connection pool configuration
-        pool_args = {
-            "pool_pre_ping": True,  # Verify connections before using
-            "pool_recycle": 3600,   # Recycle connections after 1 hour
-        }
-        
         # SQLite-specific handling
         if "sqlite" in database_url:
-            pool_args["connect_args"] = {"check_same_thread": False}
             # SQLite uses QueuePool (connection pooling still helps with connection reuse)
             self.engine = create_engine(
                 database_url,
                 echo=False,
                 poolclass=QueuePool,
-                **pool_args
+                pool_pre_ping=True,  # Verify connections before using
+                pool_recycle=3600,   # Recycle connections after 1 hour
+                connect_args={"check_same_thread": False}
             )
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+            # Bulk loads run on one writer, so they share a single connection
+            # via StaticPool and skip checkout/checkin and pre-ping round trips.
+            # Kept off self.engine: sessions on other threads would otherwise
+            # share (and commit or roll back) each other's transactions.
+            self.bulk_engine = create_engine(
+                database_url,
+                echo=False,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False}
+            )
+            event.listen(self.bulk_engine, "connect", _set_sqlite_pragmas)
         else:
             # PostgreSQL/other databases support connection pooling
-            pool_args.update({
-                "pool_size": pool_size,
-                "max_overflow": max_overflow,
-            })
+            engine_args = {}
+            if sa.engine.make_url(database_url).get_driver_name() == "psycopg2":
+                # Batch Core executemany() into multi-row statements
+                engine_args["executemany_mode"] = "values_plus_batch"
             self.engine = create_engine(
                 database_url,
                 echo=False,
-                **pool_args
+                pool_pre_ping=True,  # Verify connections before using
+                pool_recycle=3600,   # Recycle connections after 1 hour
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                **engine_args
             )
+            self.bulk_engine = self.engine
         
         self.SessionLocal = sessionmaker(bind=self.engine)
         Base.metadata.bind = self.engine
+        self._tables_created = False
+        self._bulk_load_tables = set()  # Tables whose indexes are currently dropped
     
     def create_tables(self):
-        """Create all database tables including summary tables."""
+        """
+        Create all database tables including summary tables.
+        
+        Skips the DDL round trips when this manager has already created the
+        tables and they still exist.
+        """
+        if self._tables_created and self._core_tables_exist():
+            return
+        
+        if self.engine.dialect.name == "postgresql":
+            self._create_postgresql_extensions()
+        
         Base.metadata.create_all(self.engine)
         
         # Also create summary tables if the module is available
@@ -275,18 +344,165 @@ class DatabaseManager:
             summary_manager.create_tables()
         except ImportError:
             pass  # Summary tables are optional
+        
+        self._tables_created = True
+    
+    def _create_postgresql_extensions(self):
+        """
+        Install pg_trgm, used by the trigram indexes on violation company names.
+        
+        Requires CREATE privilege on the database; without it the trigram
+        indexes are skipped and company-name searches fall back to scans.
+        """
+        try:
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except Exception as e:
+            logger.warning(f"Could not install pg_trgm extension: {e}")
+    
+    def _core_tables_exist(self) -> bool:
+        """Check that the core data tables exist (single reflection query)."""
+        existing = set(sa.inspect(self.engine).get_table_names())
+        return {"inspections", "violations", "accidents"} <= existing
+    
+    @contextmanager
+    def bulk_load_mode(self, models) -> Iterator[None]:
+        """
+        Drop the non-unique indexes of the given models for a bulk load.
+        
+        Maintaining every index per inserted row multiplies write cost, so
+        indexes are dropped on entry and rebuilt once on exit (also on error).
+        Unique indexes stay in place since they enforce keys during the load.
+        Tables already inside an outer bulk_load_mode block are left to it.
+        
+        Args:
+            models: ORM model classes about to be bulk loaded
+        """
+        tables = [m.__table__ for m in models if m.__table__.name not in self._bulk_load_tables]
+        indexes = [idx for table in tables for idx in table.indexes if not idx.unique]
+        self._bulk_load_tables.update(table.name for table in tables)
+        
+        try:
+            if indexes:
+                logger.info(f"Dropping {len(indexes)} indexes on {', '.join(t.name for t in tables)} for faster inserts...")
+                with self.bulk_engine.begin() as conn:
+                    for idx in indexes:
+                        idx.drop(conn, checkfirst=True)
+            yield
+        finally:
+            self._bulk_load_tables.difference_update(table.name for table in tables)
+            if indexes:
+                logger.info(f"Creating {len(indexes)} indexes (this may take a few minutes)...")
+                start_time = time.time()
+                self._create_indexes(indexes)
+                elapsed = time.time() - start_time
+                logger.info(f"Indexes created in {elapsed/60:.1f} minutes")
+    
+    def _create_indexes(self, indexes: List[Index]):
+        """
+        Build indexes after a bulk load, tuned per dialect.
+        
+        SQLite builds each index single-threaded on the bulk-load connection, so
+        the page cache is enlarged and sorts are kept in memory for the
+        duration of the build. PostgreSQL builds indexes in parallel, one
+        backend per index, with a larger per-session maintenance_work_mem.
+        A failing index is logged and skipped.
+        """
+        def create(idx: Index, conn):
+            try:
+                idx.create(conn, checkfirst=True)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.warning(f"Could not create index {idx.name}: {e}")
+        
+        dialect = self.engine.dialect.name
+        if dialect == "sqlite":
+            with self.bulk_engine.connect() as conn:
+                previous = {
+                    pragma: conn.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+                    for pragma in ("cache_size", "temp_store")
+                }
+                conn.exec_driver_sql(f"PRAGMA cache_size={INDEX_BUILD_SQLITE_CACHE_SIZE}")
+                conn.exec_driver_sql("PRAGMA temp_store=MEMORY")
+                try:
+                    for idx in indexes:
+                        create(idx, conn)
+                finally:
+                    for pragma, value in previous.items():
+                        conn.exec_driver_sql(f"PRAGMA {pragma}={value}")
+        elif dialect == "postgresql":
+            def create_on_own_backend(idx: Index):
+                with self.engine.connect() as conn:
+                    conn.exec_driver_sql(f"SET LOCAL maintenance_work_mem = '{INDEX_BUILD_MAINTENANCE_WORK_MEM}'")
+                    create(idx, conn)
+            
+            workers = min(len(indexes), INDEX_BUILD_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(create_on_own_backend, indexes))
+        else:
+            for idx in indexes:
+                with self.engine.connect() as conn:
+                    create(idx, conn)
+    
+    def bulk_insert(self, model, rows: List[dict], chunk_size: int = 5000, connection=None) -> int:
+        """
+        Insert plain dict rows through SQLAlchemy Core, bypassing the ORM.
+        
+        Each chunk is a single executemany() call (batched multi-row INSERTs
+        on PostgreSQL with psycopg2).
+        
+        Args:
+            model: ORM model class whose table receives the rows
+            rows: List of column-name -> value dicts
+            chunk_size: Rows per executemany() call (default: 5000)
+            connection: Connection whose transaction the insert joins (e.g.
+                        session.connection()); None = own transaction
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        table = model.__table__
+        if connection is None:
+            with self.engine.begin() as conn:
+                return self.bulk_insert(model, rows, chunk_size, connection=conn)
+        
+        for i in range(0, len(rows), chunk_size):
+            connection.execute(table.insert(), rows[i:i + chunk_size])
+        return len(rows)
     
     def drop_tables(self):
         """Drop all database tables (use with caution!)."""
         Base.metadata.drop_all(self.engine)
+        self._tables_created = False
     
     def get_session(self) -> Session:
         """Get a database session."""
         return self.SessionLocal()
     
+    @contextmanager
+    def bulk_session(self) -> Iterator[Session]:
+        """
+        Session for bulk-load work, bound to bulk_engine.
+        
+        Only disables autoflush and expire-on-commit. The loaders use it for
+        their existence checks and deletes; the rows themselves are inserted
+        through bulk_engine directly (see bulk_insert_session in db_loader).
+        """
+        session = self.SessionLocal(bind=self.bulk_engine, autoflush=False, expire_on_commit=False)
+        try:
+            yield session
+        finally:
+            session.close()
+    
     def close(self):
         """Close database connections."""
         self.engine.dispose()
+        if self.bulk_engine is not self.engine:
+            self.bulk_engine.dispose()
     
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists."""
@@ -6,32 +6,74 @@ Optimized with streaming chunked loading for large datasets.
 This module provides:
 - Streaming chunked loading for memory efficiency
 - Native bulk import methods (SQLite executemany, PostgreSQL COPY)
-- Parallel processing for inspections
+- Parallel processing for inspections and accidents
 - Multi-format support (OSHA standard, OSHA fatality reports, MSHA)
 - Selective table reloading
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text as sa_text
+from sqlalchemy import String as sa_String
+from sqlalchemy import type_coerce as sa_type_coerce
+from sqlalchemy import Integer as sa_Integer
+from sqlalchemy import SmallInteger as sa_SmallInteger
+from sqlalchemy import Float as sa_Float
+from sqlalchemy import Boolean as sa_Boolean
 import logging
 import re
 import time
 import csv
+import io
+import mmap
+import os
 import subprocess
 import tempfile
 import multiprocessing as mp
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 
-from .database import DatabaseManager, Inspection, Violation, Accident, get_db_manager
+from .database import DatabaseManager, Inspection, Violation, Accident, SQLiteDate, get_db_manager
 from .data_loader import load_inspections as load_csv_inspections
 from .data_loader import load_violations as load_csv_violations
 from .data_loader import load_accidents as load_csv_accidents
 from .data_loader import DATA_DIR
 from .agency_base import AgencyDataLoader
 
+try:
+    from pgcopy import CopyManager
+    PGCOPY_AVAILABLE = True
+except ImportError:
+    PGCOPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite
+    ADBC_SQLITE_AVAILABLE = True
+except ImportError:
+    ADBC_SQLITE_AVAILABLE = False
+
+try:
+    import adbc_driver_postgresql.dbapi as adbc_postgresql
+    ADBC_POSTGRESQL_AVAILABLE = True
+except ImportError:
+    ADBC_POSTGRESQL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +81,23 @@ logger = logging.getLogger(__name__)
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Company suffixes stripped during normalization, in strip order (each is
+# applied as a regex anchored at the end of the name)
+_COMPANY_SUFFIXES = (
+    " INC", " LLC", " CORP", " CORPORATION", " LP", " LTD", 
+    " COMPANY", " CO", " L.L.C.", " INC.", " CORP.", " CO.",
+    " PLC", " PLLC", " LLP", " PA", " PC", " P.C.",
+    " LLC.", " INCORPORATED", " LIMITED", " ASSOCIATES",
+    " ASSOCIATION", " GROUP", " HOLDINGS", " HOLDING"
+)
+
+# Matches names ending in any of _COMPANY_SUFFIXES
+_COMPANY_SUFFIXES_PATTERN = re.compile('(?:' + '|'.join(_COMPANY_SUFFIXES) + ')$')
+
+# Whole-token match for words dropped during normalization. Input is already
+# single-space separated at this point, so tokens are delimited by ' ' or ends.
+_COMMON_WORDS_PATTERN = re.compile(r'(?:^| )(?:THE|A|AN)(?= |$)')
+
 
 def _normalize_company_name_vectorized(series: pd.Series) -> pd.Series:
     """
@@ -57,17 +116,14 @@ def _normalize_company_name_vectorized(series: pd.Series) -> pd.Series:
     # Convert to string and uppercase
     normalized = series[mask].astype(str).str.upper().str.strip()
     
-    # Remove common suffixes (vectorized)
-    suffixes = [
-        " INC", " LLC", " CORP", " CORPORATION", " LP", " LTD", 
-        " COMPANY", " CO", " L.L.C.", " INC.", " CORP.", " CO.",
-        " PLC", " PLLC", " LLP", " PA", " PC", " P.C.",
-        " LLC.", " INCORPORATED", " LIMITED", " ASSOCIATES",
-        " ASSOCIATION", " GROUP", " HOLDINGS", " HOLDING"
-    ]
-    
-    for suffix in suffixes:
-        normalized = normalized.str.replace(suffix + "$", "", regex=True).str.strip()
+    # Remove common suffixes (vectorized). They are stripped in list order,
+    # so only names that end in one of them go through the per-suffix passes.
+    has_suffix = normalized.str.contains(_COMPANY_SUFFIXES_PATTERN, regex=True)
+    if has_suffix.any():
+        with_suffix = normalized[has_suffix]
+        for suffix in _COMPANY_SUFFIXES:
+            with_suffix = with_suffix.str.replace(suffix + "$", "", regex=True).str.strip()
+        normalized[has_suffix] = with_suffix
     
     # Remove punctuation and special characters
     normalized = normalized.str.replace(r'[^\w\s]', ' ', regex=True)
@@ -75,21 +131,199 @@ def _normalize_company_name_vectorized(series: pd.Series) -> pd.Series:
     # Normalize whitespace
     normalized = normalized.str.replace(r'\s+', ' ', regex=True).str.strip()
     
-    # Remove common words
-    def remove_common_words(name):
-        if pd.isna(name) or not name:
-            return ""
-        words = name.split()
-        common_words = {"THE", "A", "AN"}
-        words = [w for w in words if w not in common_words]
-        return " ".join(words)
-    
-    normalized = normalized.apply(remove_common_words)
+    # Remove common words (whole tokens only) in a single vectorized pass
+    normalized = normalized.str.replace(_COMMON_WORDS_PATTERN, '', regex=True).str.strip()
     
     result[mask] = normalized
     return result.fillna("")
 
 
+_company_name_matcher = None
+
+
+def _get_company_name_matcher():
+    """Shared CompanyNameMatcher for query-time name normalization (created on first use)."""
+    global _company_name_matcher
+    if _company_name_matcher is None:
+        from .fuzzy_matcher import CompanyNameMatcher
+        _company_name_matcher = CompanyNameMatcher()
+    return _company_name_matcher
+
+
+def _contains_ignore_case(series: pd.Series, substring: str) -> pd.Series:
+    """
+    Case-insensitive literal substring test; missing values are False.
+    
+    Uses Arrow's match_substring kernel over the UTF-8 buffers when pyarrow
+    is available instead of pandas' per-element regex search.
+    """
+    if not PYARROW_AVAILABLE:
+        return series.astype(str).str.contains(substring, case=False, na=False, regex=False)
+    
+    values = pa.array(series.astype('string'), type=pa.string(), from_pandas=True)
+    matches = pc.fill_null(pc.match_substring(values, substring, ignore_case=True), False)
+    return pd.Series(matches.to_numpy(zero_copy_only=False), index=series.index)
+
+
+def _equals_ignore_case(series: pd.Series, value: str) -> pd.Series:
+    """
+    Case-insensitive equality with ``value``; missing values are False.
+    
+    Uses Arrow's utf8_lower and equal kernels when pyarrow is available
+    instead of casting to str and upper-casing element by element.
+    """
+    if not PYARROW_AVAILABLE:
+        return series.astype(str).str.upper() == value.upper()
+    
+    values = pa.array(series.astype('string'), type=pa.string(), from_pandas=True)
+    matches = pc.fill_null(pc.equal(pc.utf8_lower(values), value.lower()), False)
+    return pd.Series(matches.to_numpy(zero_copy_only=False), index=series.index)
+
+
+def _truncate_text(series: pd.Series, length: int) -> pd.Series:
+    """
+    Convert a column to text truncated to ``length`` characters; missing stays missing.
+    
+    With pyarrow the column is converted to an Arrow string array once and
+    truncated by the utf8_slice_codeunits kernel over its UTF-8 buffer,
+    instead of slicing element by element through pandas' str accessor.
+    """
+    if not PYARROW_AVAILABLE:
+        return series.astype(str).str[:length].where(series.notna(), None)
+    
+    values = series if isinstance(series.dtype, pd.StringDtype) else series.astype('string')
+    truncated = pc.utf8_slice_codeunits(pa.array(values, type=pa.string(), from_pandas=True), 0, length)
+    return truncated.to_pandas().set_axis(series.index)
+
+
+def _join_text(left: pd.Series, right: pd.Series, separator: str) -> pd.Series:
+    """
+    Join two text columns element-wise with ``separator``, skipping missing sides.
+    
+    Missing and empty values are skipped, so the separator only appears
+    when both sides have text; rows where neither does are missing. With
+    pyarrow this runs as Arrow kernels (binary_join_element_wise, then
+    coalesce for rows with one side missing).
+    """
+    if PYARROW_AVAILABLE:
+        def text_or_null(series):
+            values = pa.array(series.astype('string'), type=pa.string(), from_pandas=True)
+            return pc.if_else(pc.equal(values, ''), pa.scalar(None, pa.string()), values)
+        
+        left_values, right_values = text_or_null(left), text_or_null(right)
+        # null_handling='skip' would do this in one call, but drops trailing
+        # all-null rows in some pyarrow releases
+        joined = pc.binary_join_element_wise(left_values, right_values, pa.scalar(separator),
+                                             null_handling='emit_null')
+        return pc.coalesce(joined, left_values, right_values).to_pandas().set_axis(left.index)
+    
+    left = left.astype('string').replace('', pd.NA)
+    right = right.astype('string').replace('', pd.NA)
+    return (left + separator + right).fillna(left).fillna(right)
+
+
+def _all_missing(values) -> bool:
+    """Whether a processed column (Series, or a scalar None to broadcast) holds no values."""
+    return values is None or bool(values.isna().all())
+
+
+def _empty_strings_to_none(columns: dict) -> dict:
+    """
+    Replace '' with None in the text columns of a processed-column dict.
+    
+    Only object and string dtype Series are touched, so numeric, datetime
+    and boolean columns are not scanned (unlike DataFrame.replace).
+    """
+    for name, values in columns.items():
+        if isinstance(values, pd.Series) and (values.dtype == object or isinstance(values.dtype, pd.StringDtype)):
+            empty = values.eq('')
+            if empty.any():
+                columns[name] = values.where(~empty, None)
+    return columns
+
+
+# Non-ISO date layouts seen in agency extracts (e.g. MSHA's MM/DD/YYYY),
+# recognized from a sample value so they can be parsed with an explicit format
+_KNOWN_DATE_FORMATS = [
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), '%m/%d/%Y'),
+]
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings, coercing unparseable values to NaT.
+    
+    OSHA extracts use ISO 'YYYY-MM-DD' dates, so the column is parsed with
+    pandas' C ISO 8601 parser (cached per unique value). Values it rejects
+    are parsed with an explicit format when the first of them matches one
+    of _KNOWN_DATE_FORMATS; only what is left after that goes through
+    format inference, which falls back to dateutil one element at a time.
+    """
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce', cache=True)
+    unparsed = parsed.isna() & values.notna() & (values.astype(str).str.strip() != '')
+    if unparsed.any():
+        sample = str(values[unparsed].iloc[0]).strip()
+        date_format = next((fmt for pattern, fmt in _KNOWN_DATE_FORMATS if pattern.fullmatch(sample)), None)
+        if date_format is not None:
+            parsed[unparsed] = pd.to_datetime(values[unparsed], format=date_format, errors='coerce', cache=True)
+            unparsed &= parsed.isna()
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(values[unparsed], errors='coerce')
+    return parsed
+
+
+# Rows fetched per round trip when reading query results
+QUERY_FETCH_CHUNK_ROWS = 50000
+
+
+def _read_query_with_bulk_dates(query, session: Session, model) -> pd.DataFrame:
+    """
+    Read an ORM query into a DataFrame, parsing SQLite dates in bulk.
+    
+    Results are fetched in chunks of QUERY_FETCH_CHUNK_ROWS rows with
+    stream_results enabled (a server-side cursor on PostgreSQL), so the
+    driver never buffers the whole result set alongside the DataFrame.
+    
+    SQLiteDate columns are selected as plain strings so SQLAlchemy skips the
+    per-row process_result_value() call; the strings are then parsed in one
+    vectorized pd.to_datetime pass per chunk. Values match the ORM path
+    (date objects, None for missing/unparseable dates).
+    """
+    conn = session.connection().execution_options(stream_results=True)
+    if session.bind.dialect.name != 'sqlite':
+        chunks = pd.read_sql(query.statement, conn, chunksize=QUERY_FETCH_CHUNK_ROWS)
+        return _concat_query_chunks(chunks)
+    
+    date_columns = [c.key for c in model.__table__.columns if isinstance(c.type, SQLiteDate)]
+    columns = [
+        sa_type_coerce(c, sa_String).label(c.key) if c.key in date_columns else c
+        for c in model.__table__.columns
+    ]
+    
+    def parse_dates(df):
+        for col in date_columns:
+            parsed = pd.to_datetime(df[col], format='ISO8601', errors='coerce', cache=True)
+            df[col] = parsed.dt.date.astype(object).where(parsed.notna(), None)
+        return df
+    
+    chunks = pd.read_sql(query.with_entities(*columns).statement, conn, chunksize=QUERY_FETCH_CHUNK_ROWS)
+    return _concat_query_chunks(parse_dates(chunk) for chunk in chunks)
+
+
+def _concat_query_chunks(chunks) -> pd.DataFrame:
+    """
+    Concatenate chunked query results into one DataFrame.
+    
+    A chunk whose values in a column are all NULL reads that column as
+    object, so column types are re-inferred when there is more than one
+    chunk; the result matches a single unchunked read.
+    """
+    chunks = list(chunks)
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True).infer_objects()
+
+
 # ============================================================================
 # DATABASE OPTIMIZATION FUNCTIONS
 # ============================================================================
@@ -100,12 +334,19 @@ def _optimize_sqlite_for_bulk_load(engine):
         with engine.connect() as conn:
             # Disable synchronous writes (faster, but less safe - acceptable for bulk loads)
             conn.execute(sa_text("PRAGMA synchronous = OFF"))
-            # Increase cache size (default is 2MB, use 64MB)
-            conn.execute(sa_text("PRAGMA cache_size = -64000"))
+            # Increase cache size (default is 2MB, use 256MB)
+            conn.execute(sa_text("PRAGMA cache_size = -262144"))
             # Use WAL mode for better concurrency
             conn.execute(sa_text("PRAGMA journal_mode = WAL"))
             # Increase page size for better performance
             conn.execute(sa_text("PRAGMA page_size = 4096"))
+            # Memory-map up to 256MB of the database file so scan-heavy reads
+            # bypass pread() copies (trades address space for read bandwidth)
+            conn.execute(sa_text("PRAGMA mmap_size = 268435456"))
+            # Keep temp tables and sort spill (e.g. index builds) in memory
+            conn.execute(sa_text("PRAGMA temp_store = MEMORY"))
+            # Allow SQLite to use helper threads for large sorts
+            conn.execute(sa_text("PRAGMA threads = 4"))
             conn.commit()
             logger.info("SQLite optimized for bulk loading")
 
@@ -114,6 +355,27 @@ def _optimize_sqlite_for_bulk_load(engine):
 # BULK INSERT FUNCTIONS
 # ============================================================================
 
+# Rows per DataFrame slice handed to pandas to_sql in the fallback path
+TO_SQL_SLICE_ROWS = 1000
+
+
+def _max_bind_parameters(conn) -> int:
+    """
+    Maximum number of bound parameters in one statement on this connection.
+    
+    SQLite reports its compile-time SQLITE_MAX_VARIABLE_NUMBER (999 before
+    3.32, 32766 after); PostgreSQL's wire protocol allows 65535.
+    """
+    if conn.dialect.name == "sqlite":
+        driver_conn = conn.connection.driver_connection
+        if hasattr(driver_conn, "getlimit"):  # Python 3.11+
+            return driver_conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        return 999
+    if conn.dialect.name == "postgresql":
+        return 65535
+    return 999
+
+
 def _bulk_insert_dataframe(engine, table_name: str, df: pd.DataFrame, use_native: bool = True):
     """
     Bulk insert DataFrame using native bulk import methods when available.
@@ -130,6 +392,23 @@ def _bulk_insert_dataframe(engine, table_name: str, df: pd.DataFrame, use_native
     
     database_url = str(engine.url)
     
+    # PostgreSQL tables whose key may repeat across chunks: COPY into a
+    # staging table, then insert only the rows with new keys
+    if use_native and table_name in _CONFLICT_KEY_COLUMNS and engine.dialect.name == "postgresql":
+        try:
+            _bulk_insert_postgresql_copy_staged(engine, table_name, df, _CONFLICT_KEY_COLUMNS[table_name])
+            return
+        except Exception as e:
+            logger.warning(f"PostgreSQL staged COPY failed, falling back to direct bulk insert: {e}")
+    
+    # Try ADBC ingest first (Arrow columns bound in C, no per-row Python)
+    if use_native and table_name in _STATIC_SCHEMA_TABLES and _adbc_available(engine):
+        try:
+            _bulk_insert_adbc(engine, table_name, df)
+            return
+        except Exception as e:
+            logger.warning(f"ADBC ingest failed, falling back to native bulk insert: {e}")
+    
     # Try native bulk import for SQLite
     if use_native and "sqlite" in database_url:
         try:
@@ -140,21 +419,127 @@ def _bulk_insert_dataframe(engine, table_name: str, df: pd.DataFrame, use_native
     
     # Try native bulk import for PostgreSQL
     if use_native and ("postgresql" in database_url or "postgres" in database_url):
+        # Binary COPY when the table schema is known; text CSV COPY otherwise
+        if PGCOPY_AVAILABLE and table_name in _STATIC_SCHEMA_TABLES:
+            try:
+                _bulk_insert_postgresql_binary_copy(engine, table_name, df)
+                return
+            except Exception as e:
+                logger.warning(f"PostgreSQL binary COPY failed, falling back to CSV COPY: {e}")
+        
         try:
-            _bulk_insert_postgresql_copy(engine, table_name, df)
+            if len(df) >= PARALLEL_COPY_MIN_ROWS:
+                _bulk_insert_postgresql_copy_parallel(engine, table_name, df)
+            else:
+                _bulk_insert_postgresql_copy(engine, table_name, df)
             return
+        except _PartialCopyError as e:
+            logger.warning(f"Parallel PostgreSQL COPY partially committed, falling back to pandas for "
+                           f"the remaining {len(e.remaining)} rows: {e.__cause__}")
+            df = e.remaining
         except Exception as e:
             logger.warning(f"Native PostgreSQL bulk insert failed, falling back to pandas: {e}")
     
-    # Fallback to pandas to_sql
-    df.to_sql(
-        table_name,
-        engine,
-        if_exists='append',
-        index=False,
-        method='multi',
-        chunksize=100  # Safe for SQLite variable limit
-    )
+    # Fallback to pandas to_sql, one row slice at a time so only the current
+    # slice is materialized as parameter tuples (all in one transaction)
+    with engine.begin() as conn:
+        # Rows per multi-row INSERT, sized to the bound-parameter limit
+        rows_per_statement = max(1, min(_max_bind_parameters(conn) // len(df.columns), TO_SQL_SLICE_ROWS))
+        for start in range(0, len(df), TO_SQL_SLICE_ROWS):
+            df.iloc[start:start + TO_SQL_SLICE_ROWS].to_sql(
+                table_name,
+                conn,
+                if_exists='append',
+                index=False,
+                method='multi',
+                chunksize=rows_per_statement
+            )
+
+
+_SQL_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
+def _format_sql_timestamps(series: pd.Series) -> np.ndarray:
+    """
+    Format a datetime64 Series as '%Y-%m-%d %H:%M:%S.%f' strings (object array).
+    
+    Timezone-naive values go through NumPy's vectorized datetime_as_string;
+    its ISO 'T' separator is overwritten in place. Entries for missing values
+    are meaningless and must be masked by the caller.
+    """
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return series.dt.strftime(_SQL_TIMESTAMP_FORMAT).to_numpy(dtype=object)
+    
+    timestamps = series.to_numpy(dtype='datetime64[us]')
+    strings = np.datetime_as_string(timestamps, unit='us')
+    if not len(strings):
+        return strings.astype(object)
+    
+    # 'YYYY-MM-DDTHH:MM:SS.ffffff': character 10 is the 'T' for 4-digit years
+    separator = strings.view(np.uint32).reshape(len(strings), -1)[:, 10]
+    if not ((separator == ord('T')) | np.isnat(timestamps)).all():
+        return series.dt.strftime(_SQL_TIMESTAMP_FORMAT).to_numpy(dtype=object)
+    separator[:] = ord(' ')
+    return strings.astype(object)
+
+
+def _none_where_missing(values: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    """Replace the masked entries of an object array with None in one NumPy pass."""
+    return np.where(missing, None, values) if missing.any() else values
+
+
+def _is_arrow_string(dtype) -> bool:
+    """Whether a pandas dtype stores strings in a pyarrow array."""
+    if not PYARROW_AVAILABLE:
+        return False
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == 'pyarrow'
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    return False
+
+
+def _dataframe_to_rows(df: pd.DataFrame, date_columns: Optional[frozenset] = None) -> list:
+    """
+    Convert a DataFrame into a list of DB-API parameter tuples.
+    
+    Conversion is done per column with vectorized pandas/NumPy operations
+    instead of per cell: missing values (NaN/NaT/NA) become None, datetimes
+    become '%Y-%m-%d %H:%M:%S.%f' strings and NumPy scalars become native
+    Python values. Arrow-backed string columns are converted from their Arrow
+    buffers directly.
+    
+    Args:
+        df: DataFrame to convert
+        date_columns: Object columns that may hold date/datetime objects.
+                      If None, every object column is inspected (an O(n) scan).
+    """
+    # One missing-value mask for the whole frame
+    missing = df.isna().to_numpy()
+    
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        
+        if _is_arrow_string(series.dtype):
+            # Arrow-backed strings: read straight from the Arrow buffers, whose
+            # to_pylist() already yields None for nulls (no object array or mask)
+            columns.append(pa.array(series.array).to_pylist())
+            continue
+        
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = _format_sql_timestamps(series)
+        elif (series.dtype == object and (date_columns is None or col in date_columns)
+              and pd.api.types.infer_dtype(series, skipna=True) in ('datetime', 'date')):
+            # Object column holding datetime/date objects
+            values = _format_sql_timestamps(pd.to_datetime(series))
+        else:
+            # astype(object) yields native Python int/float/bool/str values
+            values = series.to_numpy(dtype=object)
+        
+        columns.append(_none_where_missing(values, missing[:, i]))
+    
+    return list(zip(*columns))
 
 
 def _bulk_insert_sqlite_executemany(engine, table_name: str, df: pd.DataFrame):
@@ -165,79 +550,77 @@ def _bulk_insert_sqlite_executemany(engine, table_name: str, df: pd.DataFrame):
     if df.empty:
         return
     
-    # Get column names in order
-    columns = list(df.columns)
+    with bulk_insert_session(engine, table_name) as insert:
+        insert(df)
+
+
+# INSERT statements by (table_name, columns); identical SQL text lets
+# sqlite3's per-connection statement cache reuse the prepared statement
+_SQLITE_INSERT_CACHE = {}
+
+
+def _sqlite_insert_sql(table_name: str, columns: tuple) -> str:
+    """Get the (cached) parameterized INSERT statement for a table and column order."""
+    key = (table_name, columns)
+    insert_sql = _SQLITE_INSERT_CACHE.get(key)
+    if insert_sql is None:
+        # Quote column names
+        placeholders = ','.join(['?' for _ in columns])
+        column_names = ','.join([f'"{col}"' for col in columns])
+        insert_sql = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})'
+        _SQLITE_INSERT_CACHE[key] = insert_sql
+    return insert_sql
+
+
+@contextmanager
+def bulk_insert_session(engine, table_name: str):
+    """
+    Insert many DataFrames into one table over a single connection.
     
-    # Build INSERT statement
-    placeholders = ','.join(['?' for _ in columns])
-    column_names = ','.join([f'"{col}"' for col in columns])  # Quote column names
-    insert_sql = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})'
-    
-    # Convert DataFrame to list of tuples, handling NaN values and data types
-    # Replace NaN with None for SQL NULL
-    # Convert Timestamp objects to strings for SQLite compatibility
-    data_rows = []
-    for _, row in df.iterrows():
-        # Convert row to tuple, replacing NaN/NaT with None
-        row_values = []
-        for val in row:
-            if pd.isna(val):
-                row_values.append(None)
-            else:
-                # Handle datetime/Timestamp types
-                try:
-                    # Check if it's a Timestamp or datetime-like
-                    if isinstance(val, pd.Timestamp):
-                        row_values.append(val.strftime('%Y-%m-%d %H:%M:%S.%f'))
-                    elif hasattr(val, 'to_pydatetime'):  # pandas datetime64
-                        dt = val.to_pydatetime()
-                        row_values.append(dt.strftime('%Y-%m-%d %H:%M:%S.%f'))
-                    elif hasattr(val, 'strftime'):  # datetime objects
-                        row_values.append(val.strftime('%Y-%m-%d %H:%M:%S.%f'))
-                    elif hasattr(val, 'item'):  # numpy/pandas scalar types
-                        # Convert numpy/pandas scalars to Python native types
-                        converted = val.item()
-                        # Check if converted value is datetime-like
-                        if hasattr(converted, 'strftime'):
-                            row_values.append(converted.strftime('%Y-%m-%d %H:%M:%S.%f'))
-                        else:
-                            row_values.append(converted)
-                    else:
-                        row_values.append(val)
-                except (ValueError, AttributeError, TypeError):
-                    # Fallback: convert to string
-                    row_values.append(str(val) if val is not None else None)
-        data_rows.append(tuple(row_values))
+    Yields an ``insert(df)`` callable. On SQLite every call reuses one raw
+    connection and the whole block is a single transaction, committed once
+    on exit (rolled back if the block raises). Each call runs under a
+    savepoint, so a DataFrame that fails to insert is undone on its own and
+    its error re-raised without discarding earlier ones. Other databases
+    insert each DataFrame through _bulk_insert_dataframe (one COPY per call).
+    
+    Args:
+        engine: SQLAlchemy engine
+        table_name: Target table name
+    """
+    if engine.dialect.name != "sqlite":
+        yield partial(_bulk_insert_dataframe, engine, table_name)
+        return
     
-    # Use raw connection for executemany
     raw_conn = engine.raw_connection()
     try:
         cursor = raw_conn.cursor()
-        # Insert in smaller batches for SQLite to avoid lock issues
-        # Smaller batches = more frequent commits = less lock contention
-        batch_size = 1000 if "sqlite" in str(engine.url) else 10000
+        # Open the transaction explicitly so releasing a savepoint never commits
+        if not raw_conn.driver_connection.in_transaction:
+            cursor.execute("BEGIN")
         
-        for i in range(0, len(data_rows), batch_size):
-            batch = data_rows[i:i + batch_size]
+        def insert(df: pd.DataFrame):
+            if df.empty:
+                return
+            
+            insert_sql = _sqlite_insert_sql(table_name, tuple(df.columns))
+            
+            # Convert DataFrame to list of tuples, column by column (NaN -> None,
+            # Timestamps -> strings for SQLite compatibility). For the static-schema
+            # tables only their date columns need the date-object scan.
+            data_rows = _dataframe_to_rows(df, date_columns=_STATIC_DATE_COLUMNS.get(table_name))
+            
+            cursor.execute("SAVEPOINT bulk_insert")
             try:
-                cursor.executemany(insert_sql, batch)
-                raw_conn.commit()  # Commit after each batch for SQLite
-            except Exception as batch_error:
-                # If batch fails, try individual inserts for this batch
-                if "database is locked" in str(batch_error):
-                    logger.debug(f"Database locked on batch, retrying individually")
-                    raw_conn.rollback()
-                    for row in batch:
-                        try:
-                            cursor.execute(insert_sql, row)
-                            raw_conn.commit()
-                        except Exception as row_error:
-                            logger.debug(f"Failed to insert row: {row_error}")
-                            raw_conn.rollback()
-                else:
-                    # Other errors - re-raise
-                    raw_conn.rollback()
-                    raise
+                _executemany_in_batches(cursor, insert_sql, data_rows)
+            except Exception:
+                cursor.execute("ROLLBACK TO bulk_insert")
+                cursor.execute("RELEASE bulk_insert")
+                raise
+            cursor.execute("RELEASE bulk_insert")
+        
+        yield insert
+        raw_conn.commit()
     except Exception as e:
         raw_conn.rollback()
         raise
@@ -245,274 +628,710 @@ def _bulk_insert_sqlite_executemany(engine, table_name: str, df: pd.DataFrame):
         raw_conn.close()
 
 
+def _executemany_in_batches(cursor, insert_sql: str, data_rows: list, batch_size: int = 1000):
+    """
+    Run executemany over data_rows in batches inside the current savepoint.
+    
+    Batches bound the size of each executemany call; committing is left to
+    the caller. If the database is locked, the savepoint is rolled back and
+    rows are retried individually, skipping rows that still fail.
+    """
+    try:
+        for i in range(0, len(data_rows), batch_size):
+            cursor.executemany(insert_sql, data_rows[i:i + batch_size])
+    except Exception as batch_error:
+        # If the bulk insert fails, try individual inserts instead
+        if "database is locked" in str(batch_error):
+            logger.debug(f"Database locked during bulk insert, retrying individually")
+            cursor.execute("ROLLBACK TO bulk_insert")
+            for row in data_rows:
+                try:
+                    cursor.execute(insert_sql, row)
+                except Exception as row_error:
+                    # A failed statement is undone on its own
+                    logger.debug(f"Failed to insert row: {row_error}")
+        else:
+            # Other errors - re-raise
+            raise
+
+
+# Read size for COPY FROM STDIN (in line with libpq's send buffer sizing)
+COPY_BUFFER_SIZE = 256 * 1024
+
+
+class _DataFrameCsvStream(io.RawIOBase):
+    """
+    Readable byte stream that serializes a DataFrame to CSV lazily.
+    
+    Rows are rendered ``chunk_rows`` at a time with pandas' C CSV writer, so
+    peak memory is bounded by one slice rather than the whole DataFrame.
+    Missing values (NaN/NaT/None) are written as unquoted empty fields,
+    which PostgreSQL COPY reads as NULL with ``NULL ''``; quotes inside
+    values are doubled, which is the CSV-format default escape.
+    """
+    
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = 50000):
+        self._df = df
+        self._chunk_rows = chunk_rows
+        self._position = 0
+        self._pending = memoryview(b'')
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending and self._position < len(self._df):
+            chunk = self._df.iloc[self._position:self._position + self._chunk_rows]
+            self._position += self._chunk_rows
+            text = chunk.to_csv(index=False, header=False, na_rep='', quoting=csv.QUOTE_MINIMAL)
+            self._pending = memoryview(text.encode('utf-8'))
+        
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
 def _bulk_insert_postgresql_copy(engine, table_name: str, df: pd.DataFrame):
     """
     Use PostgreSQL COPY command for fastest bulk loading.
     This is 10-20x faster than INSERT statements.
     """
-    try:
-        import io
-    except ImportError:
-        raise ImportError("io module required for PostgreSQL COPY")
-    
     if df.empty:
         return
     
+    # Use raw connection for COPY
+    raw_conn = engine.raw_connection()
+    try:
+        _copy_csv(raw_conn, table_name, df)
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+
+def _copy_csv(raw_conn, table_name: str, df: pd.DataFrame):
+    """Run COPY ... FROM STDIN (CSV) for a DataFrame on a raw connection, without committing."""
     # Get column names
     columns = list(df.columns)
     column_names = ','.join([f'"{col}"' for col in columns])
     
-    # Create in-memory CSV buffer
-    csv_buffer = io.StringIO()
-    
-    # Write DataFrame to CSV buffer
-    # PostgreSQL COPY expects NULL to be represented as \N or empty string
-    # We'll use empty string for NULL values
-    df_clean = df.copy()
-    # Replace NaN/NaT with None, then convert to empty string for COPY
-    df_clean = df_clean.where(pd.notnull(df_clean), None)
-    
-    # Write to CSV with proper NULL handling
-    for _, row in df_clean.iterrows():
-        row_values = []
-        for val in row:
-            if val is None or pd.isna(val):
-                row_values.append('')  # Empty string for NULL
-            else:
-                # Convert to string, handle special characters
-                val_str = str(val)
-                # Escape quotes and backslashes for CSV
-                if '"' in val_str or ',' in val_str or '\n' in val_str:
-                    val_str = '"' + val_str.replace('"', '""') + '"'
-                row_values.append(val_str)
-        csv_buffer.write(','.join(row_values) + '\n')
-    
-    csv_buffer.seek(0)
+    # Stream the DataFrame as CSV so COPY consumes one slice at a time
+    # instead of a fully materialized buffer
+    csv_stream = io.BufferedReader(_DataFrameCsvStream(df), buffer_size=COPY_BUFFER_SIZE)
     
-    # Use raw connection for COPY
-    raw_conn = engine.raw_connection()
+    cursor = raw_conn.cursor()
     try:
-        cursor = raw_conn.cursor()
-        
         # Prepare COPY command
         copy_sql = f"""
             COPY "{table_name}" ({column_names})
             FROM STDIN
-            WITH (FORMAT CSV, DELIMITER ',', QUOTE '"', ESCAPE '\\', NULL '')
+            WITH (FORMAT CSV, DELIMITER ',', QUOTE '"', NULL '')
         """
         
         # Execute COPY
-        cursor.copy_expert(copy_sql, csv_buffer)
-        raw_conn.commit()
+        cursor.copy_expert(copy_sql, csv_stream, size=COPY_BUFFER_SIZE)
+    finally:
         cursor.close()
+
+
+def _bulk_insert_postgresql_copy_staged(engine, table_name: str, df: pd.DataFrame, key_column: str):
+    """
+    COPY a DataFrame into a temporary staging table, then insert its rows
+    into ``table_name`` with ON CONFLICT (key_column) DO NOTHING.
+    
+    A plain COPY aborts the whole batch on the first duplicate key; staging
+    keeps the COPY speed and skips rows whose key already exists (or repeats
+    within the batch). The staging table copies only column defaults, not
+    the target's unique indexes, and is dropped on commit.
+    """
+    if df.empty:
+        return
+    
+    stage_name = f"_stage_{table_name}"
+    column_names = ','.join([f'"{col}"' for col in df.columns])
+    
+    raw_conn = engine.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        try:
+            cursor.execute(
+                f'CREATE TEMP TABLE "{stage_name}" (LIKE "{table_name}" INCLUDING DEFAULTS) ON COMMIT DROP'
+            )
+            _copy_csv(raw_conn, stage_name, df)
+            cursor.execute(
+                f'INSERT INTO "{table_name}" ({column_names}) '
+                f'SELECT {column_names} FROM "{stage_name}" '
+                f'ON CONFLICT ("{key_column}") DO NOTHING'
+            )
+            skipped = len(df) - cursor.rowcount
+        finally:
+            cursor.close()
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+    
+    if skipped > 0:
+        logger.debug(f"Skipped {skipped} {table_name} rows with an existing {key_column}")
+
+
+# DataFrames at least this large are split across concurrent COPY streams
+PARALLEL_COPY_MIN_ROWS = 200000
+
+
+class _PartialCopyError(Exception):
+    """A parallel COPY failed after some of its slices had already committed."""
+    
+    def __init__(self, remaining: pd.DataFrame):
+        super().__init__(f"{len(remaining)} rows were not committed")
+        self.remaining = remaining
+
+
+def _bulk_insert_postgresql_copy_parallel(engine, table_name: str, df: pd.DataFrame, workers: int = 4):
+    """
+    Split a large DataFrame into row slices loaded by concurrent COPY streams.
+    
+    PostgreSQL lets several COPY FROM run against one table at once, so each
+    slice is copied over its own connection from a thread pool. Connections
+    commit only after every slice has been copied, so a failed COPY rolls
+    all of them back. The commits themselves are separate transactions: if
+    one fails after earlier ones succeeded, _PartialCopyError carries the
+    uncommitted rows so the caller retries only those.
+    """
+    if df.empty:
+        return
+    
+    slice_rows = -(-len(df) // workers)  # Ceiling division
+    slices = [df.iloc[start:start + slice_rows] for start in range(0, len(df), slice_rows)]
+    raw_conns = []
+    committed = 0
+    try:
+        for _ in slices:
+            raw_conns.append(engine.raw_connection())
+        with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+            list(executor.map(_copy_csv, raw_conns, [table_name] * len(slices), slices))
+        for raw_conn in raw_conns:
+            raw_conn.commit()
+            committed += 1
     except Exception as e:
+        for raw_conn in raw_conns[committed:]:
+            try:
+                raw_conn.rollback()
+            except Exception:
+                pass  # Connection already broken; closing it discards the transaction
+        if committed:
+            raise _PartialCopyError(pd.concat(slices[committed:])) from e
+        raise
+    finally:
+        for raw_conn in raw_conns:
+            raw_conn.close()
+
+
+# Tables with a static ORM schema, eligible for binary COPY / ADBC ingest
+_STATIC_SCHEMA_TABLES = {
+    model.__tablename__: model.__table__ for model in (Inspection, Violation, Accident)
+}
+
+# Tables load_all_data can load, in load order
+LOADABLE_TABLES = ('inspections', 'violations', 'accidents')
+
+# Unique key column of tables whose source files can repeat a key; on
+# PostgreSQL these load through a staging table, skipping repeated keys
+_CONFLICT_KEY_COLUMNS = {
+    Accident.__tablename__: 'accident_key',
+}
+
+# Date columns of each static-schema table
+_STATIC_DATE_COLUMNS = {
+    name: frozenset(c.name for c in table.columns if isinstance(c.type, SQLiteDate))
+    for name, table in _STATIC_SCHEMA_TABLES.items()
+}
+
+
+def _bulk_insert_postgresql_binary_copy(engine, table_name: str, df: pd.DataFrame):
+    """
+    Use PostgreSQL binary COPY (via pgcopy) for bulk loading.
+    
+    Values are sent in PostgreSQL's binary wire format, so neither side
+    formats or parses text. Column values are coerced once per column to
+    the Python types pgcopy encodes for the target schema: dates for
+    date columns, ints for integer columns and None for missing values.
+    """
+    if df.empty:
+        return
+    
+    table = _STATIC_SCHEMA_TABLES[table_name]
+    columns = list(df.columns)
+    
+    values_by_column = []
+    for col in columns:
+        series = df[col]
+        col_type = table.c[col].type
+        
+        if isinstance(col_type, SQLiteDate):
+            series = pd.to_datetime(series, errors='coerce').dt.date
+        elif isinstance(col_type, sa_Integer) and not pd.api.types.is_integer_dtype(series):
+            series = pd.to_numeric(series, errors='coerce').astype('Int64')
+        
+        values_by_column.append(_none_where_missing(series.to_numpy(dtype=object), series.isna().to_numpy()))
+    
+    raw_conn = engine.raw_connection()
+    try:
+        manager = CopyManager(raw_conn.driver_connection, table_name, columns)
+        manager.copy(zip(*values_by_column))
+        raw_conn.commit()
+    except Exception:
         raw_conn.rollback()
         raise
     finally:
         raw_conn.close()
 
 
-# ============================================================================
-# INDEX MANAGEMENT FUNCTIONS
-# ============================================================================
+def _adbc_available(engine) -> bool:
+    """Check whether an ADBC driver can reach the engine's database."""
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        # A separate connection needs a database file, not a private in-memory one
+        return ADBC_SQLITE_AVAILABLE and engine.url.database not in (None, "", ":memory:")
+    if dialect == "postgresql":
+        return ADBC_POSTGRESQL_AVAILABLE
+    return False
+
+
+def _dataframe_to_arrow(table_name: str, df: pd.DataFrame, dialect: str):
+    """
+    Convert a DataFrame to a pyarrow Table typed for a static-schema table.
+    
+    Arrow types follow the ORM column types so ADBC's append binds them
+    without server-side casts. Dates are sent as date32 to PostgreSQL and as
+    '%Y-%m-%d %H:%M:%S.%f' strings to SQLite, matching what the other insert
+    paths store.
+    """
+    table = _STATIC_SCHEMA_TABLES[table_name]
+    arrays = {}
+    for col in df.columns:
+        series = df[col]
+        col_type = table.c[col].type
+        
+        if isinstance(col_type, SQLiteDate):
+            dates = pd.to_datetime(series, errors='coerce')
+            if dialect == "sqlite":
+                arrays[col] = pa.array(dates.dt.strftime(_SQL_TIMESTAMP_FORMAT), type=pa.string(), from_pandas=True)
+            else:
+                arrays[col] = pa.array(dates.to_numpy(dtype='datetime64[D]'), type=pa.date32(), from_pandas=True)
+        elif isinstance(col_type, sa_SmallInteger):
+            arrays[col] = pa.array(series, type=pa.int16(), from_pandas=True)
+        elif isinstance(col_type, sa_Integer):
+            arrays[col] = pa.array(series, type=pa.int32(), from_pandas=True)
+        elif isinstance(col_type, sa_Float):
+            arrays[col] = pa.array(series, type=pa.float64(), from_pandas=True)
+        elif isinstance(col_type, sa_Boolean):
+            arrays[col] = pa.array(series, type=pa.bool_(), from_pandas=True)
+        else:
+            arrays[col] = pa.array(series, type=pa.string(), from_pandas=True)
+    
+    return pa.table(arrays)
+
+
+def _bulk_insert_adbc(engine, table_name: str, df: pd.DataFrame):
+    """
+    Use ADBC (Arrow Database Connectivity) ingest for bulk loading.
+    
+    The DataFrame is converted to Arrow once and appended through the
+    driver's native bulk path (binary COPY on PostgreSQL, prepared bulk
+    binds on SQLite) in a single transaction.
+    """
+    if df.empty:
+        return
+    
+    dialect = engine.dialect.name
+    arrow_table = _dataframe_to_arrow(table_name, df, dialect)
+    
+    if dialect == "sqlite":
+        conn = adbc_sqlite.connect(engine.url.database)
+    else:
+        uri = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        conn = adbc_postgresql.connect(uri)
+    
+    try:
+        with conn.cursor() as cursor:
+            cursor.adbc_ingest(table_name, arrow_table, mode='append')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+# ============================================================================
+# CSV HELPER FUNCTIONS
+# ============================================================================
+
+def _count_csv_rows(csv_path: Path) -> int:
+    """
+    Count total rows in CSV file (for progress tracking).
+    
+    The file is memory-mapped and newlines are counted with NumPy over
+    zero-copy views of the mapping, 16 MiB at a time, so bytes are neither
+    decoded nor copied into Python buffers.
+    """
+    try:
+        if os.path.getsize(csv_path) == 0:
+            return 0
+        
+        with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # First line is the header; without a newline there are no rows
+            if mm.find(b'\n') == -1:
+                return 0
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            
+            data = np.frombuffer(mm, dtype=np.uint8)
+            newlines = 0
+            for start in range(0, len(data), 1 << 24):
+                newlines += int(np.count_nonzero(data[start:start + (1 << 24)] == ord('\n')))
+            ends_with_newline = data[-1] == ord('\n')
+            del data  # Release the buffer export before the mapping closes
+            
+            # Minus the header's newline; a final line without one still counts
+            return newlines - 1 + (0 if ends_with_newline else 1)
+    except Exception as e:
+        logger.warning(f"Could not count CSV rows: {e}")
+        return 0
+
+
+def _estimate_csv_rows(csv_path: Path, sample_bytes: int = 1 << 20) -> int:
+    """
+    Estimate total rows in a CSV file (for progress tracking).
+    
+    Counts newlines in the first ``sample_bytes`` after the header and scales
+    by the file size, so progress reporting costs one small read instead of
+    a full pass over the file. Files no larger than the sample are counted
+    exactly.
+    """
+    try:
+        total_bytes = os.path.getsize(csv_path)
+        with open(csv_path, 'rb') as f:
+            header = f.readline()
+            sample = f.read(sample_bytes)
+        
+        if not sample:
+            return 0
+        newlines = sample.count(b'\n')
+        if len(header) + len(sample) >= total_bytes:
+            # Whole file read; a final line without a newline still counts
+            return newlines + (0 if sample.endswith(b'\n') else 1)
+        if newlines == 0:
+            return 1
+        return round((total_bytes - len(header)) * newlines / len(sample))
+    except Exception as e:
+        logger.warning(f"Could not estimate CSV rows: {e}")
+        return 0
+
+
+# ============================================================================
+# PARALLEL PROCESSING FUNCTIONS
+# ============================================================================
+
+def _process_inspection_chunk_static(chunk_df) -> pd.DataFrame:
+    """
+    Static version of inspection chunk processing (for parallel workers).
+    
+    Accepts a DataFrame or a pyarrow RecordBatch (see _iter_csv_row_range).
+    """
+    if PYARROW_AVAILABLE and isinstance(chunk_df, pa.RecordBatch):
+        return _process_inspection_batch_arrow(chunk_df)
+    
+    # Drop rows with missing or empty activity_nr before any other column is processed
+    if 'activity_nr' in chunk_df.columns:
+        keys = chunk_df['activity_nr'].astype(str).str.strip()
+    else:
+        keys = pd.Series("", index=chunk_df.index, dtype=object)
+    valid = keys.notna() & (keys.str.len() > 0)
+    if not valid.all():
+        chunk_df = chunk_df[valid]
+        keys = keys[valid]
+    
+    # Build every column first, then the DataFrame once
+    cols = {}
+    cols['activity_nr'] = keys
+    cols['estab_name'] = chunk_df['estab_name'].astype(str).str[:500] if 'estab_name' in chunk_df.columns else None
+    cols['site_state'] = chunk_df['site_state'].astype(str).str.upper().str[:2] if 'site_state' in chunk_df.columns else None
+    cols['naics_code'] = chunk_df['naics_code'].astype(str).str[:10] if 'naics_code' in chunk_df.columns else None
+    cols['open_date'] = _parse_dates(chunk_df['open_date']) if 'open_date' in chunk_df.columns else None
+    cols['close_case_date'] = _parse_dates(chunk_df['close_case_date']) if 'close_case_date' in chunk_df.columns else None
+    cols['year'] = pd.to_numeric(chunk_df['year'], errors='coerce').astype('Int64') if 'year' in chunk_df.columns else None
+    if 'year' not in chunk_df.columns and not _all_missing(cols['open_date']):
+        cols['year'] = cols['open_date'].dt.year
+    cols['inspection_type'] = chunk_df['inspection_type'].astype(str).str[:100] if 'inspection_type' in chunk_df.columns else None
+    
+    return pd.DataFrame(_empty_strings_to_none(cols), index=chunk_df.index)
+
+
+def _process_inspection_batch_arrow(batch) -> pd.DataFrame:
+    """
+    Arrow compute version of _process_inspection_chunk_static.
+    
+    Text columns are trimmed, upper-cased and truncated with Arrow kernels
+    directly on the record batch buffers, and rows are filtered before any
+    pandas conversion. Dates and year are still parsed with pandas so
+    parsing and coercion match the DataFrame path.
+    """
+    names = batch.schema.names
+    if 'activity_nr' not in names:
+        return _process_inspection_chunk_static(batch.to_pandas())
+    
+    activity_nr = pc.utf8_trim_whitespace(batch.column('activity_nr'))
+    keep = pc.fill_null(pc.not_equal(activity_nr, ''), False)
+    batch = batch.filter(keep)
+    
+    def text(column, length: int, upper: bool = False):
+        if column not in names:
+            return None
+        values = batch.column(column)
+        if upper:
+            values = pc.utf8_upper(values)
+        values = pc.utf8_slice_codeunits(values, 0, length)
+        # Empty strings become NULL, like _empty_strings_to_none on the DataFrame path
+        return pc.if_else(pc.equal(values, ''), pa.scalar(None, pa.string()), values).to_pandas()
+    
+    def dates(column):
+        if column not in names:
+            return None
+        return _parse_dates(batch.column(column).to_pandas())
+    
+    insert_df = pd.DataFrame({
+        'activity_nr': activity_nr.filter(keep).to_pandas(),
+        'estab_name': text('estab_name', 500),
+        'site_state': text('site_state', 2, upper=True),
+        'naics_code': text('naics_code', 10),
+        'open_date': dates('open_date'),
+        'close_case_date': dates('close_case_date'),
+        'year': None,
+        'inspection_type': text('inspection_type', 100),
+    })
+    if 'year' in names:
+        insert_df['year'] = pd.to_numeric(batch.column('year').to_pandas(), errors='coerce').astype('Int64')
+    elif 'open_date' in names and insert_df['open_date'].notna().any():
+        insert_df['year'] = insert_df['open_date'].dt.year
+    
+    return insert_df
+
+
+def _build_csv_row_offsets(csv_path: Path, step: int) -> list:
+    """
+    Byte offsets of data rows 0, step, 2*step, ... in a CSV (header excluded).
+    
+    The file is scanned once in binary 1 MiB blocks, locating newlines with
+    NumPy, so workers can seek straight to their first row instead of each
+    re-parsing everything before it. Like _count_csv_rows, rows are physical
+    lines; fields containing quoted newlines are not supported.
+    
+    Args:
+        csv_path: Path to CSV file
+        step: Number of data rows between recorded offsets
+    
+    Returns:
+        List of byte offsets; offsets[k] is where data row k * step starts
+    """
+    offsets = []
+    block_start = 0
+    newlines_seen = 0
+    
+    with open(csv_path, 'rb') as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            # Data row r starts right after newline number r (the header's is 0)
+            positions = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord('\n'))
+            rows = newlines_seen + np.arange(len(positions))
+            offsets.extend((block_start + positions[rows % step == 0] + 1).tolist())
+            newlines_seen += len(positions)
+            block_start += len(block)
+    
+    # A trailing newline does not start another row
+    if offsets and offsets[-1] >= block_start:
+        offsets.pop()
+    return offsets
+
+
+# Bytes of CSV text parsed per pyarrow record batch
+ARROW_CSV_BLOCK_SIZE = 16 << 20
 
-def _count_csv_rows(csv_path: Path) -> int:
-    """Count total rows in CSV file (for progress tracking)."""
-    try:
-        with open(csv_path, 'r', encoding='utf-8', errors='ignore') as f:
-            # Read first line to check if it's a header
-            first_line = f.readline()
-            if not first_line:
-                return 0
-            
-            # Count remaining lines
-            count = sum(1 for _ in f)
-            return count
-    except Exception as e:
-        logger.warning(f"Could not count CSV rows: {e}")
-        return 0
 
+# Raw inspection CSV columns used by _process_inspection_chunk_static
+INSPECTION_CSV_COLUMNS = [
+    'activity_nr', 'estab_name', 'site_state', 'naics_code',
+    'open_date', 'close_case_date', 'year', 'inspection_type'
+]
 
-def _drop_table_indexes(engine, table_name: str):
-    """Drop indexes on a table for faster bulk inserts."""
-    indexes_map = {
-        'inspections': [
-            'idx_inspection_state_year',
-            'idx_inspection_naics',
-        ],
-        'violations': [
-            'idx_violation_agency_company',
-            'idx_violation_company_year',
-            'idx_violation_state_year',
-            'idx_violation_agency_year',
-            'idx_violation_penalty',
-            'idx_violation_standard_agency',
-            'idx_violation_naics_year',
-        ],
-        'accidents': [],  # Accidents use single-column indexes defined in model
-    }
-    
-    indexes = indexes_map.get(table_name, [])
-    if not indexes:
-        return
-    
-    logger.info(f"Dropping {len(indexes)} indexes on {table_name} for faster inserts...")
-    with engine.connect() as conn:
-        for idx_name in indexes:
-            try:
-                conn.execute(sa_text(f"DROP INDEX IF EXISTS {idx_name}"))
-            except Exception as e:
-                logger.debug(f"Could not drop index {idx_name}: {e}")
-        conn.commit()
+# Raw violation CSV columns used by _process_violation_chunk (the inspection
+# merge columns are included for extracts that already carry them)
+VIOLATION_CSV_COLUMNS = [
+    'activity_nr', 'estab_name', 'standard', 'viol_type', 'description',
+    'initial_penalty', 'current_penalty', 'fta_penalty', 'site_state',
+    'site_city', 'naics_code', 'sic_code', 'open_date', 'year'
+]
 
+# Violation penalty columns (read as strings, coerced to float in processing)
+VIOLATION_PENALTY_COLUMNS = ('initial_penalty', 'current_penalty', 'fta_penalty')
 
-def _create_table_indexes(engine, table_name: str):
-    """Recreate indexes on a table after bulk load."""
-    indexes_map = {
-        'inspections': [
-            ('idx_inspection_state_year', 
-             "CREATE INDEX idx_inspection_state_year ON inspections(site_state, year)"),
-            ('idx_inspection_naics',
-             "CREATE INDEX idx_inspection_naics ON inspections(naics_code, year)"),
-        ],
-        'violations': [
-            ('idx_violation_agency_company',
-             "CREATE INDEX idx_violation_agency_company ON violations(agency, company_name_normalized)"),
-            ('idx_violation_company_year',
-             "CREATE INDEX idx_violation_company_year ON violations(company_name_normalized, year)"),
-            ('idx_violation_state_year',
-             "CREATE INDEX idx_violation_state_year ON violations(site_state, year)"),
-            ('idx_violation_agency_year',
-             "CREATE INDEX idx_violation_agency_year ON violations(agency, year)"),
-            ('idx_violation_penalty',
-             "CREATE INDEX idx_violation_penalty ON violations(current_penalty)"),
-            ('idx_violation_standard_agency',
-             "CREATE INDEX idx_violation_standard_agency ON violations(standard, agency)"),
-            ('idx_violation_naics_year',
-             "CREATE INDEX idx_violation_naics_year ON violations(naics_code, year)"),
-        ],
-        'accidents': [],  # Accidents indexes are created automatically by SQLAlchemy
-    }
-    
-    indexes = indexes_map.get(table_name, [])
-    if not indexes:
-        return
+# Raw accident CSV columns used by _process_accident_chunk, across the OSHA
+# standard, OSHA fatality report and MSHA layouts
+ACCIDENT_CSV_COLUMNS = [
+    'accident_key', 'activity_nr', 'estab_name', 'site_state', 'naics_code',
+    'accident_date', 'year', 'description', 'fatality', 'injury_type',
+    'summary_nr', 'event_date', 'event_desc', 'abstract_text', 'event_keyword', 'state_flag',
+    'mine_id', 'document_no', 'operator_name', 'fips_state_cd', 'ai_dt', 'ai_year',
+    'cal_yr', 'ai_narr', 'inj_degr_desc', 'degree_injury_cd', 'nature_injury'
+]
+
+
+def _csv_data_offset(csv_path: Path) -> int:
+    """Byte offset of the first data row in a CSV, just past the header line."""
+    with open(csv_path, 'rb') as f:
+        f.readline()
+        return f.tell()
+
+
+def _prefetch(iterable, maxsize: int = 2):
+    """
+    Iterate ``iterable`` on a background thread, up to ``maxsize`` items ahead.
     
-    logger.info(f"Creating {len(indexes)} indexes on {table_name} (this may take a few minutes)...")
-    start_time = time.time()
+    Lets CSV parsing and chunk processing for the next chunk overlap with the
+    caller inserting the current one (pyarrow, pandas and sqlite3 release the
+    GIL for most of that work). Exceptions raised by the producer are
+    re-raised in the caller; if the caller stops early, the producer is
+    stopped after its current item.
+    
+    Args:
+        iterable: Items to produce (consumed on the background thread)
+        maxsize: Maximum number of produced items waiting to be consumed
+    """
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    done = object()
     
-    with engine.connect() as conn:
-        for idx_name, idx_sql in indexes:
+    def put(item) -> bool:
+        # Block on a full queue, but give up once the consumer has stopped
+        while not stop.is_set():
             try:
-                logger.debug(f"Creating index {idx_name}...")
-                conn.execute(sa_text(idx_sql))
-                conn.commit()
-            except Exception as e:
-                logger.warning(f"Could not create index {idx_name}: {e}")
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
     
-    elapsed = time.time() - start_time
-    logger.info(f"Indexes created in {elapsed/60:.1f} minutes")
-
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((done, e))
+        else:
+            put((done, None))
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
 
-# ============================================================================
-# PARALLEL PROCESSING FUNCTIONS
-# ============================================================================
 
-def _process_inspection_chunk_static(chunk_df: pd.DataFrame) -> pd.DataFrame:
-    """Static version of inspection chunk processing (for parallel workers)."""
-    insert_df = pd.DataFrame()
-    insert_df['activity_nr'] = chunk_df['activity_nr'].astype(str).str.strip() if 'activity_nr' in chunk_df.columns else ""
-    insert_df['estab_name'] = chunk_df['estab_name'].astype(str).str[:500] if 'estab_name' in chunk_df.columns else None
-    insert_df['site_state'] = chunk_df['site_state'].astype(str).str.upper().str[:2] if 'site_state' in chunk_df.columns else None
-    insert_df['naics_code'] = chunk_df['naics_code'].astype(str).str[:10] if 'naics_code' in chunk_df.columns else None
-    insert_df['open_date'] = pd.to_datetime(chunk_df['open_date'], errors='coerce') if 'open_date' in chunk_df.columns else None
-    insert_df['close_case_date'] = pd.to_datetime(chunk_df['close_case_date'], errors='coerce') if 'close_case_date' in chunk_df.columns else None
-    insert_df['year'] = pd.to_numeric(chunk_df['year'], errors='coerce').astype('Int64') if 'year' in chunk_df.columns else None
-    if 'year' not in chunk_df.columns and 'open_date' in insert_df.columns:
-        insert_df['year'] = insert_df['open_date'].dt.year if insert_df['open_date'].notna().any() else None
-    insert_df['inspection_type'] = chunk_df['inspection_type'].astype(str).str[:100] if 'inspection_type' in chunk_df.columns else None
-    
-    # Filter out rows with empty activity_nr
-    insert_df = insert_df[insert_df['activity_nr'].str.strip().astype(bool)]
-    insert_df = insert_df.replace('', None)
+def _iter_csv_row_range(csv_path: Path, start_offset: int, nrows: Optional[int], chunk_size: int = 50000,
+                        usecols: Optional[list] = None, newlines_in_values: bool = False):
+    """
+    Yield chunks for ``nrows`` CSV rows starting at a byte offset.
     
-    return insert_df
+    Every column is read as a nullable string with no type inference, which
+    keeps block-wise parsing consistent between chunks and lets the chunk
+    processing coerce invalid values itself. Uses pyarrow's multi-threaded
+    CSV reader when available, yielding one pyarrow RecordBatch per block;
+    otherwise yields DataFrames from pandas' chunked reader.
+    
+    Args:
+        csv_path: Path to CSV file
+        start_offset: Byte offset of the first row (see _build_csv_row_offsets)
+        nrows: Number of rows to read (None = through the end of the file)
+        chunk_size: Rows per chunk for the pandas reader
+        usecols: Columns to read (others are skipped while parsing); None = all
+        newlines_in_values: Whether quoted values may contain line breaks
+            (free-text columns); slower for pyarrow, which must then split
+            blocks on quote-aware row boundaries
+    """
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    selected = columns if usecols is None else [col for col in columns if col in usecols]
+    
+    with open(csv_path, 'rb') as f:
+        f.seek(start_offset)
+        
+        if PYARROW_AVAILABLE:
+            reader = pacsv.open_csv(
+                f,
+                read_options=pacsv.ReadOptions(column_names=columns, block_size=ARROW_CSV_BLOCK_SIZE),
+                parse_options=pacsv.ParseOptions(newlines_in_values=newlines_in_values),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=selected,
+                    column_types={col: pa.string() for col in selected},
+                    strings_can_be_null=True
+                )
+            )
+            if nrows is None:
+                yield from reader
+                return
+            remaining = nrows
+            for batch in reader:
+                if remaining <= 0:
+                    break
+                if batch.num_rows > remaining:
+                    batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+                yield batch
+        else:
+            yield from pd.read_csv(f, header=None, names=columns, usecols=selected,
+                                   dtype={col: str for col in selected},
+                                   nrows=nrows, chunksize=chunk_size)
 
 
 def _parallel_worker_inspections(args):
     """
-    Worker function for parallel inspection loading.
+    Worker function for parallel inspection loading (multi-writer databases).
     Processes a chunk of CSV data and inserts into database.
     """
-    start_row, end_row, csv_path, database_url, data_dir = args
+    start_row, end_row, start_offset, csv_path, database_url, data_dir = args
     
     # Create own database connection for this worker
     from .database import DatabaseManager
     db = DatabaseManager(database_url=database_url, data_dir=data_dir)
     
-    # Optimize SQLite for this worker
-    _optimize_sqlite_for_bulk_load(db.engine)
-    
-    # For SQLite, add timeout and retry logic
-    is_sqlite = "sqlite" in database_url
-    if is_sqlite:
-        import time
-        max_retries = 3
-        retry_delay = 0.1  # 100ms delay between retries
-    
     try:
         rows_processed = 0
         
-        # Read CSV in chunks, processing only our assigned range
-        chunk_size = 50000
-        current_row = 0
-        
-        for chunk_df in pd.read_csv(csv_path, chunksize=chunk_size, low_memory=False):
-            chunk_start = current_row
-            chunk_end = current_row + len(chunk_df)
-            current_row = chunk_end
-            
-            # Skip chunks before our range
-            if chunk_end <= start_row:
-                continue
-            
-            # Stop if we've passed our range
-            if chunk_start >= end_row:
-                break
-            
-            # Trim chunk to our range
-            if chunk_start < start_row:
-                skip_in_chunk = start_row - chunk_start
-                chunk_df = chunk_df.iloc[skip_in_chunk:]
-            
-            if chunk_start + len(chunk_df) > end_row:
-                take_rows = end_row - (chunk_start + (start_row - chunk_start if chunk_start < start_row else 0))
-                chunk_df = chunk_df.iloc[:take_rows]
-            
-            # Process and insert
-            processed = _process_inspection_chunk_static(chunk_df)
-            
-            if not processed.empty:
-                # For SQLite, retry on lock errors
-                if is_sqlite:
-                    for attempt in range(max_retries):
-                        try:
-                            _bulk_insert_dataframe(db.engine, 'inspections', processed, use_native=True)
-                            rows_processed += len(processed)
-                            break
-                        except Exception as e:
-                            if "database is locked" in str(e) and attempt < max_retries - 1:
-                                time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
-                                continue
-                            else:
-                                # Fall back to pandas to_sql on final retry or other errors
-                                logger.warning(f"Native insert failed, using pandas fallback: {e}")
-                                _bulk_insert_dataframe(db.engine, 'inspections', processed, use_native=False)
-                                rows_processed += len(processed)
-                                break
-                else:
-                    # PostgreSQL - no retry needed
-                    _bulk_insert_dataframe(db.engine, 'inspections', processed, use_native=True)
+        # Read CSV in chunks, processing only our assigned range; one
+        # connection and transaction for the whole range
+        with bulk_insert_session(db.bulk_engine, 'inspections') as insert:
+            for chunk_df in _iter_csv_row_range(csv_path, start_offset, end_row - start_row,
+                                                usecols=INSPECTION_CSV_COLUMNS):
+                # Process and insert
+                processed = _process_inspection_chunk_static(chunk_df)
+                
+                if not processed.empty:
+                    insert(processed)
                     rows_processed += len(processed)
         
         return rows_processed
@@ -523,6 +1342,193 @@ def _parallel_worker_inspections(args):
         db.close()
 
 
+def _load_inspections_single_writer(engine, csv_path: Path, chunk_boundaries: list,
+                                    row_offsets: list, num_workers: int) -> int:
+    """
+    Parallel parse, single writer pipeline for SQLite.
+    
+    SQLite allows one writer at a time, so parser threads read and process
+    their assigned row ranges and hand processed chunks to a bounded queue,
+    while the calling thread drains it and performs every insert on the
+    engine's single connection. There is no lock contention to retry on.
+    
+    Args:
+        engine: SQLAlchemy engine that receives all inserts
+        csv_path: Path to inspections CSV
+        chunk_boundaries: List of (start_row, end_row) ranges, one per parser
+        row_offsets: Byte offset of each range's first row
+        num_workers: Number of parser threads
+    
+    Returns:
+        Number of rows inserted
+    """
+    processed_queue = queue.Queue(maxsize=4)  # Backpressure on parsers
+    parser_done = object()
+    
+    def parse_range(start_row, end_row, start_offset):
+        try:
+            for chunk_df in _iter_csv_row_range(csv_path, start_offset, end_row - start_row,
+                                                usecols=INSPECTION_CSV_COLUMNS):
+                processed = _process_inspection_chunk_static(chunk_df)
+                if not processed.empty:
+                    processed_queue.put(processed)
+        except Exception as e:
+            logger.error(f"Parser error processing rows {start_row}-{end_row}: {e}")
+        finally:
+            processed_queue.put(parser_done)
+    
+    rows_inserted = 0
+    with ThreadPoolExecutor(max_workers=num_workers) as executor, \
+            bulk_insert_session(engine, 'inspections') as insert:
+        for (start_row, end_row), start_offset in zip(chunk_boundaries, row_offsets):
+            executor.submit(parse_range, start_row, end_row, start_offset)
+        
+        # Writer: keep draining until every parser has finished, so a failed
+        # insert never leaves a parser blocked on a full queue. All chunks
+        # share one transaction, committed when the session exits.
+        parsers_running = len(chunk_boundaries)
+        while parsers_running:
+            processed = processed_queue.get()
+            if processed is parser_done:
+                parsers_running -= 1
+                continue
+            try:
+                insert(processed)
+                rows_inserted += len(processed)
+            except Exception as e:
+                logger.error(f"Error inserting {len(processed)} inspections: {e}")
+    
+    return rows_inserted
+
+
+def _read_accident_chunks(csv_path: Path, nrows: Optional[int], chunk_size: int):
+    """
+    Read the accidents CSV as DataFrame chunks of the columns the processing uses.
+    
+    Goes through _iter_csv_row_range, so the file is parsed straight into
+    Arrow string buffers by pyarrow's multi-threaded reader when available
+    (narrative columns may span lines, so values may contain newlines).
+    """
+    for chunk in _iter_csv_row_range(csv_path, _csv_data_offset(csv_path), nrows, chunk_size,
+                                     usecols=ACCIDENT_CSV_COLUMNS, newlines_in_values=True):
+        yield chunk if isinstance(chunk, pd.DataFrame) else chunk.to_pandas()
+
+
+def _process_accident_chunk_static(chunk_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Process a chunk of accident data (module-level so worker processes can pickle it).
+    
+    Handles multiple formats:
+    - OSHA standard format (accident_key, activity_nr, etc.)
+    - OSHA fatality report format (summary_nr, event_date, etc.)
+    - MSHA format (mine safety data)
+    """
+    # Build every column first, then the DataFrame once
+    cols = {}
+    
+    # Detect format type
+    is_msha_format = 'mine_id' in chunk_df.columns and 'ai_dt' in chunk_df.columns
+    is_osha_fatality_format = 'summary_nr' in chunk_df.columns and 'event_date' in chunk_df.columns
+    
+    if is_msha_format:
+        # MSHA format mapping
+        # Create unique accident_key from mine_id and document_no
+        if 'mine_id' in chunk_df.columns and 'document_no' in chunk_df.columns:
+            cols['accident_key'] = (chunk_df['mine_id'].astype(str) + '_' + 
+                                    chunk_df['document_no'].astype(str)).str[:50]
+        elif 'mine_id' in chunk_df.columns:
+            cols['accident_key'] = _truncate_text(chunk_df['mine_id'], 50)
+        else:
+            cols['accident_key'] = None
+        
+        cols['activity_nr'] = None  # MSHA doesn't link to OSHA inspections
+        cols['estab_name'] = _truncate_text(chunk_df['operator_name'], 500) if 'operator_name' in chunk_df.columns else None
+        # FIPS state code - using first 2 digits (may need proper mapping to state abbreviations)
+        cols['site_state'] = _truncate_text(chunk_df['fips_state_cd'], 2) if 'fips_state_cd' in chunk_df.columns else None
+        cols['naics_code'] = None  # MSHA doesn't have NAICS codes
+        cols['accident_date'] = _parse_dates(chunk_df['ai_dt']) if 'ai_dt' in chunk_df.columns else None
+        # Extract year from ai_year, cal_yr, or accident_date (in order of preference)
+        cols['year'] = pd.to_numeric(chunk_df['ai_year'], errors='coerce').astype('Int64') if 'ai_year' in chunk_df.columns else None
+        if _all_missing(cols['year']) and 'cal_yr' in chunk_df.columns:
+            cols['year'] = pd.to_numeric(chunk_df['cal_yr'], errors='coerce').astype('Int64')
+        if _all_missing(cols['year']) and not _all_missing(cols['accident_date']):
+            cols['year'] = cols['accident_date'].dt.year
+        cols['description'] = _truncate_text(chunk_df['ai_narr'], 10000) if 'ai_narr' in chunk_df.columns else None
+        # Determine fatality from injury degree description or code
+        if 'inj_degr_desc' in chunk_df.columns:
+            cols['fatality'] = _contains_ignore_case(chunk_df['inj_degr_desc'], 'FATAL')
+        elif 'degree_injury_cd' in chunk_df.columns:
+            # Code 1 typically indicates fatality in MSHA data
+            degree_injury_cd = pd.to_numeric(chunk_df['degree_injury_cd'], errors='coerce')
+            cols['fatality'] = (degree_injury_cd == 1) if degree_injury_cd.notna().any() else False
+        else:
+            cols['fatality'] = False
+        # Use nature_injury if available, otherwise fall back to inj_degr_desc
+        if 'nature_injury' in chunk_df.columns:
+            cols['injury_type'] = _truncate_text(chunk_df['nature_injury'], 100)
+        elif 'inj_degr_desc' in chunk_df.columns:
+            cols['injury_type'] = _truncate_text(chunk_df['inj_degr_desc'], 100)
+        else:
+            cols['injury_type'] = None
+    elif is_osha_fatality_format:
+        # OSHA fatality report format (summary_nr, event_date, event_desc, etc.)
+        cols['accident_key'] = _truncate_text(chunk_df['summary_nr'], 50) if 'summary_nr' in chunk_df.columns else None
+        cols['activity_nr'] = None  # Fatality reports don't link to inspections
+        cols['estab_name'] = None  # Not available in this format
+        cols['site_state'] = _truncate_text(chunk_df['state_flag'], 2) if 'state_flag' in chunk_df.columns else None
+        cols['naics_code'] = None  # Not available in this format
+        cols['accident_date'] = _parse_dates(chunk_df['event_date']) if 'event_date' in chunk_df.columns else None
+        cols['year'] = None
+        if not _all_missing(cols['accident_date']):
+            cols['year'] = cols['accident_date'].dt.year
+        # Combine event_desc and abstract_text for description
+        if 'event_desc' in chunk_df.columns and 'abstract_text' in chunk_df.columns:
+            # Combine both columns; the separator is only used when both have text
+            cols['description'] = _truncate_text(
+                _join_text(chunk_df['event_desc'], chunk_df['abstract_text'], ' | '), 10000
+            )
+        elif 'event_desc' in chunk_df.columns:
+            cols['description'] = _truncate_text(chunk_df['event_desc'], 10000)
+        elif 'abstract_text' in chunk_df.columns:
+            cols['description'] = _truncate_text(chunk_df['abstract_text'], 10000)
+        else:
+            cols['description'] = None
+        # Fatality field - 'X' indicates fatality
+        if 'fatality' in chunk_df.columns:
+            cols['fatality'] = _equals_ignore_case(chunk_df['fatality'], 'X')
+        else:
+            cols['fatality'] = False
+        cols['injury_type'] = _truncate_text(chunk_df['event_keyword'], 100) if 'event_keyword' in chunk_df.columns else None
+    else:
+        # OSHA standard format (original expected format)
+        cols['accident_key'] = _truncate_text(chunk_df['accident_key'], 50) if 'accident_key' in chunk_df.columns else None
+        cols['activity_nr'] = _truncate_text(chunk_df['activity_nr'], 50) if 'activity_nr' in chunk_df.columns else None
+        cols['estab_name'] = _truncate_text(chunk_df['estab_name'], 500) if 'estab_name' in chunk_df.columns else None
+        cols['site_state'] = _truncate_text(chunk_df['site_state'], 2) if 'site_state' in chunk_df.columns else None
+        cols['naics_code'] = _truncate_text(chunk_df['naics_code'], 10) if 'naics_code' in chunk_df.columns else None
+        cols['accident_date'] = _parse_dates(chunk_df['accident_date']) if 'accident_date' in chunk_df.columns else None
+        # Year from the year column, filling gaps from accident_date
+        date_year = cols['accident_date'].dt.year.astype('Int64') if cols['accident_date'] is not None else None
+        if 'year' in chunk_df.columns:
+            cols['year'] = pd.to_numeric(chunk_df['year'], errors='coerce').astype('Int64')
+            if date_year is not None:
+                cols['year'] = cols['year'].fillna(date_year)
+        else:
+            cols['year'] = date_year
+        cols['description'] = _truncate_text(chunk_df['description'], 10000) if 'description' in chunk_df.columns else None
+        cols['fatality'] = pd.to_numeric(chunk_df['fatality'], errors='coerce').astype('boolean') if 'fatality' in chunk_df.columns else None
+        cols['injury_type'] = _truncate_text(chunk_df['injury_type'], 100) if 'injury_type' in chunk_df.columns else None
+    
+    # Empty strings become None (text columns only)
+    insert_df = pd.DataFrame(_empty_strings_to_none(cols), index=chunk_df.index)
+    
+    # Filter out rows with missing accident_key (required field)
+    if 'accident_key' in insert_df.columns:
+        insert_df = insert_df[insert_df['accident_key'].notna()]
+    
+    return insert_df
+
+
 # ============================================================================
 # DATABASE DATA LOADER CLASS
 # ============================================================================
@@ -566,92 +1572,87 @@ class DatabaseDataLoader:
                 return
         
         # Optimize SQLite for bulk loading
-        _optimize_sqlite_for_bulk_load(self.db.engine)
+        _optimize_sqlite_for_bulk_load(self.db.bulk_engine)
         
-        session = self.db.get_session()
-        try:
-            # Delete existing records if force_reload
-            if force_reload and existing_count > 0:
-                logger.info(f"Deleting {existing_count} existing inspection records...")
-                session.query(Inspection).delete()
-                session.commit()
-            
-            # Drop indexes for faster inserts
-            _drop_table_indexes(self.db.engine, 'inspections')
-            
-            if use_parallel and use_streaming:
-                # Use parallel processing (requires streaming)
-                if num_workers is None:
-                    num_workers = min(mp.cpu_count(), 8)  # Cap at 8 workers
-                logger.info(f"Using parallel processing with {num_workers} workers")
-                self._load_inspections_parallel(csv_path, nrows, num_workers)
-            elif use_streaming:
-                self._load_inspections_streaming(csv_path, nrows, chunk_size)
-            else:
-                # Fallback to original method for small datasets
-                logger.info("Loading inspections from CSV (non-streaming mode)...")
-                df = load_csv_inspections(nrows=nrows)
-                if not df.empty:
-                    self._process_and_insert_inspections(df, session)
-            
-            # Recreate indexes
-            _create_table_indexes(self.db.engine, 'inspections')
-            
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Error loading inspections: {e}")
-            raise
-        finally:
-            session.close()
+        with self.db.bulk_session() as session:
+            try:
+                # Delete existing records if force_reload
+                if force_reload and existing_count > 0:
+                    logger.info(f"Deleting {existing_count} existing inspection records...")
+                    session.query(Inspection).delete()
+                    session.commit()
+                
+                # Drop indexes for faster inserts (rebuilt when the block exits)
+                with self.db.bulk_load_mode([Inspection]):
+                    if use_parallel and use_streaming:
+                        # Use parallel processing (requires streaming)
+                        if num_workers is None:
+                            num_workers = min(mp.cpu_count(), 8)  # Cap at 8 workers
+                        logger.info(f"Using parallel processing with {num_workers} workers")
+                        self._load_inspections_parallel(csv_path, nrows, num_workers)
+                    elif use_streaming:
+                        self._load_inspections_streaming(csv_path, nrows, chunk_size)
+                    else:
+                        # Fallback to original method for small datasets
+                        logger.info("Loading inspections from CSV (non-streaming mode)...")
+                        df = load_csv_inspections(nrows=nrows)
+                        if not df.empty:
+                            self._process_and_insert_inspections(df, session)
+                
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error loading inspections: {e}")
+                raise
     
     def _load_inspections_streaming(self, csv_path: Path, nrows: Optional[int], chunk_size: int):
         """Load inspections using streaming chunks."""
         logger.info(f"Loading inspections from {csv_path.name} using streaming chunks...")
         
-        # Get total row count for progress tracking
-        total_rows = _count_csv_rows(csv_path)
+        # Estimate total row count for progress tracking (avoids a full pass over the file)
+        total_rows = _estimate_csv_rows(csv_path)
         if nrows:
             total_rows = min(total_rows, nrows)
-        logger.info(f"Total rows to load: {total_rows:,}")
+        logger.info(f"Estimated rows to load: ~{total_rows:,}")
         
         rows_loaded = 0
         start_time = time.time()
-        seen_activity_nrs = set()  # For duplicate detection
+        seen_activity_nrs = pd.Index([], dtype='string')  # For duplicate detection
         duplicates_removed = 0
         
-        # Stream CSV in chunks
-        for chunk_num, chunk_df in enumerate(
-            pd.read_csv(csv_path, chunksize=chunk_size, low_memory=False, nrows=nrows)
-        ):
-            # Remove duplicates within chunk and across chunks
-            initial_chunk_size = len(chunk_df)
-            chunk_df = chunk_df[~chunk_df['activity_nr'].isin(seen_activity_nrs)]
-            if 'activity_nr' in chunk_df.columns:
-                chunk_df = chunk_df.drop_duplicates(subset=['activity_nr'], keep='first')
-                seen_activity_nrs.update(chunk_df['activity_nr'].astype(str))
-            duplicates_removed += initial_chunk_size - len(chunk_df)
-            
-            if chunk_df.empty:
-                continue
-            
-            # Process and insert chunk
-            processed = self._process_inspection_chunk(chunk_df)
-            if not processed.empty:
-                # Use native bulk import (executemany for SQLite, COPY for PostgreSQL)
-                _bulk_insert_dataframe(self.db.engine, 'inspections', processed, use_native=True)
-            
-            rows_loaded += len(processed)
-            
-            # Progress logging
-            elapsed = time.time() - start_time
-            if elapsed > 0:
-                rate = rows_loaded / elapsed
-                remaining = (total_rows - rows_loaded) / rate if rate > 0 else 0
-                pct = (rows_loaded / total_rows * 100) if total_rows > 0 else 0
-                logger.info(
-                    f"Chunk {chunk_num + 1}: {rows_loaded:,}/{total_rows:,} rows "
-                    f"({pct:.1f}%) | Rate: {rate:.0f} rows/sec | ETA: {remaining/60:.1f} min"
-                )
+        # Stream CSV in chunks, inserting every chunk in one transaction. Chunks
+        # arrive as string-typed Arrow record batches when pyarrow is available,
+        # so text cleanup runs as Arrow kernels rather than per-object loops.
+        with bulk_insert_session(self.db.bulk_engine, 'inspections') as insert:
+            # Parse and process the next chunk on a background thread while this one is inserted
+            chunks = _iter_csv_row_range(csv_path, _csv_data_offset(csv_path), nrows, chunk_size,
+                                         usecols=INSPECTION_CSV_COLUMNS)
+            for chunk_num, processed in enumerate(
+                _prefetch(self._process_inspection_chunk(chunk) for chunk in chunks)
+            ):
+                # Remove duplicates within chunk and across chunks
+                keys = processed['activity_nr'].astype('string')
+                keep = ~keys.isin(seen_activity_nrs) & ~keys.duplicated()
+                duplicates_removed += int((~keep).sum())
+                processed = processed[keep]
+                # Surviving keys are unique and unseen, so no re-dedup of the index is needed
+                seen_activity_nrs = seen_activity_nrs.append(pd.Index(keys[keep]))
+                
+                if not processed.empty:
+                    # Use native bulk import (executemany for SQLite, COPY for PostgreSQL)
+                    insert(processed)
+                
+                rows_loaded += len(processed)
+                
+                # Progress logging
+                elapsed = time.time() - start_time
+                if elapsed > 0:
+                    rate = rows_loaded / elapsed
+                    remaining = max(total_rows - rows_loaded, 0) / rate if rate > 0 else 0
+                    pct = min(rows_loaded / total_rows * 100, 100.0) if total_rows > 0 else 0
+                    logger.info(
+                        f"Chunk {chunk_num + 1}: {rows_loaded:,}/{total_rows:,} rows "
+                        f"({pct:.1f}%) | Rate: {rate:.0f} rows/sec | ETA: {remaining/60:.1f} min"
+                    )
         
         if duplicates_removed > 0:
             logger.info(f"Removed {duplicates_removed:,} duplicate inspection records")
@@ -680,42 +1681,36 @@ class DatabaseDataLoader:
         
         logger.info(f"Split into {len(chunk_boundaries)} chunks for parallel processing")
         
+        # Byte offset of each chunk's first row, so workers seek instead of
+        # re-reading the file up to their range (chunk starts are multiples
+        # of chunk_size)
+        row_offsets = _build_csv_row_offsets(csv_path, chunk_size)[:len(chunk_boundaries)]
+        
         # Prepare arguments for workers
         database_url = str(self.db.engine.url)
         worker_args = [
-            (start, end, csv_path, database_url, self.data_dir)
-            for start, end in chunk_boundaries
+            (start, end, offset, csv_path, database_url, self.data_dir)
+            for (start, end), offset in zip(chunk_boundaries, row_offsets)
         ]
         
         # Process in parallel
         start_time = time.time()
-        with mp.Pool(num_workers) as pool:
-            results = pool.map(_parallel_worker_inspections, worker_args)
-        
-        # Sum results
-        total_loaded = sum(results)
+        if "sqlite" in database_url:
+            # Single-writer database: parallel parsing, one inserting thread
+            total_loaded = _load_inspections_single_writer(self.db.bulk_engine, csv_path, chunk_boundaries,
+                                                           row_offsets, num_workers)
+        else:
+            with mp.Pool(num_workers) as pool:
+                results = pool.map(_parallel_worker_inspections, worker_args)
+            
+            # Sum results
+            total_loaded = sum(results)
         total_time = time.time() - start_time
         logger.info(f"Successfully loaded {total_loaded:,} inspections in {total_time/60:.1f} minutes using {num_workers} workers")
     
-    def _process_inspection_chunk(self, chunk_df: pd.DataFrame) -> pd.DataFrame:
-        """Process a chunk of inspection data."""
-        insert_df = pd.DataFrame()
-        insert_df['activity_nr'] = chunk_df['activity_nr'].astype(str).str.strip() if 'activity_nr' in chunk_df.columns else ""
-        insert_df['estab_name'] = chunk_df['estab_name'].astype(str).str[:500] if 'estab_name' in chunk_df.columns else None
-        insert_df['site_state'] = chunk_df['site_state'].astype(str).str.upper().str[:2] if 'site_state' in chunk_df.columns else None
-        insert_df['naics_code'] = chunk_df['naics_code'].astype(str).str[:10] if 'naics_code' in chunk_df.columns else None
-        insert_df['open_date'] = pd.to_datetime(chunk_df['open_date'], errors='coerce') if 'open_date' in chunk_df.columns else None
-        insert_df['close_case_date'] = pd.to_datetime(chunk_df['close_case_date'], errors='coerce') if 'close_case_date' in chunk_df.columns else None
-        insert_df['year'] = pd.to_numeric(chunk_df['year'], errors='coerce').astype('Int64') if 'year' in chunk_df.columns else None
-        if 'year' not in chunk_df.columns and 'open_date' in insert_df.columns:
-            insert_df['year'] = insert_df['open_date'].dt.year if insert_df['open_date'].notna().any() else None
-        insert_df['inspection_type'] = chunk_df['inspection_type'].astype(str).str[:100] if 'inspection_type' in chunk_df.columns else None
-        
-        # Filter out rows with empty activity_nr
-        insert_df = insert_df[insert_df['activity_nr'].str.strip().astype(bool)]
-        insert_df = insert_df.replace('', None)
-        
-        return insert_df
+    def _process_inspection_chunk(self, chunk_df) -> pd.DataFrame:
+        """Process a chunk of inspection data (DataFrame or pyarrow RecordBatch)."""
+        return _process_inspection_chunk_static(chunk_df)
     
     def _process_and_insert_inspections(self, df: pd.DataFrame, session: Session):
         """Process and insert inspections (non-streaming fallback)."""
@@ -728,7 +1723,7 @@ class DatabaseDataLoader:
         
         processed = self._process_inspection_chunk(df)
         if not processed.empty:
-            _bulk_insert_dataframe(self.db.engine, 'inspections', processed, use_native=True)
+            _bulk_insert_dataframe(self.db.bulk_engine, 'inspections', processed, use_native=True)
             logger.info(f"Successfully loaded {len(processed)} inspections")
     
     def load_violations_to_db(self, nrows: Optional[int] = None, force_reload: bool = False, 
@@ -747,202 +1742,206 @@ class DatabaseDataLoader:
             logger.warning(f"No CSV loader implemented for {agency}")
             return
         
-        session = self.db.get_session()
-        try:
-            # Check if data already exists for this agency
-            if not force_reload:
-                existing_count = session.query(Violation).filter(Violation.agency == agency).count()
-                if existing_count > 0:
-                    logger.info(f"Violations table already has {existing_count} {agency} records. Use force_reload=True to reload.")
-                    return
-            
-            # Get CSV file paths
-            violations_csv = DATA_DIR / "osha_violation.csv"
-            inspections_csv = DATA_DIR / "osha_inspection.csv"
-            
-            if not violations_csv.exists():
-                logger.info("Violation CSV file not found, attempting to download...")
-                load_csv_violations(nrows=1)
+        with self.db.bulk_session() as session:
+            try:
+                # Check if data already exists for this agency
+                if not force_reload:
+                    existing_count = session.query(Violation).filter(Violation.agency == agency).count()
+                    if existing_count > 0:
+                        logger.info(f"Violations table already has {existing_count} {agency} records. Use force_reload=True to reload.")
+                        return
+                
+                # Get CSV file paths
+                violations_csv = DATA_DIR / "osha_violation.csv"
+                inspections_csv = DATA_DIR / "osha_inspection.csv"
+                
                 if not violations_csv.exists():
-                    logger.error(f"Violation CSV file not found at {violations_csv}")
-                    return
-            
-            # Load inspections for merging (we'll load this in chunks too if needed)
-            # For now, load a sample to get the merge columns
-            logger.info("Loading inspection data for merging...")
-            inspections_df = None
-            if inspections_csv.exists():
-                # Load inspections in chunks and create a lookup dict
-                inspections_lookup = {}
-                for chunk in pd.read_csv(inspections_csv, chunksize=100000, low_memory=False, nrows=nrows):
-                    inspection_cols = ["activity_nr", "estab_name", "site_state", "naics_code", "open_date", "year"]
-                    available_cols = [c for c in inspection_cols if c in chunk.columns]
-                    for _, row in chunk[available_cols].iterrows():
-                        activity_nr = str(row.get('activity_nr', ''))
-                        if activity_nr:
-                            inspections_lookup[activity_nr] = {
-                                col: row.get(col) for col in available_cols if col != 'activity_nr'
-                            }
-                logger.info(f"Loaded {len(inspections_lookup):,} inspection records for merging")
-            else:
-                logger.warning("Inspection CSV not found, skipping merge")
-            
-            # Optimize SQLite for bulk loading
-            _optimize_sqlite_for_bulk_load(self.db.engine)
-            
-            # Delete existing records for this agency if force_reload
-            if force_reload:
-                existing_count = session.query(Violation).filter(Violation.agency == agency).count()
-                if existing_count > 0:
-                    logger.info(f"Deleting {existing_count} existing {agency} violation records...")
-                    session.query(Violation).filter(Violation.agency == agency).delete()
-                    session.commit()
-            
-            # Drop indexes for faster inserts
-            _drop_table_indexes(self.db.engine, 'violations')
-            
-            if use_streaming:
-                self._load_violations_streaming(violations_csv, inspections_lookup, nrows, chunk_size, agency)
-            else:
-                # Fallback to original method
-                logger.info(f"Loading {agency} violations from CSV (non-streaming mode)...")
-                violations_df = load_csv_violations(nrows=nrows)
-                inspections_df = load_csv_inspections(nrows=nrows)
+                    logger.info("Violation CSV file not found, attempting to download...")
+                    load_csv_violations(nrows=1)
+                    if not violations_csv.exists():
+                        logger.error(f"Violation CSV file not found at {violations_csv}")
+                        return
                 
-                if not violations_df.empty:
-                    if not inspections_df.empty and "activity_nr" in violations_df.columns and "activity_nr" in inspections_df.columns:
-                        inspection_cols = ["activity_nr", "estab_name", "site_state", "naics_code", "open_date", "year"]
-                        available_cols = [c for c in inspection_cols if c in inspections_df.columns]
-                        violations_df = violations_df.merge(
-                            inspections_df[available_cols],
-                            on="activity_nr",
-                            how="left"
+                # Load inspections for merging (we'll load this in chunks too if needed)
+                # For now, load a sample to get the merge columns
+                logger.info("Loading inspection data for merging...")
+                inspections_df = None
+                if inspections_csv.exists():
+                    # Load only the merge columns in chunks, keyed by activity_nr
+                    inspection_cols = ["activity_nr", "estab_name", "site_state", "naics_code", "open_date", "year"]
+                    header = pd.read_csv(inspections_csv, nrows=0).columns
+                    available_cols = [c for c in inspection_cols if c in header]
+                    if 'activity_nr' in available_cols:
+                        inspections_df = pd.concat(
+                            pd.read_csv(inspections_csv, chunksize=200000, usecols=available_cols, engine='c',
+                                        dtype={col: str for col in available_cols}, nrows=nrows),
+                            ignore_index=True
                         )
-                    self._process_and_insert_violations(violations_df, agency)
-            
-            # Recreate indexes
-            _create_table_indexes(self.db.engine, 'violations')
-            
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Error loading violations: {e}")
-            raise
-        finally:
-            session.close()
+                        inspections_df = (
+                            inspections_df.dropna(subset=['activity_nr'])
+                            .drop_duplicates('activity_nr', keep='last')
+                            .set_index('activity_nr')
+                        )
+                        logger.info(f"Loaded {len(inspections_df):,} inspection records for merging")
+                    else:
+                        logger.warning("Inspection CSV has no activity_nr column, skipping merge")
+                else:
+                    logger.warning("Inspection CSV not found, skipping merge")
+                
+                # Optimize SQLite for bulk loading
+                _optimize_sqlite_for_bulk_load(self.db.bulk_engine)
+                
+                # Delete existing records for this agency if force_reload
+                if force_reload:
+                    existing_count = session.query(Violation).filter(Violation.agency == agency).count()
+                    if existing_count > 0:
+                        logger.info(f"Deleting {existing_count} existing {agency} violation records...")
+                        session.query(Violation).filter(Violation.agency == agency).delete()
+                        session.commit()
+                
+                # Drop indexes for faster inserts (rebuilt when the block exits)
+                with self.db.bulk_load_mode([Violation]):
+                    if use_streaming:
+                        self._load_violations_streaming(violations_csv, inspections_df, nrows, chunk_size, agency)
+                    else:
+                        # Fallback to original method
+                        logger.info(f"Loading {agency} violations from CSV (non-streaming mode)...")
+                        violations_df = load_csv_violations(nrows=nrows)
+                        inspections_df = load_csv_inspections(nrows=nrows)
+                        
+                        if not violations_df.empty:
+                            if not inspections_df.empty and "activity_nr" in violations_df.columns and "activity_nr" in inspections_df.columns:
+                                inspection_cols = ["activity_nr", "estab_name", "site_state", "naics_code", "open_date", "year"]
+                                available_cols = [c for c in inspection_cols if c in inspections_df.columns]
+                                violations_df = violations_df.merge(
+                                    inspections_df[available_cols],
+                                    on="activity_nr",
+                                    how="left"
+                                )
+                            self._process_and_insert_violations(violations_df, agency)
+                
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error loading violations: {e}")
+                raise
     
-    def _load_violations_streaming(self, csv_path: Path, inspections_lookup: dict, 
+    def _load_violations_streaming(self, csv_path: Path, inspections_df: Optional[pd.DataFrame], 
                                   nrows: Optional[int], chunk_size: int, agency: str):
         """Load violations using streaming chunks."""
         logger.info(f"Loading {agency} violations from {csv_path.name} using streaming chunks...")
         
-        # Get total row count for progress tracking
-        total_rows = _count_csv_rows(csv_path)
+        # Estimate total row count for progress tracking (avoids a full pass over the file)
+        total_rows = _estimate_csv_rows(csv_path)
         if nrows:
             total_rows = min(total_rows, nrows)
-        logger.info(f"Total rows to load: {total_rows:,}")
+        logger.info(f"Estimated rows to load: ~{total_rows:,}")
         
         rows_loaded = 0
         start_time = time.time()
         
-        # Stream CSV in chunks
-        for chunk_num, chunk_df in enumerate(
-            pd.read_csv(csv_path, chunksize=chunk_size, low_memory=False, nrows=nrows)
-        ):
-            # Merge with inspections lookup
-            if inspections_lookup and 'activity_nr' in chunk_df.columns:
-                chunk_df['estab_name'] = chunk_df['activity_nr'].astype(str).map(
-                    lambda x: inspections_lookup.get(x, {}).get('estab_name')
-                )
-                chunk_df['site_state'] = chunk_df['activity_nr'].astype(str).map(
-                    lambda x: inspections_lookup.get(x, {}).get('site_state')
-                )
-                chunk_df['naics_code'] = chunk_df['activity_nr'].astype(str).map(
-                    lambda x: inspections_lookup.get(x, {}).get('naics_code')
-                )
-                chunk_df['open_date'] = chunk_df['activity_nr'].astype(str).map(
-                    lambda x: inspections_lookup.get(x, {}).get('open_date')
-                )
-                chunk_df['year'] = chunk_df['activity_nr'].astype(str).map(
-                    lambda x: inspections_lookup.get(x, {}).get('year')
-                )
-            
-            # Process and insert chunk
-            processed = self._process_violation_chunk(chunk_df, agency)
-            if not processed.empty:
-                # Use native bulk import (executemany for SQLite, COPY for PostgreSQL)
-                _bulk_insert_dataframe(self.db.engine, 'violations', processed, use_native=True)
-            
-            rows_loaded += len(processed)
-            
-            # Progress logging
-            elapsed = time.time() - start_time
-            if elapsed > 0:
-                rate = rows_loaded / elapsed
-                remaining = (total_rows - rows_loaded) / rate if rate > 0 else 0
-                pct = (rows_loaded / total_rows * 100) if total_rows > 0 else 0
-                logger.info(
-                    f"Chunk {chunk_num + 1}: {rows_loaded:,}/{total_rows:,} rows "
-                    f"({pct:.1f}%) | Rate: {rate:.0f} rows/sec | ETA: {remaining/60:.1f} min"
-                )
+        def processed_chunks():
+            for chunk in _iter_csv_row_range(csv_path, _csv_data_offset(csv_path), nrows, chunk_size,
+                                             usecols=VIOLATION_CSV_COLUMNS,
+                                             newlines_in_values=True):
+                chunk_df = chunk if isinstance(chunk, pd.DataFrame) else chunk.to_pandas()
+                
+                # Merge with inspections (hash join on activity_nr)
+                if inspections_df is not None and not inspections_df.empty and 'activity_nr' in chunk_df.columns:
+                    chunk_df['activity_nr'] = chunk_df['activity_nr'].astype(str)
+                    chunk_df = chunk_df.drop(columns=inspections_df.columns, errors='ignore').join(
+                        inspections_df, on='activity_nr', how='left'
+                    )
+                
+                yield self._process_violation_chunk(chunk_df, agency)
+        
+        # Stream CSV in chunks (string-typed, parsed by pyarrow when available),
+        # inserting every chunk in one transaction while the next one is parsed,
+        # merged and processed on a background thread
+        with bulk_insert_session(self.db.bulk_engine, 'violations') as insert:
+            for chunk_num, processed in enumerate(_prefetch(processed_chunks())):
+                if not processed.empty:
+                    # Use native bulk import (executemany for SQLite, COPY for PostgreSQL)
+                    insert(processed)
+                
+                rows_loaded += len(processed)
+                
+                # Progress logging
+                elapsed = time.time() - start_time
+                if elapsed > 0:
+                    rate = rows_loaded / elapsed
+                    remaining = max(total_rows - rows_loaded, 0) / rate if rate > 0 else 0
+                    pct = min(rows_loaded / total_rows * 100, 100.0) if total_rows > 0 else 0
+                    logger.info(
+                        f"Chunk {chunk_num + 1}: {rows_loaded:,}/{total_rows:,} rows "
+                        f"({pct:.1f}%) | Rate: {rate:.0f} rows/sec | ETA: {remaining/60:.1f} min"
+                    )
         
         total_time = time.time() - start_time
         logger.info(f"Successfully loaded {rows_loaded:,} {agency} violations in {total_time/60:.1f} minutes")
     
     def _process_violation_chunk(self, chunk_df: pd.DataFrame, agency: str) -> pd.DataFrame:
         """Process a chunk of violation data."""
-        # Create DataFrame with agency column first (ensure it matches chunk length)
-        insert_df = pd.DataFrame(index=chunk_df.index)
-        insert_df['agency'] = agency  # This will broadcast to all rows
+        # Build every column first, then the DataFrame once (agency column
+        # first; scalars broadcast to the chunk's length)
+        cols = {'agency': agency}
         
         # Company name and normalized name (vectorized)
         if 'estab_name' in chunk_df.columns:
             company_names = chunk_df['estab_name'].fillna('').astype(str)
-            insert_df['company_name'] = company_names.str[:500].replace('', None)
+            cols['company_name'] = company_names.str[:500]
             # Vectorized normalization (much faster!)
-            insert_df['company_name_normalized'] = _normalize_company_name_vectorized(company_names).str[:500].replace('', None)
+            cols['company_name_normalized'] = _normalize_company_name_vectorized(company_names).str[:500]
         else:
-            insert_df['company_name'] = None
-            insert_df['company_name_normalized'] = None
+            cols['company_name'] = None
+            cols['company_name_normalized'] = None
         
         # Other fields with vectorized operations
-        insert_df['activity_nr'] = chunk_df['activity_nr'].astype(str).str[:50] if 'activity_nr' in chunk_df.columns else None
-        insert_df['standard'] = chunk_df['standard'].astype(str).str[:50] if 'standard' in chunk_df.columns else None
-        insert_df['viol_type'] = chunk_df['viol_type'].astype(str).str[:50] if 'viol_type' in chunk_df.columns else None
-        insert_df['description'] = chunk_df['description'].astype(str).str[:10000] if 'description' in chunk_df.columns else None
+        cols['activity_nr'] = chunk_df['activity_nr'].astype(str).str[:50] if 'activity_nr' in chunk_df.columns else None
+        cols['standard'] = chunk_df['standard'].astype(str).str[:50] if 'standard' in chunk_df.columns else None
+        cols['viol_type'] = chunk_df['viol_type'].astype(str).str[:50] if 'viol_type' in chunk_df.columns else None
+        cols['description'] = chunk_df['description'].astype(str).str[:10000] if 'description' in chunk_df.columns else None
         
-        # Penalty fields
-        insert_df['initial_penalty'] = pd.to_numeric(chunk_df['initial_penalty'], errors='coerce') if 'initial_penalty' in chunk_df.columns else None
-        insert_df['current_penalty'] = pd.to_numeric(chunk_df['current_penalty'], errors='coerce') if 'current_penalty' in chunk_df.columns else None
-        insert_df['fta_penalty'] = pd.to_numeric(chunk_df['fta_penalty'], errors='coerce') if 'fta_penalty' in chunk_df.columns else None
+        # Penalty fields (non-numeric values become null)
+        for col in VIOLATION_PENALTY_COLUMNS:
+            cols[col] = pd.to_numeric(chunk_df[col], errors='coerce') if col in chunk_df.columns else None
         
         # Location and industry
-        insert_df['site_state'] = chunk_df['site_state'].astype(str).str[:2] if 'site_state' in chunk_df.columns else None
-        insert_df['site_city'] = chunk_df['site_city'].astype(str).str[:100] if 'site_city' in chunk_df.columns else None
-        insert_df['naics_code'] = chunk_df['naics_code'].astype(str).str[:10] if 'naics_code' in chunk_df.columns else None
-        insert_df['sic_code'] = chunk_df['sic_code'].astype(str).str[:10] if 'sic_code' in chunk_df.columns else None
+        cols['site_state'] = chunk_df['site_state'].astype(str).str[:2] if 'site_state' in chunk_df.columns else None
+        cols['site_city'] = chunk_df['site_city'].astype(str).str[:100] if 'site_city' in chunk_df.columns else None
+        cols['naics_code'] = chunk_df['naics_code'].astype(str).str[:10] if 'naics_code' in chunk_df.columns else None
+        cols['sic_code'] = chunk_df['sic_code'].astype(str).str[:10] if 'sic_code' in chunk_df.columns else None
         
         # Dates
-        insert_df['violation_date'] = pd.to_datetime(chunk_df['open_date'], errors='coerce') if 'open_date' in chunk_df.columns else None
+        cols['violation_date'] = _parse_dates(chunk_df['open_date']) if 'open_date' in chunk_df.columns else None
         # Extract year from year column if available, otherwise derive from violation_date
-        insert_df['year'] = pd.to_numeric(chunk_df['year'], errors='coerce').astype('Int64') if 'year' in chunk_df.columns else None
-        if insert_df['year'].isna().all() and insert_df['violation_date'].notna().any():
-            insert_df['year'] = insert_df['violation_date'].dt.year.astype('Int64')
+        cols['year'] = pd.to_numeric(chunk_df['year'], errors='coerce').astype('Int64') if 'year' in chunk_df.columns else None
+        if _all_missing(cols['year']) and not _all_missing(cols['violation_date']):
+            cols['year'] = cols['violation_date'].dt.year.astype('Int64')
         
-        # Replace empty strings with None
-        insert_df = insert_df.replace('', None)
-        
-        return insert_df
+        # Empty strings become None (text columns only)
+        return pd.DataFrame(_empty_strings_to_none(cols), index=chunk_df.index)
     
     def _process_and_insert_violations(self, violations_df: pd.DataFrame, agency: str):
         """Process and insert violations (non-streaming fallback)."""
         processed = self._process_violation_chunk(violations_df, agency)
         if not processed.empty:
-            _bulk_insert_dataframe(self.db.engine, 'violations', processed, use_native=True)
+            _bulk_insert_dataframe(self.db.bulk_engine, 'violations', processed, use_native=True)
             logger.info(f"Successfully loaded {len(processed)} {agency} violations")
     
     def load_accidents_to_db(self, nrows: Optional[int] = None, force_reload: bool = False,
-                             use_streaming: bool = True, chunk_size: int = 50000):
-        """Load accidents from CSV into database (optimized streaming version)."""
+                             use_streaming: bool = True, chunk_size: int = 50000,
+                             use_parallel: bool = False, num_workers: Optional[int] = None):
+        """
+        Load accidents from CSV into database (optimized streaming version).
+        
+        Args:
+            nrows: Limit number of rows (for testing)
+            force_reload: If True, reload even if data exists
+            use_streaming: If True, use streaming chunked loading (recommended)
+            chunk_size: Number of rows per chunk for streaming
+            use_parallel: If True, process chunks in parallel worker processes
+            num_workers: Number of worker processes (default: auto-detect)
+        """
         # Check if data already exists
         existing_count = self.db.get_table_row_count("accidents")
         if existing_count > 0 and not force_reload:
@@ -959,189 +1958,126 @@ class DatabaseDataLoader:
                 return
         
         # Optimize SQLite for bulk loading
-        _optimize_sqlite_for_bulk_load(self.db.engine)
+        _optimize_sqlite_for_bulk_load(self.db.bulk_engine)
         
-        session = self.db.get_session()
-        try:
-            # Delete existing records if force_reload
-            if force_reload and existing_count > 0:
-                logger.info(f"Deleting {existing_count} existing accident records...")
-                session.query(Accident).delete()
-                session.commit()
-            
-            # Drop indexes for faster inserts (accidents use single-column indexes, handled by SQLAlchemy)
-            # No composite indexes to drop for accidents
-            
-            if use_streaming:
-                self._load_accidents_streaming(csv_path, nrows, chunk_size)
-            else:
-                # Fallback to original method
-                logger.info("Loading accidents from CSV (non-streaming mode)...")
-                df = load_csv_accidents(nrows=nrows)
-                if not df.empty:
-                    self._process_and_insert_accidents(df)
-            
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Error loading accidents: {e}")
-            raise
-        finally:
-            session.close()
+        with self.db.bulk_session() as session:
+            try:
+                # Delete existing records if force_reload
+                if force_reload and existing_count > 0:
+                    logger.info(f"Deleting {existing_count} existing accident records...")
+                    session.query(Accident).delete()
+                    session.commit()
+                
+                # Drop indexes for faster inserts (rebuilt when the block exits)
+                with self.db.bulk_load_mode([Accident]):
+                    if use_parallel and use_streaming:
+                        if num_workers is None:
+                            num_workers = min(mp.cpu_count(), 8)  # Cap at 8 workers
+                        self._load_accidents_parallel(csv_path, nrows, chunk_size, num_workers)
+                    elif use_streaming:
+                        self._load_accidents_streaming(csv_path, nrows, chunk_size)
+                    else:
+                        # Fallback to original method
+                        logger.info("Loading accidents from CSV (non-streaming mode)...")
+                        df = load_csv_accidents(nrows=nrows)
+                        if not df.empty:
+                            self._process_and_insert_accidents(df)
+                
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error loading accidents: {e}")
+                raise
     
     def _load_accidents_streaming(self, csv_path: Path, nrows: Optional[int], chunk_size: int):
         """Load accidents using streaming chunks."""
         logger.info(f"Loading accidents from {csv_path.name} using streaming chunks...")
         
-        # Get total row count for progress tracking
-        total_rows = _count_csv_rows(csv_path)
+        # Estimate total row count for progress tracking (avoids a full pass over the file)
+        total_rows = _estimate_csv_rows(csv_path)
         if nrows:
             total_rows = min(total_rows, nrows)
-        logger.info(f"Total rows to load: {total_rows:,}")
+        logger.info(f"Estimated rows to load: ~{total_rows:,}")
         
         rows_loaded = 0
         start_time = time.time()
         
-        # Stream CSV in chunks
-        for chunk_num, chunk_df in enumerate(
-            pd.read_csv(csv_path, chunksize=chunk_size, low_memory=False, nrows=nrows)
-        ):
-            # Process and insert chunk
-            processed = self._process_accident_chunk(chunk_df)
-            if not processed.empty:
-                # Use native bulk import (executemany for SQLite, COPY for PostgreSQL)
-                _bulk_insert_dataframe(self.db.engine, 'accidents', processed, use_native=True)
-            
-            rows_loaded += len(processed)
-            
-            # Progress logging
-            elapsed = time.time() - start_time
-            if elapsed > 0:
-                rate = rows_loaded / elapsed
-                remaining = (total_rows - rows_loaded) / rate if rate > 0 else 0
-                pct = (rows_loaded / total_rows * 100) if total_rows > 0 else 0
-                logger.info(
-                    f"Chunk {chunk_num + 1}: {rows_loaded:,}/{total_rows:,} rows "
-                    f"({pct:.1f}%) | Rate: {rate:.0f} rows/sec | ETA: {remaining/60:.1f} min"
-                )
+        # Stream CSV in chunks, inserting every chunk in one transaction while
+        # the next one is parsed and processed on a background thread
+        chunks = _read_accident_chunks(csv_path, nrows, chunk_size)
+        with bulk_insert_session(self.db.bulk_engine, 'accidents') as insert:
+            for chunk_num, processed in enumerate(
+                _prefetch(self._process_accident_chunk(chunk_df) for chunk_df in chunks)
+            ):
+                if not processed.empty:
+                    # Use native bulk import (executemany for SQLite, COPY for PostgreSQL)
+                    insert(processed)
+                
+                rows_loaded += len(processed)
+                
+                # Progress logging
+                elapsed = time.time() - start_time
+                if elapsed > 0:
+                    rate = rows_loaded / elapsed
+                    remaining = max(total_rows - rows_loaded, 0) / rate if rate > 0 else 0
+                    pct = min(rows_loaded / total_rows * 100, 100.0) if total_rows > 0 else 0
+                    logger.info(
+                        f"Chunk {chunk_num + 1}: {rows_loaded:,}/{total_rows:,} rows "
+                        f"({pct:.1f}%) | Rate: {rate:.0f} rows/sec | ETA: {remaining/60:.1f} min"
+                    )
         
         total_time = time.time() - start_time
         logger.info(f"Successfully loaded {rows_loaded:,} accidents in {total_time/60:.1f} minutes")
     
-    def _process_accident_chunk(self, chunk_df: pd.DataFrame) -> pd.DataFrame:
-        """Process a chunk of accident data.
+    def _load_accidents_parallel(self, csv_path: Path, nrows: Optional[int], chunk_size: int,
+                                 num_workers: int):
+        """
+        Load accidents with chunk processing spread over worker processes.
         
-        Handles multiple formats:
-        - OSHA standard format (accident_key, activity_nr, etc.)
-        - OSHA fatality report format (summary_nr, event_date, etc.)
-        - MSHA format (mine safety data)
+        The calling thread reads CSV chunks and submits each one to a process
+        pool; processed chunks are inserted in file order on the calling
+        thread in a single transaction, so parsing, processing and inserting
+        overlap and the single-writer constraint of SQLite is respected. At
+        most two chunks per worker are in flight, bounding memory use.
         """
-        insert_df = pd.DataFrame()
-        
-        # Detect format type
-        is_msha_format = 'mine_id' in chunk_df.columns and 'ai_dt' in chunk_df.columns
-        is_osha_fatality_format = 'summary_nr' in chunk_df.columns and 'event_date' in chunk_df.columns
-        
-        if is_msha_format:
-            # MSHA format mapping
-            # Create unique accident_key from mine_id and document_no
-            if 'mine_id' in chunk_df.columns and 'document_no' in chunk_df.columns:
-                insert_df['accident_key'] = (chunk_df['mine_id'].astype(str) + '_' + 
-                                            chunk_df['document_no'].astype(str)).str[:50]
-            elif 'mine_id' in chunk_df.columns:
-                insert_df['accident_key'] = chunk_df['mine_id'].astype(str).str[:50]
-            else:
-                insert_df['accident_key'] = None
-            
-            insert_df['activity_nr'] = None  # MSHA doesn't link to OSHA inspections
-            insert_df['estab_name'] = chunk_df['operator_name'].astype(str).str[:500] if 'operator_name' in chunk_df.columns else None
-            # FIPS state code - using first 2 digits (may need proper mapping to state abbreviations)
-            insert_df['site_state'] = chunk_df['fips_state_cd'].astype(str).str[:2] if 'fips_state_cd' in chunk_df.columns else None
-            insert_df['naics_code'] = None  # MSHA doesn't have NAICS codes
-            insert_df['accident_date'] = pd.to_datetime(chunk_df['ai_dt'], errors='coerce') if 'ai_dt' in chunk_df.columns else None
-            # Extract year from ai_year, cal_yr, or accident_date (in order of preference)
-            insert_df['year'] = pd.to_numeric(chunk_df['ai_year'], errors='coerce').astype('Int64') if 'ai_year' in chunk_df.columns else None
-            if insert_df['year'].isna().all() and 'cal_yr' in chunk_df.columns:
-                insert_df['year'] = pd.to_numeric(chunk_df['cal_yr'], errors='coerce').astype('Int64')
-            if insert_df['year'].isna().all() and insert_df['accident_date'].notna().any():
-                insert_df['year'] = insert_df['accident_date'].dt.year
-            insert_df['description'] = chunk_df['ai_narr'].astype(str).str[:10000] if 'ai_narr' in chunk_df.columns else None
-            # Determine fatality from injury degree description or code
-            if 'inj_degr_desc' in chunk_df.columns:
-                insert_df['fatality'] = chunk_df['inj_degr_desc'].astype(str).str.contains('FATAL', case=False, na=False)
-            elif 'degree_injury_cd' in chunk_df.columns:
-                # Code 1 typically indicates fatality in MSHA data
-                insert_df['fatality'] = (chunk_df['degree_injury_cd'] == 1) if chunk_df['degree_injury_cd'].notna().any() else False
-            else:
-                insert_df['fatality'] = False
-            # Use nature_injury if available, otherwise fall back to inj_degr_desc
-            if 'nature_injury' in chunk_df.columns:
-                insert_df['injury_type'] = chunk_df['nature_injury'].astype(str).str[:100]
-            elif 'inj_degr_desc' in chunk_df.columns:
-                insert_df['injury_type'] = chunk_df['inj_degr_desc'].astype(str).str[:100]
-            else:
-                insert_df['injury_type'] = None
-        elif is_osha_fatality_format:
-            # OSHA fatality report format (summary_nr, event_date, event_desc, etc.)
-            insert_df['accident_key'] = chunk_df['summary_nr'].astype(str).str[:50] if 'summary_nr' in chunk_df.columns else None
-            insert_df['activity_nr'] = None  # Fatality reports don't link to inspections
-            insert_df['estab_name'] = None  # Not available in this format
-            insert_df['site_state'] = chunk_df['state_flag'].astype(str).str[:2] if 'state_flag' in chunk_df.columns else None
-            insert_df['naics_code'] = None  # Not available in this format
-            insert_df['accident_date'] = pd.to_datetime(chunk_df['event_date'], errors='coerce') if 'event_date' in chunk_df.columns else None
-            insert_df['year'] = None
-            if insert_df['accident_date'].notna().any():
-                insert_df['year'] = insert_df['accident_date'].dt.year
-            # Combine event_desc and abstract_text for description
-            if 'event_desc' in chunk_df.columns and 'abstract_text' in chunk_df.columns:
-                # Combine both columns, handling NaN values
-                event_desc = chunk_df['event_desc'].astype(str).replace('nan', '')
-                abstract_text = chunk_df['abstract_text'].astype(str).replace('nan', '')
-                combined = event_desc + ' | ' + abstract_text
-                # Remove trailing separator if abstract_text is empty
-                combined = combined.str.replace(' | $', '', regex=True)
-                insert_df['description'] = combined.str[:10000]
-            elif 'event_desc' in chunk_df.columns:
-                insert_df['description'] = chunk_df['event_desc'].astype(str).str[:10000]
-            elif 'abstract_text' in chunk_df.columns:
-                insert_df['description'] = chunk_df['abstract_text'].astype(str).str[:10000]
-            else:
-                insert_df['description'] = None
-            # Fatality field - 'X' indicates fatality
-            if 'fatality' in chunk_df.columns:
-                insert_df['fatality'] = (chunk_df['fatality'].astype(str).str.upper() == 'X')
-            else:
-                insert_df['fatality'] = False
-            insert_df['injury_type'] = chunk_df['event_keyword'].astype(str).str[:100] if 'event_keyword' in chunk_df.columns else None
-        else:
-            # OSHA standard format (original expected format)
-            insert_df['accident_key'] = chunk_df['accident_key'].astype(str).str[:50] if 'accident_key' in chunk_df.columns else None
-            insert_df['activity_nr'] = chunk_df['activity_nr'].astype(str).str[:50] if 'activity_nr' in chunk_df.columns else None
-            insert_df['estab_name'] = chunk_df['estab_name'].astype(str).str[:500] if 'estab_name' in chunk_df.columns else None
-            insert_df['site_state'] = chunk_df['site_state'].astype(str).str[:2] if 'site_state' in chunk_df.columns else None
-            insert_df['naics_code'] = chunk_df['naics_code'].astype(str).str[:10] if 'naics_code' in chunk_df.columns else None
-            insert_df['accident_date'] = pd.to_datetime(chunk_df['accident_date'], errors='coerce') if 'accident_date' in chunk_df.columns else None
-            # Extract year from year column or derive from accident_date
-            insert_df['year'] = pd.to_numeric(chunk_df['year'], errors='coerce').astype('Int64') if 'year' in chunk_df.columns else None
-            if insert_df['year'].isna().all() and insert_df['accident_date'].notna().any():
-                insert_df['year'] = insert_df['accident_date'].dt.year
-            insert_df['description'] = chunk_df['description'].astype(str).str[:10000] if 'description' in chunk_df.columns else None
-            insert_df['fatality'] = pd.to_numeric(chunk_df['fatality'], errors='coerce').astype('boolean') if 'fatality' in chunk_df.columns else None
-            insert_df['injury_type'] = chunk_df['injury_type'].astype(str).str[:100] if 'injury_type' in chunk_df.columns else None
-        
-        # Filter out rows with missing accident_key (required field)
-        if 'accident_key' in insert_df.columns:
-            insert_df = insert_df[insert_df['accident_key'].notna()]
-        
-        # Replace empty strings with None
-        insert_df = insert_df.replace('', None)
-        
-        return insert_df
+        logger.info(f"Loading accidents from {csv_path.name} using {num_workers} parallel workers...")
+        
+        total_rows = _estimate_csv_rows(csv_path)
+        if nrows:
+            total_rows = min(total_rows, nrows)
+        logger.info(f"Estimated rows to load: ~{total_rows:,}")
+        
+        rows_loaded = 0
+        start_time = time.time()
+        pending = deque()
+        
+        def insert_oldest(insert):
+            nonlocal rows_loaded
+            processed = pending.popleft().result()
+            if not processed.empty:
+                insert(processed)
+            rows_loaded += len(processed)
+        
+        with ProcessPoolExecutor(max_workers=num_workers) as executor, \
+                bulk_insert_session(self.db.bulk_engine, 'accidents') as insert:
+            for chunk_df in _read_accident_chunks(csv_path, nrows, chunk_size):
+                pending.append(executor.submit(_process_accident_chunk_static, chunk_df))
+                if len(pending) >= 2 * num_workers:
+                    insert_oldest(insert)
+            while pending:
+                insert_oldest(insert)
+        
+        total_time = time.time() - start_time
+        logger.info(f"Successfully loaded {rows_loaded:,} accidents in {total_time/60:.1f} minutes using {num_workers} workers")
+    
+    def _process_accident_chunk(self, chunk_df: pd.DataFrame) -> pd.DataFrame:
+        """Process a chunk of accident data."""
+        return _process_accident_chunk_static(chunk_df)
     
     def _process_and_insert_accidents(self, df: pd.DataFrame):
         """Process and insert accidents (non-streaming fallback)."""
         processed = self._process_accident_chunk(df)
         if not processed.empty:
-            _bulk_insert_dataframe(self.db.engine, 'accidents', processed, use_native=True)
+            _bulk_insert_dataframe(self.db.bulk_engine, 'accidents', processed, use_native=True)
             logger.info(f"Successfully loaded {len(processed)} accidents")
     
     def load_all_data(self, nrows: Optional[int] = None, force_reload: bool = False,
@@ -1162,13 +2098,12 @@ class DatabaseDataLoader:
         
         # Default to all tables if not specified
         if tables is None:
-            tables = ['inspections', 'violations', 'accidents']
+            tables = list(LOADABLE_TABLES)
         
         # Validate table names
-        valid_tables = ['inspections', 'violations', 'accidents']
-        invalid_tables = [t for t in tables if t not in valid_tables]
+        invalid_tables = set(tables).difference(LOADABLE_TABLES)
         if invalid_tables:
-            raise ValueError(f"Invalid table names: {invalid_tables}. Valid options: {valid_tables}")
+            raise ValueError(f"Invalid table names: {sorted(invalid_tables)}. Valid options: {list(LOADABLE_TABLES)}")
         
         logger.info(f"Loading data into database (tables: {', '.join(tables)})...")
         
@@ -1192,91 +2127,131 @@ class DatabaseDataLoader:
             logger.warning("SQLite detected: Reducing workers to 4 to avoid database lock issues")
             num_workers = 4
         
+        # PostgreSQL: the tables are independent, so they load concurrently on
+        # separate connections, sharing the worker budget. SQLite keeps the
+        # serial order since it allows a single writer at a time.
+        concurrent_tables = not is_sqlite and len(tables) > 1
+        table_workers = num_workers
+        if concurrent_tables and num_workers:
+            table_workers = max(1, num_workers // len(tables))
+        
+        loads = []
         # Load inspections (can use parallel)
         if 'inspections' in tables:
-            self.load_inspections_to_db(
+            loads.append(partial(
+                self.load_inspections_to_db,
                 nrows=nrows, 
                 force_reload=force_reload,
                 use_streaming=True,
                 use_parallel=use_parallel,
-                num_workers=num_workers
-            )
+                num_workers=table_workers
+            ))
         
         # Load violations (streaming only for now, parallel can be added later)
         if 'violations' in tables:
-            self.load_violations_to_db(
+            loads.append(partial(
+                self.load_violations_to_db,
                 nrows=nrows, 
                 force_reload=force_reload, 
                 agency="OSHA",
                 use_streaming=True
-            )
+            ))
         
-        # Load accidents (streaming only for now)
+        # Load accidents (can use parallel)
         if 'accidents' in tables:
-            self.load_accidents_to_db(
+            loads.append(partial(
+                self.load_accidents_to_db,
                 nrows=nrows, 
                 force_reload=force_reload,
-                use_streaming=True
-            )
+                use_streaming=True,
+                use_parallel=use_parallel,
+                num_workers=table_workers
+            ))
+        
+        # Drop indexes once for the whole run; every table's indexes are
+        # rebuilt in a single pass after all loads instead of per table.
+        # Tables whose loader will skip them (already populated) keep theirs.
+        table_models = {'inspections': Inspection, 'violations': Violation, 'accidents': Accident}
+        loading = [t for t in tables if force_reload or not self._has_loaded_data(t)]
+        with self.db.bulk_load_mode([table_models[t] for t in loading]):
+            if concurrent_tables:
+                logger.info(f"Loading {len(loads)} tables concurrently ({table_workers} workers each)")
+                with ThreadPoolExecutor(max_workers=len(loads)) as executor:
+                    futures = [executor.submit(load) for load in loads]
+                    for future in futures:
+                        future.result()
+            else:
+                for load in loads:
+                    load()
         
         logger.info("Data loading complete!")
     
+    def _has_loaded_data(self, table: str) -> bool:
+        """Whether the table's loader would skip it as already loaded (see the load_*_to_db checks)."""
+        if table == 'violations':
+            session = self.db.get_session()
+            try:
+                return session.query(Violation).filter(Violation.agency == "OSHA").count() > 0
+            finally:
+                session.close()
+        return self.db.get_table_row_count(table) > 0
+    
     # ========================================================================
     # QUERY METHODS - PUBLIC API
     # ========================================================================
     
-    def query_inspections(self, limit: Optional[int] = None, **filters) -> pd.DataFrame:
+    def query_inspections(self, limit: Optional[int] = None, year: Optional[int] = None,
+                          state: Optional[str] = None, naics_code: Optional[str] = None) -> pd.DataFrame:
         """Query inspections from database."""
         session = self.db.get_session()
         try:
             query = session.query(Inspection)
             
             # Apply filters
-            if "year" in filters and filters["year"]:
-                query = query.filter(Inspection.year == filters["year"])
-            if "state" in filters and filters["state"]:
-                query = query.filter(Inspection.site_state == filters["state"].upper())
-            if "naics_code" in filters and filters["naics_code"]:
-                query = query.filter(Inspection.naics_code.like(f"{filters['naics_code']}%"))
+            if year:
+                query = query.filter(Inspection.year == year)
+            if state:
+                query = query.filter(Inspection.site_state == state.upper())
+            if naics_code:
+                query = query.filter(Inspection.naics_code.startswith(naics_code))
             
             if limit:
                 query = query.limit(limit)
             
-            df = pd.read_sql(query.statement, session.bind)
-            return df
+            return _read_query_with_bulk_dates(query, session, Inspection)
         finally:
             session.close()
     
-    def query_violations(self, limit: Optional[int] = None, **filters) -> pd.DataFrame:
+    def query_violations(self, limit: Optional[int] = None, agency: Optional[str] = None,
+                         company_name: Optional[str] = None, year: Optional[int] = None,
+                         state: Optional[str] = None, min_penalty: Optional[float] = None) -> pd.DataFrame:
         """Query violations from database."""
         session = self.db.get_session()
         try:
             query = session.query(Violation)
             
             # Apply filters
-            if "agency" in filters and filters["agency"]:
-                query = query.filter(Violation.agency == filters["agency"])
-            if "company_name" in filters and filters["company_name"]:
-                from .fuzzy_matcher import CompanyNameMatcher
+            if agency:
+                query = query.filter(Violation.agency == agency)
+            if company_name:
                 from sqlalchemy import func
-                normalized = CompanyNameMatcher().normalize_company_name(filters["company_name"])
-                company_name_lower = filters["company_name"].lower()
+                # Both conditions are served by the trigram indexes on PostgreSQL
+                normalized = _get_company_name_matcher().normalize_company_name(company_name)
                 query = query.filter(
                     (Violation.company_name_normalized.contains(normalized)) |
-                    (func.lower(Violation.company_name).like(f"%{company_name_lower}%"))
+                    (func.lower(Violation.company_name).contains(company_name.lower()))
                 )
-            if "year" in filters and filters["year"]:
-                query = query.filter(Violation.year == filters["year"])
-            if "state" in filters and filters["state"]:
-                query = query.filter(Violation.site_state == filters["state"].upper())
-            if "min_penalty" in filters and filters["min_penalty"]:
-                query = query.filter(Violation.current_penalty >= filters["min_penalty"])
+            if year:
+                query = query.filter(Violation.year == year)
+            if state:
+                query = query.filter(Violation.site_state == state.upper())
+            if min_penalty:
+                query = query.filter(Violation.current_penalty >= min_penalty)
             
             if limit:
                 query = query.limit(limit)
             
-            df = pd.read_sql(query.statement, session.bind)
-            return df
+            return _read_query_with_bulk_dates(query, session, Violation)
         finally:
             session.close()
 
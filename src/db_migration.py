@@ -7,7 +7,7 @@ import argparse
 import logging
 from pathlib import Path
 from .database import get_db_manager, reset_db_manager
-from .db_loader import DatabaseDataLoader
+from .db_loader import DatabaseDataLoader, LOADABLE_TABLES
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -101,7 +101,7 @@ def main():
         '--tables',
         type=str,
         nargs='+',
-        choices=['inspections', 'violations', 'accidents'],
+        choices=LOADABLE_TABLES,
         default=None,
         help='Selective reload: specify which tables to load (e.g., --tables accidents). '
              'If not specified, all tables are loaded.'
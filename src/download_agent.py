@@ -4,11 +4,17 @@ Uses ChatGPT/OpenAI to help find and download OSHA data files.
 """
 
 import os
+import hashlib
+import time
 import requests
 from pathlib import Path
 import zipfile
 from typing import List, Dict, Optional, Tuple
 import json
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tempfile import SpooledTemporaryFile
 from urllib.parse import urljoin, urlparse
 
 try:
@@ -27,6 +33,49 @@ except ImportError:
 DATA_DIR = Path(__file__).parent.parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
+# Downloads are buffered in memory up to this size, then spill to a temp file
+DOWNLOAD_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# On-disk cache of AI URL suggestions
+AI_CACHE_DIR = DATA_DIR / ".ai_cache"
+AI_CACHE_TTL_SECONDS = 24 * 3600
+
+
+def _cache_key(model: str, messages: List[Dict[str, str]]) -> str:
+    """Cache key for an AI request: hash of the model and messages."""
+    payload = json.dumps({"model": model, "messages": messages}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_cached_json(path: Path, ttl: int) -> Optional[dict]:
+    """Load a cached JSON object, or None if missing, unreadable, not an object or older than ttl seconds."""
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_cached_json(path: Path, data: dict):
+    """Write a JSON response to the cache atomically (temp file + os.replace); failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠ Could not cache AI suggestions: {e}")
+
+
+def _close_download_buffer(future):
+    """Done-callback closing the buffer of a download attempt that lost the race."""
+    if not future.cancelled() and future.exception() is None and future.result() is not None:
+        future.result().close()
+
 
 class DownloadAgent:
     """AI-powered agent to help download OSHA data files."""
@@ -53,10 +102,16 @@ class DownloadAgent:
         
         self.client = OpenAI(api_key=self.api_key)
     
-    def search_download_urls(self) -> Dict[str, List[str]]:
+    def search_download_urls(self, refresh: bool = False) -> Dict[str, List[str]]:
         """
         Use AI to search for current OSHA data download URLs.
         
+        Suggestions are cached on disk for AI_CACHE_TTL_SECONDS, keyed by the
+        model and prompt, so reruns skip the API call.
+        
+        Args:
+            refresh: If True, ignore any cached suggestions and ask the AI again
+        
         Returns:
             Dictionary with potential URLs for each data type
         """
@@ -93,13 +148,24 @@ Please respond with a JSON object in this format:
 Include the most likely current URLs based on typical government data portal structures.
 """
 
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant that finds government data download URLs. Always respond with valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+        cache_path = AI_CACHE_DIR / f"{_cache_key(self.model, messages)}.json"
+        
+        if not refresh:
+            urls_dict = _read_cached_json(cache_path, AI_CACHE_TTL_SECONDS)
+            if urls_dict is not None:
+                print("✓ Using cached AI suggested URLs (--refresh-urls asks again):")
+                for data_type, urls in urls_dict.items():
+                    print(f"  {data_type}: {len(urls)} URLs found")
+                return urls_dict
+        
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that finds government data download URLs. Always respond with valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=0.3,
                 response_format={"type": "json_object"}
             )
@@ -111,6 +177,7 @@ Include the most likely current URLs based on typical government data portal str
             for data_type, urls in urls_dict.items():
                 print(f"  {data_type}: {len(urls)} URLs found")
             
+            _write_cached_json(cache_path, urls_dict)
             return urls_dict
             
         except Exception as e:
@@ -158,46 +225,121 @@ Format the response as clear markdown with numbered steps.
         """
         Try to download from a list of URLs.
         
+        The URLs are tried concurrently; the first one to finish downloading a
+        file wins and the other attempts are stopped. Zip downloads are
+        extracted straight from the downloaded buffer (see _save_download).
+        
         Returns:
             (success: bool, successful_url: Optional[str])
         """
-        for url in urls:
-            try:
-                print(f"  Trying: {url[:80]}...")
-                response = requests.get(url, stream=True, timeout=30, allow_redirects=True)
+        if not urls:
+            return False, None
+        
+        stop = threading.Event()
+        
+        # Not a with-block: leaving one would wait for every losing attempt,
+        # including any still connecting (up to its request timeout)
+        executor = ThreadPoolExecutor(max_workers=min(len(urls), 8))
+        try:
+            futures = {executor.submit(self._probe_and_fetch, url, stop): url for url in urls}
+            for future in as_completed(futures):
+                buffer = future.result()
+                if buffer is None:
+                    continue
                 
-                if response.status_code == 200:
-                    filepath = DATA_DIR / filename
-                    
-                    # Check if it's actually a file or a redirect to a page
-                    content_type = response.headers.get('content-type', '')
-                    content_length = response.headers.get('content-length')
-                    
-                    if 'text/html' in content_type and content_length and int(content_length) < 100000:
-                        # Likely an HTML page, not a file
-                        print(f"    ✗ URL returns HTML page, not a file")
-                        continue
-                    
-                    with open(filepath, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    
-                    file_size = filepath.stat().st_size / (1024 * 1024)
-                    print(f"    ✓ Successfully downloaded ({file_size:.1f} MB)")
-                    
-                    return True, url
-                else:
-                    print(f"    ✗ HTTP {response.status_code}")
+                stop.set()
+                # Attempts finishing after the winner close their own buffers
+                for other in futures:
+                    if other is not future:
+                        other.add_done_callback(_close_download_buffer)
+                executor.shutdown(wait=False, cancel_futures=True)
+                
+                with buffer:
+                    file_size = buffer.seek(0, os.SEEK_END) / (1024 * 1024)
+                    print(f"    ✓ Successfully downloaded from {futures[future][:80]} ({file_size:.1f} MB)")
+                    self._save_download(buffer, DATA_DIR / filename)
+                return True, futures[future]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return False, None
+    
+    def _probe_and_fetch(self, url: str, stop: threading.Event) -> Optional[SpooledTemporaryFile]:
+        """
+        Download one URL into a spooled temporary file.
+        
+        Returns:
+            The buffer holding the body, or None if the URL failed or ``stop``
+            was set (another URL won) before it finished
+        """
+        if stop.is_set():
+            return None
+        
+        buffer = SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_SIZE)
+        try:
+            print(f"  Trying: {url[:80]}...")
+            # stream=True reads only the headers here; closing the response on
+            # the rejection paths drops the connection without fetching the body
+            with requests.get(url, stream=True, timeout=30, allow_redirects=True) as response:
+                if response.status_code != 200:
+                    print(f"    ✗ HTTP {response.status_code} ({url[:60]})")
+                    buffer.close()
+                    return None
+                
+                # Check if it's actually a file or a redirect to a page
+                content_type = response.headers.get('content-type', '')
+                content_length = response.headers.get('content-length')
+                
+                if 'text/html' in content_type and content_length and int(content_length) < 100000:
+                    # Likely an HTML page, not a file
+                    print(f"    ✗ URL returns HTML page, not a file ({url[:60]})")
+                    buffer.close()
+                    return None
+                
+                for chunk in response.iter_content(chunk_size=8192):
+                    if stop.is_set():
+                        buffer.close()
+                        return None
+                    buffer.write(chunk)
+            
+            return buffer
                     
+        except Exception as e:
+            print(f"    ✗ Error: {str(e)[:60]} ({url[:60]})")
+            buffer.close()
+            return None
+    
+    def _save_download(self, buffer: SpooledTemporaryFile, filepath: Path):
+        """
+        Save a downloaded body to ``filepath``, extracting zips in place.
+        
+        A zip is extracted into DATA_DIR directly from the buffer, so the
+        archive itself is never written to disk. If its CSV already exists,
+        or the buffer is not a zip, the body is saved as ``filepath``.
+        """
+        buffer.seek(0)
+        if zipfile.is_zipfile(buffer) and not (DATA_DIR / filepath.stem).exists():
+            try:
+                buffer.seek(0)
+                with zipfile.ZipFile(buffer) as z:
+                    print(f"  Extracting {filepath.name}...")
+                    z.extractall(DATA_DIR)
+                    print(f"  ✓ Extracted to {filepath.stem}")
+                return
             except Exception as e:
-                print(f"    ✗ Error: {str(e)[:60]}")
+                print(f"  ⚠ Could not extract {filepath.name}: {e}")
         
-        return False, None
+        buffer.seek(0)
+        with open(filepath, "wb") as f:
+            shutil.copyfileobj(buffer, f)
     
-    def download_with_ai_help(self) -> Dict[str, bool]:
+    def download_with_ai_help(self, refresh_urls: bool = False) -> Dict[str, bool]:
         """
         Use AI to find URLs and attempt downloads.
         
+        Args:
+            refresh_urls: If True, ask the AI for new URLs even if cached ones exist
+        
         Returns:
             Dictionary with download status for each file type
         """
@@ -207,7 +349,7 @@ Format the response as clear markdown with numbered steps.
         print()
         
         # Get AI-suggested URLs
-        url_suggestions = self.search_download_urls()
+        url_suggestions = self.search_download_urls(refresh=refresh_urls)
         print()
         
         # Map to our file naming
@@ -233,8 +375,6 @@ Format the response as clear markdown with numbered steps.
             
             if success:
                 results[data_type] = True
-                # Try to extract if it's a zip
-                self._extract_if_zip(DATA_DIR / filename)
             else:
                 results[data_type] = False
                 print(f"  ✗ Could not download {data_type} data from any suggested URL")
@@ -260,31 +400,6 @@ Format the response as clear markdown with numbered steps.
         
         return results
     
-    def _extract_if_zip(self, filepath: Path):
-        """Extract zip file if it exists and is a zip."""
-        if not filepath.exists():
-            return
-        
-        try:
-            # Check if it's a zip file
-            with zipfile.ZipFile(filepath, 'r') as z:
-                csv_name = filepath.stem  # Remove .zip
-                csv_path = DATA_DIR / csv_name
-                
-                if not csv_path.exists():
-                    print(f"  Extracting {filepath.name}...")
-                    z.extractall(DATA_DIR)
-                    print(f"  ✓ Extracted to {csv_name}")
-                    
-                    # Remove zip to save space
-                    filepath.unlink()
-                    print(f"  ✓ Removed zip file")
-        except zipfile.BadZipFile:
-            # Not a zip file, might already be CSV
-            pass
-        except Exception as e:
-            print(f"  ⚠ Could not extract {filepath.name}: {e}")
-    
     def interactive_download(self):
         """Interactive download session with AI assistance."""
         print("=" * 70)
@@ -339,6 +454,11 @@ def main():
         action='store_true',
         help='Only get instructions, don\'t attempt downloads'
     )
+    parser.add_argument(
+        '--refresh-urls',
+        action='store_true',
+        help='Ask the AI for new download URLs instead of using cached suggestions'
+    )
     
     args = parser.parse_args()
     
@@ -349,7 +469,7 @@ def main():
             instructions = agent.get_download_instructions()
             print(instructions)
         else:
-            agent.download_with_ai_help()
+            agent.download_with_ai_help(refresh_urls=args.refresh_urls)
             
     except ValueError as e:
         print(f"Error: {e}")
@@ -20,6 +20,21 @@ class EPADataLoader(AgencyDataLoader):
     # EPA ECHO API endpoint (example structure)
     ECHO_API_BASE = "https://echodata.epa.gov/echo/"
     
+    # Empty violations frame with the expected structure, based on EPA ECHO
+    # data; built once and returned as a shallow copy
+    _EMPTY_VIOLATIONS = pd.DataFrame(columns=[
+        "facility_name",
+        "facility_id",
+        "state",
+        "county",
+        "naics_code",
+        "violation_date",
+        "year",
+        "violation_type",
+        "penalty_amount",
+        "enforcement_action"
+    ])
+    
     def __init__(self, data_dir, fuzzy_threshold=75):
         """Initialize EPA loader with fuzzy matching threshold."""
         super().__init__(data_dir, fuzzy_threshold=fuzzy_threshold)
@@ -42,23 +57,8 @@ class EPADataLoader(AgencyDataLoader):
         For now, returns empty DataFrame with expected structure.
         """
         # Placeholder: Actual implementation would fetch from EPA API or data files
-        # Example structure based on EPA ECHO data:
-        expected_columns = [
-            "facility_name",
-            "facility_id",
-            "state",
-            "county",
-            "naics_code",
-            "violation_date",
-            "year",
-            "violation_type",
-            "penalty_amount",
-            "enforcement_action"
-        ]
-        
-        # Return empty DataFrame with expected structure
         # When implementing, replace with actual data loading
-        return pd.DataFrame(columns=expected_columns)
+        return self._EMPTY_VIOLATIONS.copy(deep=False)
     
     def _download_epa_data(self) -> Path:
         """Download EPA enforcement data (placeholder for future implementation)."""
@@ -78,6 +78,19 @@ class MSHADataLoader(AgencyDataLoader):
     MSHA data is available from DOL similar to OSHA.
     """
     
+    # Empty violations frame with the expected structure; built once and
+    # returned as a shallow copy
+    _EMPTY_VIOLATIONS = pd.DataFrame(columns=[
+        "mine_name",
+        "operator_name",
+        "mine_id",
+        "state",
+        "violation_date",
+        "year",
+        "violation_type",
+        "penalty_amount"
+    ])
+    
     def __init__(self, data_dir, fuzzy_threshold=75):
         """Initialize MSHA loader with fuzzy matching threshold."""
         super().__init__(data_dir, fuzzy_threshold=fuzzy_threshold)
@@ -95,19 +108,8 @@ class MSHADataLoader(AgencyDataLoader):
         MSHA data is available from DOL enforcement data catalog similar to OSHA.
         Structure would be similar but with mine-specific fields.
         """
-        expected_columns = [
-            "mine_name",
-            "operator_name",
-            "mine_id",
-            "state",
-            "violation_date",
-            "year",
-            "violation_type",
-            "penalty_amount"
-        ]
-        
         # Placeholder: Actual implementation would load from DOL MSHA data
-        return pd.DataFrame(columns=expected_columns)
+        return self._EMPTY_VIOLATIONS.copy(deep=False)
 
 
 class FDADataLoader(AgencyDataLoader):
@@ -116,6 +118,19 @@ class FDADataLoader(AgencyDataLoader):
     FDA enforcement data includes warning letters, inspections, and violations.
     """
     
+    # Empty violations frame with the expected structure; built once and
+    # returned as a shallow copy
+    _EMPTY_VIOLATIONS = pd.DataFrame(columns=[
+        "firm_name",
+        "firm_id",
+        "state",
+        "violation_date",
+        "year",
+        "violation_type",
+        "product_category",
+        "enforcement_action"
+    ])
+    
     def __init__(self, data_dir, fuzzy_threshold=75):
         """Initialize FDA loader with fuzzy matching threshold."""
         super().__init__(data_dir, fuzzy_threshold=fuzzy_threshold)
@@ -135,17 +150,6 @@ class FDADataLoader(AgencyDataLoader):
         - Inspection observations (FDA 483)
         - Recalls database
         """
-        expected_columns = [
-            "firm_name",
-            "firm_id",
-            "state",
-            "violation_date",
-            "year",
-            "violation_type",
-            "product_category",
-            "enforcement_action"
-        ]
-        
         # Placeholder: Actual implementation would load from FDA databases
-        return pd.DataFrame(columns=expected_columns)
+        return self._EMPTY_VIOLATIONS.copy(deep=False)
 
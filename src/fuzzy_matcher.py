@@ -3,12 +3,72 @@ Fuzzy Company Name Matching
 Advanced company name matching using fuzzy string matching algorithms.
 """
 
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from rapidfuzz import fuzz, process
 import re
 
 
+# Common suffixes and legal entities removed from company names, in strip order
+_COMPANY_SUFFIXES = (
+    " INC", " LLC", " CORP", " CORPORATION", " LP", " LTD", 
+    " COMPANY", " CO", " L.L.C.", " INC.", " CORP.", " CO.",
+    " PLC", " PLLC", " LLP", " PA", " PC", " P.C.",
+    " LLC.", " INCORPORATED", " LIMITED", " ASSOCIATES",
+    " ASSOCIATION", " GROUP", " HOLDINGS", " HOLDING"
+)
+
+# Matches when any of _COMPANY_SUFFIXES ends the string
+_COMPANY_SUFFIX_PATTERN = re.compile('(?:' + '|'.join(map(re.escape, _COMPANY_SUFFIXES)) + r')\Z')
+
+# Runs of punctuation, special characters or whitespace ([^\w\s] and \s together)
+_NON_WORD_PATTERN = re.compile(r'\W+')
+
+# Words that don't help matching
+_COMMON_WORDS = frozenset({"THE", "A", "AN"})
+
+
+@lru_cache(maxsize=100_000)
+def _normalize_company_name_cached(name: str) -> str:
+    """
+    CompanyNameMatcher.normalize_company_name for a string, memoized.
+    
+    Company names repeat heavily across candidate lists and grouping runs,
+    so each distinct name is normalized once.
+    """
+    if not name:
+        return ""
+    
+    name = name.upper().strip()
+    
+    # Remove common suffixes and legal entities. They are stripped in list
+    # order, so the loop only needs to run when one of them ends the name.
+    if _COMPANY_SUFFIX_PATTERN.search(name):
+        for suffix in _COMPANY_SUFFIXES:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)].strip()
+    
+    # Replace punctuation and special characters with spaces, then split on
+    # whitespace (which also collapses runs and trims the ends) and drop
+    # common words that don't help matching
+    name = _NON_WORD_PATTERN.sub(' ', name)
+    name = " ".join(w for w in name.split() if w not in _COMMON_WORDS)
+    
+    return name
+
+
+def _sort_tokens(name: str) -> str:
+    """Sort a name's whitespace-separated tokens, as fuzz.token_sort_ratio does before comparing."""
+    return " ".join(sorted(name.split()))
+
+
+# Score-matrix cells per block when scoring many names at once
+# (find_matches_batch, group_similar_companies); ~32 MB per float64 matrix
+SCORE_BLOCK_CELLS = 4_000_000
+
+
 class CompanyNameMatcher:
     """Advanced company name matcher with fuzzy matching capabilities."""
     
@@ -27,36 +87,11 @@ class CompanyNameMatcher:
         
         Removes common suffixes, punctuation, and normalizes spacing.
         """
+        if isinstance(name, str):
+            return _normalize_company_name_cached(name)
         if pd.isna(name) or not name:
             return ""
-        
-        name = str(name).upper().strip()
-        
-        # Remove common suffixes and legal entities
-        suffixes = [
-            " INC", " LLC", " CORP", " CORPORATION", " LP", " LTD", 
-            " COMPANY", " CO", " L.L.C.", " INC.", " CORP.", " CO.",
-            " PLC", " PLLC", " LLP", " PA", " PC", " P.C.",
-            " LLC.", " INCORPORATED", " LIMITED", " ASSOCIATES",
-            " ASSOCIATION", " GROUP", " HOLDINGS", " HOLDING"
-        ]
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)].strip()
-        
-        # Remove punctuation and special characters
-        name = re.sub(r'[^\w\s]', ' ', name)
-        
-        # Normalize whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-        
-        # Remove common words that don't help matching
-        common_words = ["THE", "A", "AN"]
-        words = name.split()
-        words = [w for w in words if w not in common_words]
-        name = " ".join(words)
-        
-        return name
+        return _normalize_company_name_cached(str(name))
     
     def calculate_similarity(self, name1: str, name2: str) -> float:
         """
@@ -67,9 +102,30 @@ class CompanyNameMatcher:
         Returns:
             Similarity score (0-100)
         """
-        norm1 = self.normalize_company_name(name1)
-        norm2 = self.normalize_company_name(name2)
+        return self._normalized_similarity(
+            self.normalize_company_name(name1),
+            self.normalize_company_name(name2)
+        )
+    
+    def calculate_similarity_batch(self, queries: List[str], candidates: List[str]) -> np.ndarray:
+        """
+        calculate_similarity for every (query, candidate) pair.
         
+        Names are normalized once each and every scorer runs once over the
+        whole matrix, so this is much faster than calling
+        calculate_similarity pair by pair.
+        
+        Returns:
+            float64 array of shape (len(queries), len(candidates)) with scores (0-100)
+        """
+        return self._normalized_similarity_matrix(
+            [self.normalize_company_name(name) for name in queries],
+            [self.normalize_company_name(name) for name in candidates]
+        )
+    
+    @staticmethod
+    def _normalized_similarity(norm1: str, norm2: str) -> float:
+        """calculate_similarity for names that are already normalized."""
         if not norm1 or not norm2:
             return 0.0
         
@@ -91,19 +147,47 @@ class CompanyNameMatcher:
         
         return weighted_score
     
+    @staticmethod
+    def _normalized_similarity_matrix(queries: List[str], choices: List[str]) -> np.ndarray:
+        """
+        _normalized_similarity for every (query, choice) pair, as a float64 matrix.
+        
+        Each scorer runs once over the whole matrix via process.cdist; the
+        weighted sum uses the same weights and operation order as
+        _normalized_similarity, so scores are identical.
+        """
+        scores = [
+            process.cdist(queries, choices, scorer=scorer, dtype=np.float64, workers=-1)
+            for scorer in (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio, fuzz.token_set_ratio)
+        ]
+        weighted_scores = (
+            scores[0] * 0.2 +
+            scores[1] * 0.2 +
+            scores[2] * 0.3 +
+            scores[3] * 0.3
+        )
+        
+        # Empty names never match
+        weighted_scores[np.array([not q for q in queries], dtype=bool), :] = 0.0
+        weighted_scores[:, np.array([not c for c in choices], dtype=bool)] = 0.0
+        return weighted_scores
+    
     def find_matches(
         self, 
         search_name: str, 
-        candidate_names: List[str],
+        candidate_names: Sequence[str],
         limit: int = 10,
         threshold: Optional[int] = None
     ) -> List[Tuple[str, float]]:
         """
         Find best matching company names from a list of candidates.
         
+        If any candidates normalize to exactly the search name, only those
+        are returned (score 100); otherwise candidates are fuzzy scored.
+        
         Args:
             search_name: Company name to search for
-            candidate_names: List of candidate company names
+            candidate_names: Candidate company names (list or array)
             limit: Maximum number of matches to return
             threshold: Minimum similarity score (uses self.threshold if None)
         
@@ -116,28 +200,130 @@ class CompanyNameMatcher:
         if not normalized_search:
             return []
         
-        # Use rapidfuzz.process for efficient matching
-        matches = process.extract(
-            normalized_search,
-            candidate_names,
-            scorer=fuzz.token_sort_ratio,  # Best for company names
-            limit=limit
-        )
+        if len(candidate_names) == 0:
+            return []
+        
+        # Candidates that normalize to the search name are the best possible
+        # matches; return them without running the fuzzy scorers
+        exact_index, sorted_token_candidates = self._prepare_candidates(candidate_names)
+        exact = exact_index.get(normalized_search)
+        if exact:
+            return [(name, 100.0) for name in exact[:limit]]
+        
+        # Score every candidate in one rapidfuzz call (C loop, multithreaded);
+        # scores below the threshold come back as 0. Token sort ratio (best
+        # for company names) is fuzz.ratio over token-sorted strings, and the
+        # candidates are token-sorted in _prepare_candidates.
+        scores = process.cdist(
+            [_sort_tokens(normalized_search)],
+            sorted_token_candidates,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=threshold,
+            workers=-1
+        )[0]
+        
+        return self._rank_scored_candidates(normalized_search, scores, candidate_names, limit, threshold)
+    
+    def find_matches_batch(
+        self,
+        search_names: List[str],
+        candidate_names: Sequence[str],
+        limit: int = 10,
+        threshold: Optional[int] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        find_matches for many search names against the same candidates.
+        
+        Candidates are preprocessed once, and the pre-filter scores for a
+        block of search names come from a single multithreaded
+        process.cdist call instead of one call per name.
+        
+        Returns:
+            One find_matches result list per search name, in input order
+        """
+        threshold = threshold or self.threshold
+        results: List[List[Tuple[str, float]]] = [[] for _ in search_names]
+        
+        if len(candidate_names) == 0:
+            return results
         
-        # Filter by threshold and calculate weighted scores
+        exact_index, sorted_token_candidates = self._prepare_candidates(candidate_names)
+        
+        # Exact normalized matches are answered directly; the rest are fuzzy scored
+        pending = []  # (position in search_names, normalized search name)
+        for position, search_name in enumerate(search_names):
+            normalized_search = self.normalize_company_name(search_name)
+            if not normalized_search:
+                continue
+            exact = exact_index.get(normalized_search)
+            if exact:
+                results[position] = [(name, 100.0) for name in exact[:limit]]
+            else:
+                pending.append((position, normalized_search))
+        
+        # Bound each score matrix to ~SCORE_BLOCK_CELLS cells
+        block_rows = max(1, SCORE_BLOCK_CELLS // len(candidate_names))
+        for start in range(0, len(pending), block_rows):
+            block = pending[start:start + block_rows]
+            scores = process.cdist(
+                [_sort_tokens(normalized_search) for _, normalized_search in block],
+                sorted_token_candidates,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=threshold,
+                workers=-1
+            )
+            for row, (position, normalized_search) in zip(scores, block):
+                results[position] = self._rank_scored_candidates(
+                    normalized_search, row, candidate_names, limit, threshold
+                )
+        
+        return results
+    
+    def _rank_scored_candidates(
+        self,
+        normalized_search: str,
+        scores: np.ndarray,
+        candidate_names: Sequence[str],
+        limit: int,
+        threshold: int
+    ) -> List[Tuple[str, float]]:
+        """Weighted-score the top pre-filter candidates for find_matches and rank them."""
+        # Top `limit` candidates by score, ties in candidate order
+        survivors = np.flatnonzero(scores >= threshold)
+        top = survivors[np.argsort(-scores[survivors], kind='stable')[:limit]]
+        
+        # Calculate the more sophisticated weighted score for the survivors only
         results = []
-        for candidate, score, _ in matches:
-            if score >= threshold:
-                # Calculate more sophisticated score
-                final_score = self.calculate_similarity(search_name, candidate)
-                if final_score >= threshold:
-                    results.append((candidate, final_score))
+        for i in top:
+            candidate = candidate_names[i]
+            final_score = self._normalized_similarity(normalized_search, self.normalize_company_name(candidate))
+            if final_score >= threshold:
+                results.append((candidate, final_score))
         
         # Sort by score descending
         results.sort(key=lambda x: x[1], reverse=True)
         
         return results[:limit]
     
+    def _prepare_candidates(self, candidate_names: Sequence[str]) -> Tuple[Dict[str, List[str]], List[str]]:
+        """
+        Preprocess candidates for find_matches and find_matches_batch.
+        
+        Built on every call, so a candidate list changed in place between
+        searches is always seen as it is now; find_matches_batch prepares
+        its candidates once for all of its search names.
+        
+        Returns:
+            (index of candidates by normalized name, candidates with their
+            whitespace-separated tokens sorted)
+        """
+        exact_index: Dict[str, List[str]] = {}
+        for name in candidate_names:
+            exact_index.setdefault(self.normalize_company_name(name), []).append(name)
+        return exact_index, [_sort_tokens(name) for name in candidate_names]
+    
     def match_dataframe(
         self,
         search_name: str,
@@ -163,9 +349,10 @@ class CompanyNameMatcher:
             return pd.DataFrame()
         
         threshold = threshold or self.threshold
-        unique_names = df[company_column].dropna().unique().tolist()
+        # Kept as the array unique() returns; find_matches accepts any sequence
+        unique_names = df[company_column].dropna().unique()
         
-        if not unique_names:
+        if len(unique_names) == 0:
             return pd.DataFrame()
         
         # Find matches
@@ -177,16 +364,13 @@ class CompanyNameMatcher:
         # Create match lookup
         match_dict = {name: score for name, score in matches}
         
-        # Filter dataframe to matched companies
-        matched_df = df[df[company_column].isin(match_dict.keys())].copy()
-        
-        # Add similarity scores
-        matched_df['similarity_score'] = matched_df[company_column].map(match_dict)
+        # One pass maps every row to its score (NaN for unmatched companies);
+        # only the matched rows are then ordered by score
+        scores = df[company_column].map(match_dict).to_numpy(dtype=float, na_value=np.nan)
+        positions = np.flatnonzero(~np.isnan(scores))
+        top = np.argsort(-scores[positions], kind='stable')[:limit]
         
-        # Sort by similarity score
-        matched_df = matched_df.sort_values('similarity_score', ascending=False)
-        
-        return matched_df.head(limit)
+        return df.iloc[positions[top]].assign(similarity_score=scores[positions[top]])
     
     def group_similar_companies(
         self,
@@ -197,6 +381,9 @@ class CompanyNameMatcher:
         Group similar company names together.
         
         Useful for identifying duplicate/variant company names in data.
+        Each name, in order, starts a group with every later ungrouped name
+        scoring at least ``threshold`` against it. Scores come from
+        _normalized_similarity_matrix in row blocks instead of pair by pair.
         
         Args:
             company_names: List of company names to group
@@ -205,28 +392,31 @@ class CompanyNameMatcher:
         Returns:
             List of groups, where each group contains similar company names
         """
-        normalized_names = [(name, self.normalize_company_name(name)) for name in company_names]
+        normalized_names = [self.normalize_company_name(name) for name in company_names]
+        n = len(normalized_names)
         groups = []
-        used = set()
+        used = np.zeros(n, dtype=bool)
         
-        for i, (name, norm1) in enumerate(normalized_names):
-            if i in used:
-                continue
-            
-            group = [name]
-            used.add(i)
+        # Score a block of rows at a time against the names from the block
+        # start on, bounding the score matrices to ~SCORE_BLOCK_CELLS
+        block_rows = max(1, SCORE_BLOCK_CELLS // max(n, 1))
+        
+        for start in range(0, n, block_rows):
+            stop = min(start + block_rows, n)
+            scores = self._normalized_similarity_matrix(normalized_names[start:stop], normalized_names[start:])
             
-            for j, (other_name, norm2) in enumerate(normalized_names[i+1:], start=i+1):
-                if j in used:
+            for i in range(start, stop):
+                if used[i]:
                     continue
+                used[i] = True
                 
-                score = self.calculate_similarity(norm1, norm2)
-                if score >= threshold:
-                    group.append(other_name)
-                    used.add(j)
-            
-            if len(group) > 1:  # Only return groups with multiple members
-                groups.append(group)
+                # Later names not yet grouped that are similar to name i
+                similar = np.flatnonzero(scores[i - start, i - start + 1:] >= threshold) + i + 1
+                similar = similar[~used[similar]]
+                
+                if len(similar) > 0:  # Only return groups with multiple members
+                    used[similar] = True
+                    groups.append([company_names[i]] + [company_names[j] for j in similar])
         
         return groups
 
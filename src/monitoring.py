@@ -2,18 +2,29 @@
 Monitoring and logging utilities.
 """
 
+import atexit
 import logging
+import queue
+import threading
 import time
+from logging.handlers import QueueHandler, QueueListener
 from functools import wraps
 from typing import Callable, Any
 from contextlib import contextmanager
 
+# Log file writes happen on a QueueListener thread; logging calls only
+# format the record and put it on the queue
+_log_queue = queue.SimpleQueue()
+_log_file_listener = QueueListener(_log_queue, logging.FileHandler('osha_analyzer.log'))
+_log_file_listener.start()
+atexit.register(_log_file_listener.stop)  # Drains queued records on exit
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('osha_analyzer.log'),
+        QueueHandler(_log_queue),
         logging.StreamHandler()
     ]
 )
@@ -30,18 +41,20 @@ def log_performance(func: Callable) -> Callable:
         def my_function():
             # ...
     """
+    func_name = f"{func.__module__}.{func.__name__}"
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        func_name = f"{func.__module__}.{func.__name__}"
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            logger.info(f"{func_name} completed in {duration:.3f}s")
+            if logger.isEnabledFor(logging.INFO):
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.info(f"{func_name} completed in {duration:.3f}s")
             return result
         except Exception as e:
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"{func_name} failed after {duration:.3f}s: {e}", exc_info=True)
             raise
     
@@ -51,38 +64,54 @@ def log_performance(func: Callable) -> Callable:
 @contextmanager
 def performance_timer(operation_name: str):
     """Context manager to time operations."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
         yield
     finally:
-        duration = time.time() - start_time
-        logger.info(f"{operation_name} took {duration:.3f}s")
+        if logger.isEnabledFor(logging.INFO):
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.info(f"{operation_name} took {duration:.3f}s")
 
 
 class QueryCounter:
-    """Simple counter for tracking database queries."""
+    """
+    Simple counter for tracking database queries.
+    
+    Safe to use from several threads: updates and reads go through one
+    lock, so the count and total time always agree. The stats dict is
+    rebuilt only after the counters change.
+    """
     _count = 0
     _total_time = 0.0
+    _stats = None  # Cached get_stats result, cleared on every update
+    _lock = threading.Lock()
     
     @classmethod
     def increment(cls, duration: float = 0.0):
         """Increment query count and add duration."""
-        cls._count += 1
-        cls._total_time += duration
+        with cls._lock:
+            cls._count += 1
+            cls._total_time += duration
+            cls._stats = None
     
     @classmethod
     def get_stats(cls) -> dict:
         """Get query statistics."""
-        avg_time = cls._total_time / cls._count if cls._count > 0 else 0
-        return {
-            "total_queries": cls._count,
-            "total_time": round(cls._total_time, 3),
-            "avg_time": round(avg_time, 3)
-        }
+        with cls._lock:
+            if cls._stats is None:
+                avg_time = cls._total_time / cls._count if cls._count > 0 else 0
+                cls._stats = {
+                    "total_queries": cls._count,
+                    "total_time": round(cls._total_time, 3),
+                    "avg_time": round(avg_time, 3)
+                }
+            # Copy so callers can't modify the cached stats
+            return dict(cls._stats)
     
     @classmethod
     def reset(cls):
         """Reset counters."""
-        cls._count = 0
-        cls._total_time = 0.0
-
+        with cls._lock:
+            cls._count = 0
+            cls._total_time = 0.0
+            cls._stats = None
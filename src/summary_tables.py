@@ -144,18 +144,19 @@ class SummaryTableManager:
             
             results = query.group_by(Violation.agency, Violation.year).all()
             
-            # Insert summaries
-            for row in results:
-                summary = ViolationSummaryByYear(
-                    agency=row.agency,
-                    year=row.year,
-                    violation_count=row.violation_count or 0,
-                    total_penalties=row.total_penalties or 0.0,
-                    avg_penalty=row.avg_penalty or 0.0,
-                    max_penalty=row.max_penalty,
-                    min_penalty=row.min_penalty
-                )
-                session.add(summary)
+            # Insert summaries (Core executemany in the session's transaction)
+            self.db.bulk_insert(ViolationSummaryByYear, [
+                {
+                    'agency': row.agency,
+                    'year': row.year,
+                    'violation_count': row.violation_count or 0,
+                    'total_penalties': row.total_penalties or 0.0,
+                    'avg_penalty': row.avg_penalty or 0.0,
+                    'max_penalty': row.max_penalty,
+                    'min_penalty': row.min_penalty
+                }
+                for row in results
+            ], connection=session.connection())
             
             session.commit()
             logger.info(f"Refreshed year summary: {len(results)} records")
@@ -193,16 +194,17 @@ class SummaryTableManager:
             
             results = query.group_by(Violation.agency, Violation.site_state, Violation.year).all()
             
-            for row in results:
-                summary = ViolationSummaryByState(
-                    agency=row.agency,
-                    site_state=row.site_state,
-                    year=row.year,
-                    violation_count=row.violation_count or 0,
-                    total_penalties=row.total_penalties or 0.0,
-                    avg_penalty=row.avg_penalty or 0.0
-                )
-                session.add(summary)
+            self.db.bulk_insert(ViolationSummaryByState, [
+                {
+                    'agency': row.agency,
+                    'site_state': row.site_state,
+                    'year': row.year,
+                    'violation_count': row.violation_count or 0,
+                    'total_penalties': row.total_penalties or 0.0,
+                    'avg_penalty': row.avg_penalty or 0.0
+                }
+                for row in results
+            ], connection=session.connection())
             
             session.commit()
             logger.info(f"Refreshed state summary: {len(results)} records")
@@ -240,16 +242,17 @@ class SummaryTableManager:
             
             results = query.group_by(Violation.agency, Violation.standard, Violation.year).all()
             
-            for row in results:
-                summary = ViolationSummaryByStandard(
-                    agency=row.agency,
-                    standard=row.standard,
-                    year=row.year,
-                    citation_count=row.citation_count or 0,
-                    total_penalties=row.total_penalties or 0.0,
-                    avg_penalty=row.avg_penalty or 0.0
-                )
-                session.add(summary)
+            self.db.bulk_insert(ViolationSummaryByStandard, [
+                {
+                    'agency': row.agency,
+                    'standard': row.standard,
+                    'year': row.year,
+                    'citation_count': row.citation_count or 0,
+                    'total_penalties': row.total_penalties or 0.0,
+                    'avg_penalty': row.avg_penalty or 0.0
+                }
+                for row in results
+            ], connection=session.connection())
             
             session.commit()
             logger.info(f"Refreshed standard summary: {len(results)} records")
@@ -288,23 +291,24 @@ class SummaryTableManager:
             
             results = query.group_by(Violation.agency, Violation.company_name_normalized).all()
             
+            summaries = []
             for row in results:
                 # Calculate years active
                 years_active = None
                 if row.first_violation_date and row.last_violation_date:
                     years_active = (row.last_violation_date.year - row.first_violation_date.year) + 1
                 
-                summary = ViolationSummaryByCompany(
-                    agency=row.agency,
-                    company_name_normalized=row.company_name_normalized,
-                    violation_count=row.violation_count or 0,
-                    total_penalties=row.total_penalties or 0.0,
-                    avg_penalty=row.avg_penalty or 0.0,
-                    first_violation_date=row.first_violation_date,
-                    last_violation_date=row.last_violation_date,
-                    years_active=years_active
-                )
-                session.add(summary)
+                summaries.append({
+                    'agency': row.agency,
+                    'company_name_normalized': row.company_name_normalized,
+                    'violation_count': row.violation_count or 0,
+                    'total_penalties': row.total_penalties or 0.0,
+                    'avg_penalty': row.avg_penalty or 0.0,
+                    'first_violation_date': row.first_violation_date,
+                    'last_violation_date': row.last_violation_date,
+                    'years_active': years_active
+                })
+            self.db.bulk_insert(ViolationSummaryByCompany, summaries, connection=session.connection())
             
             session.commit()
             logger.info(f"Refreshed company summary: {len(results)} records")
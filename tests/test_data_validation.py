@@ -86,3 +86,66 @@ def test_validate_company_names(validator):
     
     assert isinstance(result, ValidationResult)
 
+
+
+def test_invalid_samples_are_capped(validator):
+    """Test that stored invalid values are capped at MAX_FAILURE_SAMPLES."""
+    cap = DataValidator.MAX_FAILURE_SAMPLES
+    df = pd.DataFrame({
+        'year': list(range(3000, 3000 + cap * 2))
+    })
+    
+    result = validator.validate_year_range(df, 'year', min_year=1990, max_year=2024)
+    
+    assert not result.is_valid
+    assert len(result.stats['invalid_years']) == cap
+    assert result.stats['invalid_years_truncated']
+
+
+def test_validate_comprehensive_reuses_result(validator):
+    """Test that re-validating the same DataFrame returns an equal cached result."""
+    df = pd.DataFrame({
+        'company_name': ['Company A', 'Company B'],
+        'year': [2023, 2024]
+    })
+    
+    first = validator.validate_comprehensive(df, expected_columns=['company_name'])
+    second = validator.validate_comprehensive(df, expected_columns=['company_name'])
+    
+    assert first == second
+    assert first.is_valid
+    
+    # Mutating the returned result must not leak into the cache
+    second.add_error("caller edit")
+    assert validator.validate_comprehensive(df, expected_columns=['company_name']) == first
+
+
+def test_validate_comprehensive_detects_in_place_edits(validator):
+    """Test that editing a DataFrame in place invalidates its cached result."""
+    df = pd.DataFrame({
+        'company_name': ['Company A', 'Company B'],
+        'year': [2023, 2024]
+    })
+    
+    assert validator.validate_comprehensive(df).is_valid
+    df.loc[0, 'year'] = 1700
+    assert not validator.validate_comprehensive(df).is_valid
+    
+    # Edits far from the first rows are detected as well
+    df = pd.DataFrame({'year': [2020] * 2000})
+    assert validator.validate_comprehensive(df).is_valid
+    df.loc[1500, 'year'] = 1500
+    assert not validator.validate_comprehensive(df).is_valid
+
+
+def test_validate_comprehensive_unhashable_values(validator):
+    """Test that columns holding lists are validated without caching."""
+    df = pd.DataFrame({
+        'company_name': ['Company A', 'Company B'],
+        'year': [2023, 2024],
+        'tags': [['a'], ['b', 'c']]
+    })
+    
+    assert validator.validate_comprehensive(df).is_valid
+    df.loc[1, 'year'] = 1700
+    assert not validator.validate_comprehensive(df).is_valid
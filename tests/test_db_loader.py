@@ -0,0 +1,352 @@
+"""
+Tests for database loader bulk-insert helpers.
+"""
+
+import pytest
+import pandas as pd
+import sqlite3
+import sys
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import DatabaseManager, reset_db_manager
+import src.db_loader as db_loader
+from src.db_loader import DatabaseDataLoader, bulk_insert_session, _estimate_csv_rows, _prefetch
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary SQLite database with all tables."""
+    temp_dir = Path(tempfile.mkdtemp())
+    db_path = temp_dir / "test.db"
+    db_manager = DatabaseManager(database_url=f"sqlite:///{db_path}")
+    db_manager.create_tables()
+    
+    yield db_manager, db_path
+    
+    db_manager.close()
+
+
+@pytest.fixture
+def loader(temp_db):
+    """Create a DatabaseDataLoader on the temporary database."""
+    db_manager, db_path = temp_db
+    reset_db_manager()
+    
+    yield DatabaseDataLoader(database_url=f"sqlite:///{db_path}")
+    
+    reset_db_manager()
+
+
+def _inspections(activity_nrs):
+    return pd.DataFrame({
+        'activity_nr': activity_nrs,
+        'estab_name': ['Test Company'] * len(activity_nrs),
+        'open_date': pd.to_datetime(['2023-01-01'] * len(activity_nrs)),
+    })
+
+
+def test_bulk_insert_session_isolates_failed_dataframe(temp_db):
+    """A failing DataFrame is rolled back without discarding earlier inserts."""
+    db_manager, db_path = temp_db
+    
+    with bulk_insert_session(db_manager.engine, 'inspections') as insert:
+        insert(_inspections(['A1', 'A2']))
+        with pytest.raises(sqlite3.IntegrityError):
+            insert(_inspections(['A3', 'A1']))  # Duplicate activity_nr
+        insert(_inspections(['A4']))
+    
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT activity_nr, open_date FROM inspections ORDER BY activity_nr").fetchall()
+    conn.close()
+    
+    assert rows == [
+        ('A1', '2023-01-01 00:00:00.000000'),
+        ('A2', '2023-01-01 00:00:00.000000'),
+        ('A4', '2023-01-01 00:00:00.000000'),
+    ]
+
+
+def test_prefetch_preserves_order_and_reraises():
+    """Background-produced items arrive in order and producer errors surface."""
+    assert list(_prefetch(range(100))) == list(range(100))
+    
+    def failing():
+        yield 'first'
+        raise ValueError("parse failed")
+    
+    received = []
+    with pytest.raises(ValueError, match="parse failed"):
+        for item in _prefetch(failing()):
+            received.append(item)
+    assert received == ['first']
+
+
+def test_estimate_csv_rows(tmp_path):
+    """Small files are counted exactly; larger ones are scaled from a sample."""
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text("a,b\n1,2\n3,4")
+    assert _estimate_csv_rows(csv_path) == 2
+    
+    csv_path.write_text("a,b\n" + "10,20\n" * 1000)
+    assert _estimate_csv_rows(csv_path, sample_bytes=600) == 1000
+
+
+def test_chunked_query_matches_single_read(temp_db, monkeypatch):
+    """Results fetched in several chunks match a single-chunk read."""
+    db_manager, db_path = temp_db
+    with bulk_insert_session(db_manager.engine, 'inspections') as insert:
+        insert(pd.DataFrame({
+            'activity_nr': ['A1', 'A2', 'A3', 'A4'],
+            'open_date': pd.to_datetime(['2023-01-01', None, None, '2023-02-01']),
+            'year': [2023, None, None, 2023],
+        }))
+    
+    loader = DatabaseDataLoader(database_url=f"sqlite:///{db_path}")
+    single = loader.query_inspections()
+    monkeypatch.setattr(db_loader, 'QUERY_FETCH_CHUNK_ROWS', 1)
+    chunked = loader.query_inspections()
+    loader.db.close()
+    
+    pd.testing.assert_frame_equal(chunked, single)
+
+
+def test_sessions_do_not_share_transactions(temp_db):
+    """A rollback in one thread's session leaves another thread's insert intact."""
+    db_manager, db_path = temp_db
+    from src.database import Inspection
+    
+    writer = db_manager.get_session()
+    writer.add(Inspection(activity_nr='A1'))
+    writer.flush()  # Uncommitted insert
+    
+    def roll_back_other_session():
+        other = db_manager.get_session()
+        other.query(Inspection).count()
+        other.rollback()
+        other.close()
+    
+    thread = threading.Thread(target=roll_back_other_session)
+    thread.start()
+    thread.join()
+    
+    writer.commit()
+    writer.close()
+    
+    assert db_manager.get_table_row_count('inspections') == 1
+
+
+def test_violations_streaming_handles_multiline_descriptions(temp_db, loader, tmp_path, monkeypatch):
+    """Quoted line breaks in descriptions survive block-wise CSV parsing."""
+    db_manager, db_path = temp_db
+    csv_path = tmp_path / "violations.csv"
+    rows = [f'V{i},Company {i},"Line one\nline two of {i}",100.0' for i in range(200)]
+    csv_path.write_text("activity_nr,estab_name,description,initial_penalty\n" + "\n".join(rows) + "\n")
+    monkeypatch.setattr(db_loader, 'ARROW_CSV_BLOCK_SIZE', 1024)
+    
+    loader._load_violations_streaming(csv_path, None, None, 50, 'OSHA')
+    
+    conn = sqlite3.connect(db_path)
+    descriptions = conn.execute("SELECT description FROM violations ORDER BY id").fetchall()
+    conn.close()
+    
+    assert [d for (d,) in descriptions] == [f"Line one\nline two of {i}" for i in range(200)]
+
+
+def test_violations_streaming_coerces_invalid_penalties(temp_db, loader, tmp_path):
+    """A non-numeric penalty is stored as null instead of failing the load."""
+    db_manager, db_path = temp_db
+    csv_path = tmp_path / "violations.csv"
+    csv_path.write_text("activity_nr,estab_name,initial_penalty\nV1,Acme,100.5\nV2,Acme,TBD\nV3,Acme,\n")
+    
+    loader._load_violations_streaming(csv_path, None, None, 50, 'OSHA')
+    
+    conn = sqlite3.connect(db_path)
+    penalties = conn.execute("SELECT initial_penalty FROM violations ORDER BY id").fetchall()
+    conn.close()
+    
+    assert penalties == [(100.5,), (None,), (None,)]
+
+
+class _FakeRawConnection:
+    """Stand-in DBAPI connection recording commit/rollback/close calls."""
+    
+    def __init__(self, fail_commit=False):
+        self.fail_commit = fail_commit
+        self.events = []
+    
+    def commit(self):
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.events.append('commit')
+    
+    def rollback(self):
+        self.events.append('rollback')
+    
+    def close(self):
+        self.events.append('close')
+
+
+def test_parallel_copy_reports_uncommitted_slices(monkeypatch):
+    """A commit failing after earlier slices committed reports only the rest."""
+    conns = [_FakeRawConnection(), _FakeRawConnection(fail_commit=True), _FakeRawConnection()]
+    engine = type('FakeEngine', (), {'raw_connection': lambda self: conns.pop(0)})()
+    checked_out = list(conns)
+    monkeypatch.setattr(db_loader, '_copy_csv', lambda raw_conn, table_name, df: None)
+    df = pd.DataFrame({'activity_nr': [f'A{i}' for i in range(9)]})
+    
+    with pytest.raises(db_loader._PartialCopyError) as excinfo:
+        db_loader._bulk_insert_postgresql_copy_parallel(engine, 'inspections', df, workers=3)
+    
+    pd.testing.assert_frame_equal(excinfo.value.remaining, df.iloc[3:])
+    assert [c.events for c in checked_out] == [['commit', 'close'], ['rollback', 'close'], ['rollback', 'close']]
+
+
+def test_parallel_copy_closes_connections_when_checkout_fails(monkeypatch):
+    """Connections checked out before a failing checkout are released."""
+    checked_out = []
+    
+    def raw_connection(self):
+        if len(checked_out) == 2:
+            raise RuntimeError("pool exhausted")
+        checked_out.append(_FakeRawConnection())
+        return checked_out[-1]
+    
+    engine = type('FakeEngine', (), {'raw_connection': raw_connection})()
+    df = pd.DataFrame({'activity_nr': [f'A{i}' for i in range(9)]})
+    
+    with pytest.raises(RuntimeError, match="pool exhausted"):
+        db_loader._bulk_insert_postgresql_copy_parallel(engine, 'inspections', df, workers=3)
+    
+    assert [c.events for c in checked_out] == [['rollback', 'close'], ['rollback', 'close']]
+
+
+def test_bulk_date_parsing_matches_orm(temp_db):
+    """Dates parsed in bulk equal the values the ORM query returns."""
+    db_manager, db_path = temp_db
+    from src.database import Inspection
+    
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO inspections (activity_nr, open_date, close_case_date) VALUES (?, ?, ?)",
+        [('A1', '2023-01-01 00:00:00.000000', '2023-03-15'),
+         ('A2', None, '2024-02-29 00:00:00'),
+         ('A3', '2022-12-31', None)]
+    )
+    conn.commit()
+    conn.close()
+    
+    session = db_manager.get_session()
+    try:
+        query = session.query(Inspection).order_by(Inspection.id)
+        expected = [(i.open_date, i.close_case_date) for i in query]
+        df = db_loader._read_query_with_bulk_dates(query, session, Inspection)
+    finally:
+        session.close()
+    
+    assert expected[0] == (date(2023, 1, 1), date(2023, 3, 15))
+    assert list(zip(df['open_date'], df['close_case_date'])) == expected
+
+
+def _index_names(db_path):
+    conn = sqlite3.connect(db_path)
+    names = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    )}
+    conn.close()
+    return names
+
+
+def test_bulk_load_mode_restores_indexes(temp_db):
+    """Every index dropped for a bulk load exists again afterwards, also on error."""
+    db_manager, db_path = temp_db
+    from src.database import Inspection, Violation
+    
+    before = _index_names(db_path)
+    unique = {idx.name for m in (Inspection, Violation) for idx in m.__table__.indexes if idx.unique}
+    
+    with pytest.raises(RuntimeError):
+        with db_manager.bulk_load_mode([Inspection, Violation]):
+            assert _index_names(db_path) & {
+                idx.name for m in (Inspection, Violation) for idx in m.__table__.indexes
+            } == unique
+            raise RuntimeError("load failed")
+    
+    assert _index_names(db_path) == before
+
+
+def _write_inspections_csv(csv_path, nrows):
+    lines = ["activity_nr,estab_name,site_state,open_date"]
+    lines += [f"{100000 + i},Company {i % 37},TX,2023-01-{i % 28 + 1:02d}" for i in range(nrows)]
+    csv_path.write_text("\n".join(lines) + "\n")
+
+
+def test_single_writer_load_matches_sequential_load(temp_db, tmp_path):
+    """Parallel parsers with one writer insert the same rows as a sequential load."""
+    db_manager, db_path = temp_db
+    csv_path = tmp_path / "inspections.csv"
+    _write_inspections_csv(csv_path, 250)
+    
+    chunk_size = 80
+    chunk_boundaries = [(start, min(start + chunk_size, 250)) for start in range(0, 250, chunk_size)]
+    row_offsets = db_loader._build_csv_row_offsets(csv_path, chunk_size)
+    loaded = db_loader._load_inspections_single_writer(db_manager.bulk_engine, csv_path, chunk_boundaries,
+                                                       row_offsets, num_workers=3)
+    
+    sequential = DatabaseManager(database_url=f"sqlite:///{tmp_path / 'sequential.db'}")
+    sequential.create_tables()
+    with bulk_insert_session(sequential.bulk_engine, 'inspections') as insert:
+        for chunk in db_loader._iter_csv_row_range(csv_path, db_loader._csv_data_offset(csv_path), None,
+                                                   usecols=db_loader.INSPECTION_CSV_COLUMNS):
+            insert(db_loader._process_inspection_chunk_static(chunk))
+    
+    query = "SELECT activity_nr, estab_name, site_state, open_date FROM inspections ORDER BY activity_nr"
+    with db_manager.engine.connect() as conn, sequential.engine.connect() as sequential_conn:
+        rows = conn.exec_driver_sql(query).fetchall()
+        sequential_rows = sequential_conn.exec_driver_sql(query).fetchall()
+    sequential.close()
+    
+    assert loaded == len(rows) == 250
+    assert rows == sequential_rows
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_csv_row_offsets_cover_every_row_once(tmp_path, trailing_newline):
+    """Byte ranges between offsets hold exactly their rows, across 1 MiB scan blocks."""
+    csv_path = tmp_path / "rows.csv"
+    rows = [f"{i},{'x' * (i % 50)}" for i in range(40000)]  # > 1 MiB, uneven row lengths
+    csv_path.write_bytes(("id,pad\n" + "\n".join(rows) + ("\n" if trailing_newline else "")).encode())
+    step = 7
+    
+    offsets = db_loader._build_csv_row_offsets(csv_path, step)
+    
+    data = csv_path.read_bytes()
+    assert offsets[0] == db_loader._csv_data_offset(csv_path)
+    assert len(offsets) == -(-len(rows) // step)
+    bounds = offsets + [len(data)]
+    for k in range(len(offsets)):
+        assert data[bounds[k]:bounds[k + 1]].decode().splitlines() == rows[k * step:(k + 1) * step]
+
+
+def test_load_all_data_keeps_indexes_of_loaded_tables(temp_db, loader, monkeypatch):
+    """A rerun over populated tables does not drop and rebuild their indexes."""
+    db_manager, db_path = temp_db
+    with bulk_insert_session(loader.db.bulk_engine, 'inspections') as insert:
+        insert(_inspections(['A1']))
+    
+    bulk_loaded = []
+    original = loader.db.bulk_load_mode
+    
+    def recording_bulk_load_mode(models):
+        bulk_loaded.extend(m.__tablename__ for m in models)
+        return original(models)
+    
+    monkeypatch.setattr(loader.db, 'bulk_load_mode', recording_bulk_load_mode)
+    loader.load_all_data(tables=['inspections'], use_parallel=False)
+    
+    assert bulk_loaded == []
+    assert loader.db.get_table_row_count('inspections') == 1
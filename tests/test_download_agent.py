@@ -0,0 +1,55 @@
+"""
+Tests for the download agent's concurrent URL attempts.
+"""
+
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.download_agent as download_agent
+from src.download_agent import DownloadAgent
+
+
+def test_try_download_urls_returns_without_waiting_for_losers(tmp_path, monkeypatch):
+    """The first finished URL wins at once; late buffers are closed."""
+    monkeypatch.setattr(download_agent, 'DATA_DIR', tmp_path)
+    agent = DownloadAgent.__new__(DownloadAgent)  # No OpenAI client needed
+    release_slow = threading.Event()
+    late_buffers = []
+    
+    def probe_and_fetch(url, stop):
+        buffer = SpooledTemporaryFile()
+        buffer.write(url.encode())
+        if url == 'slow':
+            release_slow.wait(5)  # Stuck past the winner, ignoring stop
+            late_buffers.append(buffer)
+        return buffer
+    
+    monkeypatch.setattr(agent, '_probe_and_fetch', probe_and_fetch)
+    
+    start = time.perf_counter()
+    assert agent.try_download_urls(['slow', 'fast'], 'data.csv') == (True, 'fast')
+    assert time.perf_counter() - start < 2
+    assert (tmp_path / 'data.csv').read_bytes() == b'fast'
+    
+    release_slow.set()
+    for _ in range(100):
+        if late_buffers and late_buffers[0].closed:
+            break
+        time.sleep(0.01)
+    assert late_buffers[0].closed
+
+
+def test_read_cached_json_rejects_non_objects(tmp_path):
+    """Cached JSON that is not an object is treated as a cache miss."""
+    path = tmp_path / "cached.json"
+    path.write_text('["not", "a", "dict"]')
+    assert download_agent._read_cached_json(path, ttl=60) is None
+    
+    path.write_text('{"inspection": ["https://example.com/a.zip"]}')
+    assert download_agent._read_cached_json(path, ttl=60) == {"inspection": ["https://example.com/a.zip"]}
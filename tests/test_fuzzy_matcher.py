@@ -2,12 +2,14 @@
 Tests for fuzzy matching functionality.
 """
 
+import numpy as np
 import pytest
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import src.fuzzy_matcher as fuzzy_matcher
 from src.fuzzy_matcher import CompanyNameMatcher
 
 
@@ -67,3 +69,76 @@ def test_fuzzy_algorithms(matcher):
     assert token_sort_score >= 0
     assert all(score <= 100 for score in [ratio_score, partial_score, token_sort_score])
 
+
+
+COMPANY_NAMES = [
+    "Acme Inc", "ACME", "Acmee", "Acme Widgets", "Acme Widget Co", "Widgets Acme",
+    "The Boeing Company", "Boeing Co", "Walmart Stores Inc", "Wal-Mart Stores",
+    "Apple", "Google LLC", "", "Gogle", "Amazon.com, Inc.", "Amazon Web Services",
+]
+
+
+def test_exact_normalized_match_wins(matcher):
+    """Test that exact normalized hits are returned without fuzzy matches."""
+    candidates = ["Acme Inc", "Acmee", "ACME", "Acme, LLC", "Apple"]
+    assert matcher.calculate_similarity("Acme", "Acmee") >= matcher.threshold
+    
+    assert matcher.find_matches("Acme", candidates) == [
+        ("Acme Inc", 100.0), ("ACME", 100.0), ("Acme, LLC", 100.0)
+    ]
+
+
+def test_find_matches_sees_in_place_candidate_changes(matcher):
+    """Test that a candidate list edited between searches is searched as edited."""
+    names = ['Boeing Co', 'Apple']
+    matcher.find_matches('Walmart', names)
+    
+    names.append('Walmart Stores Inc')
+    assert [name for name, _ in matcher.find_matches('Walmart Stores', names)] == ['Walmart Stores Inc']
+    
+    names[0] = 'Google LLC'
+    assert matcher.find_matches('Google', names) == [('Google LLC', 100.0)]
+
+
+def test_find_matches_batch_matches_find_matches(matcher, monkeypatch):
+    """Test that batched search returns the same results as one search per name."""
+    monkeypatch.setattr(fuzzy_matcher, 'SCORE_BLOCK_CELLS', 2 * len(COMPANY_NAMES))
+    search_names = ["Acme", "Boeing", "Walmart", "Googel", "", "Amazon Services", "Zzz"]
+    
+    batch = matcher.find_matches_batch(search_names, COMPANY_NAMES, limit=5, threshold=60)
+    
+    assert batch == [matcher.find_matches(name, COMPANY_NAMES, limit=5, threshold=60) for name in search_names]
+
+
+def test_calculate_similarity_batch_matches_pairwise(matcher):
+    """Test that the similarity matrix equals pairwise calculate_similarity."""
+    queries = ["Acme", "Boeing Company", "", "Wal Mart"]
+    
+    scores = matcher.calculate_similarity_batch(queries, COMPANY_NAMES)
+    
+    expected = np.array([[matcher.calculate_similarity(q, c) for c in COMPANY_NAMES] for q in queries])
+    np.testing.assert_array_equal(scores, expected)
+
+
+def test_group_similar_companies_matches_pairwise_grouping(matcher, monkeypatch):
+    """Test that blocked grouping equals the greedy pair-by-pair loop."""
+    monkeypatch.setattr(fuzzy_matcher, 'SCORE_BLOCK_CELLS', 3 * len(COMPANY_NAMES))
+    
+    expected = []
+    used = set()
+    for i, name in enumerate(COMPANY_NAMES):
+        if i in used:
+            continue
+        used.add(i)
+        group = [name]
+        for j in range(i + 1, len(COMPANY_NAMES)):
+            if j not in used and matcher.calculate_similarity(name, COMPANY_NAMES[j]) >= 70:
+                group.append(COMPANY_NAMES[j])
+                used.add(j)
+        if len(group) > 1:
+            expected.append(group)
+    
+    groups = matcher.group_similar_companies(COMPANY_NAMES, threshold=70)
+    
+    assert groups == expected
+    assert len(groups) > 1
@@ -0,0 +1,53 @@
+"""
+Tests for summary table refreshes.
+"""
+
+import pytest
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import DatabaseManager, Violation
+from src.summary_tables import SummaryTableManager, ViolationSummaryByYear, ViolationSummaryByCompany
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary SQLite database with a few violations."""
+    temp_dir = Path(tempfile.mkdtemp())
+    db_manager = DatabaseManager(database_url=f"sqlite:///{temp_dir / 'test.db'}")
+    db_manager.create_tables()
+    db_manager.bulk_insert(Violation, [
+        {'agency': 'OSHA', 'company_name_normalized': 'ACME', 'standard': '1910', 'site_state': 'TX',
+         'year': 2022, 'current_penalty': 100.0, 'violation_date': date(2022, 5, 1)},
+        {'agency': 'OSHA', 'company_name_normalized': 'ACME', 'standard': '1926', 'site_state': 'TX',
+         'year': 2023, 'current_penalty': 300.0, 'violation_date': date(2023, 6, 1)},
+        {'agency': 'OSHA', 'company_name_normalized': 'BOEING', 'standard': '1910', 'site_state': 'WA',
+         'year': 2023, 'current_penalty': 50.0, 'violation_date': date(2023, 1, 9)},
+    ])
+    
+    yield db_manager
+    
+    db_manager.close()
+
+
+def test_refresh_summaries_replaces_rows(temp_db):
+    """Test that refreshing twice leaves one correct row per group."""
+    manager = SummaryTableManager(temp_db)
+    manager.refresh_all_summaries()
+    manager.refresh_all_summaries(agency='OSHA')
+    
+    session = temp_db.get_session()
+    try:
+        years = session.query(ViolationSummaryByYear).order_by(ViolationSummaryByYear.year).all()
+        acme = session.query(ViolationSummaryByCompany).filter_by(company_name_normalized='ACME').one()
+    finally:
+        session.close()
+    
+    assert [(s.year, s.violation_count, s.total_penalties) for s in years] == [(2022, 1, 100.0), (2023, 2, 350.0)]
+    assert (acme.violation_count, acme.first_violation_date, acme.years_active) == (2, date(2022, 5, 1), 2)
+    assert temp_db.get_table_row_count('violation_summary_by_state') == 3
+    assert temp_db.get_table_row_count('violation_summary_by_standard') == 3